@@ -0,0 +1,47 @@
+import re
+from functools import lru_cache
+
+from django.conf import settings
+
+from . import metrics
+
+
+class BotMatcher:
+    """All configured signatures folded into one case-insensitive alternation.
+
+    Each signature gets its own named group, so a single ``search`` both detects a bot
+    and tells which signature matched.
+    """
+
+    def __init__(self, signatures: tuple[str, ...]):
+        self.signatures = signatures
+        alternation = "|".join(f"(?P<s{index}>{re.escape(signature)})" for index, signature in enumerate(signatures))
+        self.pattern = re.compile(alternation, re.IGNORECASE) if signatures else None
+
+    def match(self, user_agent: str) -> str | None:
+        if self.pattern is None or not user_agent:
+            return None
+        found = self.pattern.search(user_agent)
+        if found is None:
+            return None
+        return self.signatures[int(found.lastgroup[1:])]
+
+
+@lru_cache(maxsize=4)
+def get_matcher(signatures: tuple[str, ...]) -> BotMatcher:
+    return BotMatcher(signatures)
+
+
+def match_bot(user_agent: str) -> str | None:
+    config = settings.BOT_FILTER
+    if not config["enabled"]:
+        return None
+    return get_matcher(tuple(config["signatures"])).match(user_agent)
+
+
+def filter_bot_request(user_agent: str) -> bool:
+    signature = match_bot(user_agent)
+    if signature is None:
+        return False
+    metrics.incr(f"bots.{signature.lower()}")
+    return True
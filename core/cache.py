@@ -0,0 +1,203 @@
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+# Kinds of stored values: integers stay native so ``incr`` can run as one UPDATE.
+PICKLED, INTEGER = 0, 1
+
+
+class SQLiteCache(BaseCache):
+    """Cache shared by every process on one host through a SQLite file in WAL mode.
+
+    Entries are evicted least-recently-used first once the table holds more than
+    ``MAX_ENTRIES`` rows or ``MAX_BYTES`` of values; ``CULL_FREQUENCY`` sets the share
+    removed per cull as in Django's other backends. Reads refresh the LRU position at most
+    every ``ACCESS_RESOLUTION`` seconds so most hits stay read-only.
+    """
+
+    def __init__(self, location: str, params: dict):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self.path = Path(location)
+        self._max_bytes = int(options.get("MAX_BYTES", 64 * 1024 * 1024))
+        self._access_resolution = float(options.get("ACCESS_RESOLUTION", 30))
+        self._cull_every = int(options.get("CULL_EVERY", 100))
+        self._busy_timeout_ms = int(options.get("BUSY_TIMEOUT_MS", 5000))
+        self._local = threading.local()
+        self._writes = 0
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread and process; a forked worker must not reuse its parent's.
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=self._busy_timeout_ms / 1000, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, kind INTEGER NOT NULL, "
+                "expires REAL, accessed REAL NOT NULL, size INTEGER NOT NULL) WITHOUT ROWID"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS cache_entries_accessed ON cache_entries (accessed)")
+            self._local.connection, self._local.pid = connection, os.getpid()
+        return connection
+
+    def _encode(self, value) -> tuple[object, int, int]:
+        if type(value) is int:
+            return value, INTEGER, 8
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        return data, PICKLED, len(data)
+
+    def _decode(self, value, kind: int):
+        return value if kind == INTEGER else pickle.loads(value)
+
+    def _row(self, key: str, value, timeout, now: float) -> tuple:
+        data, kind, size = self._encode(value)
+        return key, data, kind, self.get_backend_timeout(timeout), now, size
+
+    def _wrote(self, count: int = 1) -> None:
+        self._writes += count
+        if self._writes >= self._cull_every:
+            self._writes = 0
+            self._cull()
+
+    def _cull(self) -> None:
+        connection = self._connection
+        now = time.time()
+        connection.execute("DELETE FROM cache_entries WHERE expires IS NOT NULL AND expires <= ?", (now,))
+        rows, size = connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries").fetchone()
+        if rows <= self._max_entries and size <= self._max_bytes:
+            return
+        keep = 1 - 1 / self._cull_frequency if self._cull_frequency else 0
+        connection.execute(
+            """
+            DELETE FROM cache_entries WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, ROW_NUMBER() OVER recent AS position, SUM(size) OVER recent AS kept
+                    FROM cache_entries
+                    WINDOW recent AS (ORDER BY accessed DESC ROWS UNBOUNDED PRECEDING)
+                )
+                WHERE position > ? OR kept > ?
+            )
+            """,
+            (int(min(rows, self._max_entries) * keep), int(min(size, self._max_bytes) * keep)),
+        )
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None) -> bool:
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        cursor = self._connection.execute(
+            """
+            INSERT INTO cache_entries (key, value, kind, expires, accessed, size) VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (key) DO UPDATE SET
+                value = excluded.value, kind = excluded.kind, expires = excluded.expires,
+                accessed = excluded.accessed, size = excluded.size
+            WHERE cache_entries.expires IS NOT NULL AND cache_entries.expires <= ?
+            """,
+            (*self._row(key, value, timeout, now), now),
+        )
+        self._wrote()
+        return cursor.rowcount == 1
+
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        row = self._connection.execute(
+            "SELECT value, kind, accessed FROM cache_entries WHERE key = ? AND (expires IS NULL OR expires > ?)",
+            (key, now),
+        ).fetchone()
+        if row is None:
+            return default
+        if row[2] < now - self._access_resolution:
+            self._connection.execute("UPDATE cache_entries SET accessed = ? WHERE key = ?", (now, key))
+        return self._decode(row[0], row[1])
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None) -> None:
+        key = self.make_and_validate_key(key, version=version)
+        self._set_rows([self._row(key, value, timeout, time.time())])
+
+    def _set_rows(self, rows: list[tuple]) -> None:
+        connection = self._connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany("INSERT OR REPLACE INTO cache_entries VALUES (?, ?, ?, ?, ?, ?)", rows)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self._wrote(len(rows))
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None) -> bool:
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        cursor = self._connection.execute(
+            "UPDATE cache_entries SET expires = ?, accessed = ? WHERE key = ? AND (expires IS NULL OR expires > ?)",
+            (self.get_backend_timeout(timeout), now, key, now),
+        )
+        return cursor.rowcount == 1
+
+    def delete(self, key, version=None) -> bool:
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        cursor = self._connection.execute(
+            "DELETE FROM cache_entries WHERE key = ? RETURNING expires IS NULL OR expires > ?", (key, now)
+        )
+        rows = cursor.fetchall()
+        return bool(rows and rows[0][0])
+
+    def has_key(self, key, version=None) -> bool:
+        key = self.make_and_validate_key(key, version=version)
+        return (
+            self._connection.execute(
+                "SELECT 1 FROM cache_entries WHERE key = ? AND (expires IS NULL OR expires > ?)", (key, time.time())
+            ).fetchone()
+            is not None
+        )
+
+    def incr(self, key, delta=1, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        rows = self._connection.execute(
+            """
+            UPDATE cache_entries SET value = value + ?, accessed = ?
+            WHERE key = ? AND kind = ? AND (expires IS NULL OR expires > ?)
+            RETURNING value
+            """,
+            (delta, now, key, INTEGER, now),
+        ).fetchall()
+        if not rows:
+            raise ValueError(f"Key '{key}' not found")
+        return rows[0][0]
+
+    def get_many(self, keys, version=None) -> dict:
+        keys = {self.make_and_validate_key(key, version=version): key for key in keys}
+        if not keys:
+            return {}
+        rows = self._connection.execute(
+            f"SELECT key, value, kind FROM cache_entries WHERE key IN ({', '.join('?' * len(keys))}) "
+            "AND (expires IS NULL OR expires > ?)",
+            (*keys, time.time()),
+        ).fetchall()
+        return {keys[key]: self._decode(value, kind) for key, value, kind in rows}
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None) -> list:
+        now = time.time()
+        rows = [self._row(self.make_and_validate_key(key, version=version), value, timeout, now) for key, value in data.items()]
+        if rows:
+            self._set_rows(rows)
+        return []
+
+    def delete_many(self, keys, version=None) -> None:
+        keys = [self.make_and_validate_key(key, version=version) for key in keys]
+        if keys:
+            self._connection.execute(f"DELETE FROM cache_entries WHERE key IN ({', '.join('?' * len(keys))})", keys)
+
+    def clear(self) -> None:
+        self._connection.execute("DELETE FROM cache_entries")
@@ -0,0 +1,47 @@
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Model, QuerySet
+
+
+def _version_key(model: type[Model]) -> str:
+    return f"content-version:{model._meta.label_lower}"
+
+
+def content_versions(*models: type[Model]) -> dict[str, int]:
+    """Current content version of each model, keyed by model name, in one cache round trip.
+
+    A missing version (first use or evicted) starts from the current time in nanoseconds,
+    so it can never collide with a version an older cached entry was stored under.
+    """
+    keys = {model._meta.model_name: _version_key(model) for model in models}
+    found = cache.get_many(keys.values())
+    versions = {}
+    for name, key in keys.items():
+        version = found.get(key)
+        if version is None:
+            version = time.time_ns()
+            if not cache.add(key, version, timeout=None):
+                version = cache.get(key, version)
+        versions[name] = version
+    return versions
+
+
+def bump_content_version(model: type[Model]) -> None:
+    key = _version_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def cached_rows(name: str, version: int, queryset: QuerySet) -> list[Any]:
+    """Rows of ``queryset`` cached under ``name`` until the content version changes."""
+    key = f"content:{name}:{version}"
+    rows = cache.get(key)
+    if rows is None:
+        rows = list(queryset)
+        cache.set(key, rows, timeout=settings.CONTENT_CACHE["timeout"])
+    return rows
@@ -0,0 +1,68 @@
+import hashlib
+from collections.abc import Callable
+from datetime import datetime, timezone as dt_timezone
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from django.db.models import Count, Max
+from django.http import HttpRequest
+from django.views.decorators.http import condition
+
+from .models import BlogPost, Service
+
+
+@lru_cache(maxsize=1)
+def release_time() -> datetime:
+    """Newest modification time of the templates and the static files manifest.
+
+    Folded into every validator so a deploy that changes markup or asset hashes is never
+    answered with 304 for a page rendered by the previous release.
+    """
+    paths = [path for directory in settings.TEMPLATES[0]["DIRS"] for path in Path(directory).rglob("*.html")]
+    paths.append(Path(settings.STATIC_ROOT) / "staticfiles.json")
+    stamps = [path.stat().st_mtime for path in paths if path.exists()]
+    return datetime.fromtimestamp(int(max(stamps, default=0)), tz=dt_timezone.utc)
+
+
+def content_condition(aggregate: Callable[..., dict]):
+    """``condition`` decorator whose ETag comes from one aggregate query.
+
+    ``aggregate(request, *args, **kwargs)`` returns ``updated`` (newest ``updated_at`` or
+    ``None``) plus any other counts that change when rows are added or removed. There is no
+    Last-Modified validator: it only has one-second resolution, so a second edit within the
+    same second would still be answered with 304.
+    """
+
+    def etag(request: HttpRequest, *args, **kwargs) -> str:
+        if not hasattr(request, "_content_etag"):
+            values = aggregate(request, *args, **kwargs)
+            updated = max(filter(None, [values.pop("updated"), release_time()]))
+            parts = [updated.isoformat(), *(f"{key}={value}" for key, value in sorted(values.items()))]
+            digest = hashlib.blake2b("|".join(parts).encode(), digest_size=12).hexdigest()
+            request._content_etag = f'"{digest}"'
+        return request._content_etag
+
+    return condition(etag_func=etag)
+
+
+def published_posts(request: HttpRequest, *args, **kwargs) -> dict:
+    # Post pages also render the names of their categories and tags.
+    values = BlogPost.objects.filter(is_published=True).aggregate(
+        updated=Max("updated_at"),
+        categories_updated=Max("categories__updated_at"),
+        tags_updated=Max("tags__updated_at"),
+        posts=Count("id", distinct=True),
+    )
+    values["updated"] = max(filter(None, [values["updated"], values.pop("categories_updated"), values.pop("tags_updated")]), default=None)
+    return values
+
+
+def service_page(request: HttpRequest, slug: str, **kwargs) -> dict:
+    values = Service.objects.filter(slug=slug).aggregate(
+        updated=Max("updated_at"),
+        media_updated=Max("gallery_items__updated_at"),
+        media=Count("gallery_items"),
+    )
+    values["updated"] = max(filter(None, [values["updated"], values.pop("media_updated")]), default=None)
+    return values
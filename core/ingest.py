@@ -0,0 +1,153 @@
+import json
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpRequest
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from .models import Event
+from .spool import EventSpool
+from .user_agents import aintern_user_agents, intern_user_agents
+
+
+class StringField:
+    __slots__ = ("name", "max_length", "min_length", "required")
+
+    def __init__(self, name: str, min_length: int = 0, required: bool = False):
+        self.name = name
+        self.max_length = Event._meta.get_field(name).max_length
+        self.min_length = min_length
+        self.required = required
+
+    def clean(self, value: Any) -> str:
+        if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+            raise ValueError("Not a valid string.")
+        value = str(value).strip()
+        if len(value) < self.min_length:
+            raise ValueError(f"{self.name} must contain at least {self.min_length} characters.")
+        if self.max_length is not None and len(value) > self.max_length:
+            raise ValueError(f"Ensure this field has no more than {self.max_length} characters.")
+        return value
+
+
+class JSONObjectField:
+    __slots__ = ("name", "required")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.required = False
+
+    def clean(self, value: Any) -> dict[str, Any]:
+        if not isinstance(value, dict):
+            raise ValueError("Expected a JSON object.")
+        max_bytes = settings.EVENT_INGEST["max_additional_data_bytes"]
+        if len(json.dumps(value, separators=(",", ":"))) > max_bytes:
+            raise ValueError(f"Ensure this object is no larger than {max_bytes} bytes.")
+        return value
+
+
+class EventValidator:
+    """Lean replacement for ``EventSerializer`` on the ingest path.
+
+    Field rules are resolved once from the ``Event`` model, so validating a payload is a
+    single pass over a handful of slotted field objects.
+    """
+
+    def __init__(self):
+        self.fields = (
+            StringField("event_type", min_length=2, required=True),
+            StringField("element"),
+            StringField("page"),
+            StringField("user_agent"),
+            StringField("session_id"),
+            JSONObjectField("additional_data"),
+        )
+
+    def clean(self, data: Any) -> tuple[dict[str, Any], dict[str, list[str]]]:
+        if not isinstance(data, dict):
+            return {}, {"non_field_errors": ["Expected a JSON object."]}
+        cleaned: dict[str, Any] = {}
+        errors: dict[str, list[str]] = {}
+        for field in self.fields:
+            if field.name not in data:
+                if field.required:
+                    errors[field.name] = ["This field is required."]
+                continue
+            try:
+                cleaned[field.name] = field.clean(data[field.name])
+            except ValueError as exc:
+                errors[field.name] = [str(exc)]
+        return cleaned, errors
+
+    def validate(self, data: Any) -> dict[str, Any]:
+        cleaned, errors = self.clean(data)
+        if errors:
+            raise ValidationError(errors)
+        return cleaned
+
+    def validate_many(self, items: list[Any]) -> list[dict[str, Any]]:
+        results = [self.clean(item) for item in items]
+        if any(errors for _, errors in results):
+            raise ValidationError([errors for _, errors in results])
+        return [cleaned for cleaned, _ in results]
+
+
+event_validator = EventValidator()
+
+
+def validate_event(data: Any, user_agent: str) -> dict[str, Any]:
+    if isinstance(data, dict):
+        data = {"user_agent": user_agent, **data}
+    return event_validator.validate(data)
+
+
+def validate_event_batch(data: Any, user_agent: str) -> list[dict[str, Any]]:
+    events = data.get("events") if isinstance(data, dict) else data
+    if not isinstance(events, list) or not events:
+        raise ValidationError({"events": ["Expected a non-empty list of events."]})
+    max_events = settings.EVENT_INGEST["batch_max_events"]
+    if len(events) > max_events:
+        raise ValidationError({"events": [f"A batch may contain at most {max_events} events."]})
+    return event_validator.validate_many([{"user_agent": user_agent, **item} if isinstance(item, dict) else item for item in events])
+
+
+def request_body_too_large(request: HttpRequest) -> bool:
+    try:
+        content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+    except ValueError:
+        return False
+    return content_length > settings.EVENT_INGEST["max_body_bytes"]
+
+
+def build_events(items: list[dict[str, Any]], user_agent_ids: dict[str, int]) -> list[Event]:
+    now = timezone.now()
+    events = []
+    for item in items:
+        fields = {"timestamp": now, **item}
+        fields["user_agent_id"] = user_agent_ids.get(fields.pop("user_agent", ""))
+        events.append(Event(**fields))
+    return events
+
+
+def spool_events(items: list[dict[str, Any]]) -> None:
+    now = timezone.now().isoformat()
+    EventSpool.from_settings().append([{**item, "timestamp": now} for item in items])
+
+
+def record_events(items: list[dict[str, Any]]) -> None:
+    if settings.EVENT_SPOOL["enabled"]:
+        spool_events(items)
+        return
+    user_agent_ids = intern_user_agents({item.get("user_agent", "") for item in items})
+    Event.objects.bulk_create(build_events(items, user_agent_ids))
+
+
+async def arecord_events(items: list[dict[str, Any]]) -> None:
+    if settings.EVENT_SPOOL["enabled"]:
+        # Each append is a single O_APPEND write, so it is safe off the event loop's thread.
+        await sync_to_async(spool_events, thread_sensitive=False)(items)
+        return
+    user_agent_ids = await aintern_user_agents({item.get("user_agent", "") for item in items})
+    await Event.objects.abulk_create(build_events(items, user_agent_ids))
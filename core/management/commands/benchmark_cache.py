@@ -0,0 +1,97 @@
+import multiprocessing
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from django.core.cache.backends.base import BaseCache
+from django.core.cache.backends.db import DatabaseCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management import BaseCommand
+from django.core.management.commands.createcachetable import Command as CreateCacheTableCommand
+from django.db import connection, connections
+
+from core.cache import SQLiteCache
+
+BENCHMARK_TABLE = "core_benchmark_cache"
+# Roughly the size of a cached homepage fragment.
+SAMPLE_VALUE = {"html": "<article class='glass-card'>" + "x" * 2000 + "</article>", "version": 3}
+
+
+def _operations(cache: BaseCache, worker: int, count: int) -> dict[str, Callable[[int], object]]:
+    keys = [f"bench:{worker}:{index % 500}" for index in range(count)]
+    return {
+        "set": lambda index: cache.set(keys[index], SAMPLE_VALUE),
+        "get": lambda index: cache.get(keys[index]),
+        "get_many(10)": lambda index: cache.get_many(keys[index : index + 10]),
+        "incr": lambda index: cache.incr("bench:counter"),
+    }
+
+
+def _run(cache: BaseCache, worker: int, count: int) -> dict[str, float]:
+    elapsed = {}
+    for name, operation in _operations(cache, worker, count).items():
+        start = time.perf_counter()
+        for index in range(count):
+            operation(index)
+        elapsed[name] = time.perf_counter() - start
+    return elapsed
+
+
+def _worker(factory: Callable[[], BaseCache], worker: int, count: int, results) -> None:
+    results.put(_run(factory(), worker, count))
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures cache throughput (operations per second) of LocMemCache, DatabaseCache and the shared "
+        "SQLiteCache. With --processes, each backend is hit by that many forked processes at once; LocMem "
+        "is then not shared between them and only shows the in-process ceiling."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--operations", type=int, default=5000, help="Operations of each kind per process.")
+        parser.add_argument("--processes", type=int, default=1)
+
+    def _measure(self, factory: Callable[[], BaseCache], count: int, processes: int) -> dict[str, float]:
+        factory().set("bench:counter", 0)
+        if processes == 1:
+            elapsed = _run(factory(), 0, count)
+            return {name: count / seconds for name, seconds in elapsed.items()}
+
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        workers = [context.Process(target=_worker, args=(factory, worker, count, results)) for worker in range(processes)]
+        for worker in workers:
+            worker.start()
+        timings = [results.get() for _ in workers]
+        for worker in workers:
+            worker.join()
+        # Processes run side by side, so throughput is total work over the slowest process.
+        return {name: count * processes / max(timing[name] for timing in timings) for name in timings[0]}
+
+    def handle(self, *args, **options):
+        count, processes = options["operations"], options["processes"]
+        table_creator = CreateCacheTableCommand()
+        table_creator.verbosity = 0
+        table_creator.create_table("default", BENCHMARK_TABLE, dry_run=False)
+        with tempfile.TemporaryDirectory() as directory:
+            backends = {
+                "LocMemCache": lambda: LocMemCache("benchmark", {"OPTIONS": {"MAX_ENTRIES": 100_000}}),
+                "DatabaseCache": lambda: DatabaseCache(BENCHMARK_TABLE, {"OPTIONS": {"MAX_ENTRIES": 100_000}}),
+                "SQLiteCache": lambda: SQLiteCache(str(Path(directory) / "cache.sqlite3"), {"OPTIONS": {"MAX_ENTRIES": 100_000}}),
+            }
+            try:
+                results = {name: self._measure(factory, count, processes) for name, factory in backends.items()}
+            finally:
+                with connection.cursor() as cursor:
+                    cursor.execute(f"DROP TABLE {connection.ops.quote_name(BENCHMARK_TABLE)}")
+
+        operations = list(next(iter(results.values())))
+        self.stdout.write(f"{'ops/s':<14}" + "".join(f"{name:>16}" for name in operations))
+        for name, throughput in results.items():
+            self.stdout.write(f"{name:<14}" + "".join(f"{throughput[operation]:>16,.0f}" for operation in operations))
+        self.stdout.write(
+            self.style.SUCCESS(f"{count} operations of each kind per process, {processes} process(es), {connection.vendor} database.")
+        )
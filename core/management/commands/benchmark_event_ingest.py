@@ -0,0 +1,56 @@
+import time
+from collections.abc import Callable
+
+from django.core.management import BaseCommand
+
+from core.ingest import build_events, event_validator
+from core.serializers import EventSerializer
+from core.user_agents import intern_user_agents
+
+SAMPLE_EVENT = {
+    "event_type": "cta_click",
+    "element": "hero_contact",
+    "page": "/services/ppf/",
+    "user_agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 17_4 like Mac OS X) AppleWebKit/605.1.15 Mobile/15E148",
+    "session_id": "1708351123-abcd1234",
+    "additional_data": {"depth": 72, "source": "hero"},
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures per-event CPU cost of EventSerializer versus the fast-path EventValidator. "
+        "No events are written; the sample user agent is interned once and then served from the LRU cache."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20000)
+        parser.add_argument("--repeat", type=int, default=3, help="Best-of-N runs per path.")
+
+    def _serializer_path(self) -> None:
+        serializer = EventSerializer(data=dict(SAMPLE_EVENT))
+        serializer.is_valid(raise_exception=True)
+        items = [serializer.validated_data]
+        build_events(items, intern_user_agents({item.get("user_agent", "") for item in items}))
+
+    def _validator_path(self) -> None:
+        items = [event_validator.validate(SAMPLE_EVENT)]
+        build_events(items, intern_user_agents({item.get("user_agent", "") for item in items}))
+
+    def _measure(self, func: Callable[[], None], iterations: int, repeat: int) -> float:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.process_time()
+            for _ in range(iterations):
+                func()
+            best = min(best, time.process_time() - start)
+        return best / iterations * 1_000_000
+
+    def handle(self, *args, **options):
+        iterations, repeat = options["iterations"], options["repeat"]
+        serializer_us = self._measure(self._serializer_path, iterations, repeat)
+        validator_us = self._measure(self._validator_path, iterations, repeat)
+
+        self.stdout.write(f"EventSerializer + build_events(): {serializer_us:8.2f} us/event")
+        self.stdout.write(f"EventValidator + build_events():  {validator_us:8.2f} us/event")
+        self.stdout.write(self.style.SUCCESS(f"Fast path is {serializer_us / validator_us:.1f}x cheaper per event."))
@@ -0,0 +1,100 @@
+import operator
+import time
+from datetime import date, datetime, timedelta
+from functools import reduce
+
+from django.conf import settings
+from django.core.management import BaseCommand
+from django.db import connection, models, transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Cast, Coalesce, Length, TruncDate
+from django.utils import timezone
+
+from core.models import Event, EventDailySummary
+
+
+class Command(BaseCommand):
+    help = (
+        "Folds raw events older than the retention window into EventDailySummary rows and deletes them in "
+        "bounded batches. On a partitioned core_event, prefer manage_event_partitions for whole months."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=settings.EVENT_RETENTION["raw_days"], help="Keep this many days of raw events.")
+        parser.add_argument("--batch-size", type=int, default=settings.EVENT_RETENTION["delete_batch_size"])
+        parser.add_argument("--sleep", type=float, default=0.0, help="Seconds to pause between delete batches.")
+        parser.add_argument("--dry-run", action="store_true", help="Only report how many rows and bytes would be reclaimed.")
+
+    def _day_bounds(self, day: date) -> tuple[datetime, datetime]:
+        start = timezone.make_aware(datetime.combine(day, datetime.min.time()))
+        return start, timezone.make_aware(datetime.combine(day + timedelta(days=1), datetime.min.time()))
+
+    def _reclaimable_bytes(self, cutoff: datetime) -> int:
+        if connection.vendor == "postgresql":
+            table = connection.ops.quote_name(Event._meta.db_table)
+            column = connection.ops.quote_name(Event._meta.get_field("timestamp").column)
+            with connection.cursor() as cursor:
+                cursor.execute(f"SELECT COALESCE(SUM(pg_column_size(e.*)), 0) FROM {table} e WHERE e.{column} < %s", [cutoff])
+                return int(cursor.fetchone()[0])
+
+        # Elsewhere, estimate from the text payload of each row.
+        sizes = []
+        for field in Event._meta.local_fields:
+            if isinstance(field, (models.CharField, models.TextField)):
+                sizes.append(Coalesce(Length(field.name), 0))
+            elif isinstance(field, models.JSONField):
+                sizes.append(Coalesce(Length(Cast(field.name, models.TextField())), 0))
+        total = Event.objects.filter(timestamp__lt=cutoff).aggregate(total=Sum(reduce(operator.add, sizes)))["total"]
+        return int(total or 0)
+
+    def _summarize_day(self, day: date) -> None:
+        if EventDailySummary.objects.filter(day=day).exists():
+            return
+        start, end = self._day_bounds(day)
+        rows = (
+            Event.objects.filter(timestamp__gte=start, timestamp__lt=end)
+            .values("event_type", "page")
+            .annotate(events=Count("id"), sessions=Count("session_id", distinct=True, filter=~Q(session_id="")))
+            .order_by()
+        )
+        EventDailySummary.objects.bulk_create([EventDailySummary(day=day, **row) for row in rows])
+
+    def _delete_day(self, day: date, batch_size: int, pause: float) -> int:
+        start, end = self._day_bounds(day)
+        window = Event.objects.filter(timestamp__gte=start, timestamp__lt=end)
+        deleted = 0
+        while True:
+            ids = list(window.order_by().values_list("id", flat=True)[:batch_size])
+            if not ids:
+                return deleted
+            deleted += window.filter(id__in=ids).delete()[0]
+            if pause:
+                time.sleep(pause)
+
+    def handle(self, *args, **options):
+        if options["days"] <= 0:
+            self.stdout.write(self.style.WARNING("Raw event retention is disabled (EVENT_RETENTION_DAYS=0)."))
+            return
+
+        cutoff_day = timezone.localdate() - timedelta(days=options["days"])
+        cutoff, _ = self._day_bounds(cutoff_day)
+        expired = Event.objects.filter(timestamp__lt=cutoff)
+
+        if options["dry_run"]:
+            rows = expired.count()
+            reclaimable = self._reclaimable_bytes(cutoff) if rows else 0
+            self.stdout.write(
+                f"Would compact and delete {rows} event(s) older than {cutoff_day} (~{reclaimable / 1024 / 1024:.2f} MiB of row data)."
+            )
+            return
+
+        days = list(
+            expired.annotate(day=TruncDate("timestamp")).values_list("day", flat=True).distinct().order_by("day")
+        )
+        deleted = 0
+        for day in days:
+            with transaction.atomic():
+                self._summarize_day(day)
+            deleted += self._delete_day(day, options["batch_size"], options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS(f"Compacted {len(days)} day(s); deleted {deleted} raw event(s) older than {cutoff_day}."))
@@ -0,0 +1,152 @@
+import hashlib
+import json
+import os
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.management import BaseCommand
+from django.db.models import Count, Max
+from django.test import Client
+from django.urls import URLPattern, reverse
+from django.utils import timezone
+
+from core import urls as core_urls
+from core.conditional import release_time
+from core.models import BlogCategory, BlogPost, BlogTag, GalleryItem, Service, Testimonial
+
+# Routes that must stay dynamic: the contact form carries a CSRF token and the API is not HTML.
+DYNAMIC_ROUTES = {"contact"}
+# Rows each static page is rendered from; pages not listed depend on all of them.
+PAGE_SOURCES = {
+    "home": ("service", "testimonial", "blogpost", "galleryitem"),
+    "service_list": ("service",),
+    "gallery": ("service", "galleryitem"),
+    "about": (),
+    "blog_list": ("blogpost", "blogcategory", "blogtag"),
+    "testimonials": ("testimonial",),
+    "privacy": (),
+    "robots_txt": (),
+}
+MANIFEST_NAME = ".export-manifest.json"
+
+
+class Command(BaseCommand):
+    help = (
+        "Renders the public pages of core/urls.py and every service and published blog post to HTML files "
+        "that nginx serves directly. Only pages whose source rows changed since the last export are rendered again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--directory", default=str(settings.STATIC_EXPORT["directory"]))
+        parser.add_argument("--force", action="store_true", help="Render every page even if its sources are unchanged.")
+
+    def _model_stamps(self) -> dict[str, list]:
+        querysets = {
+            "service": Service.objects.all(),
+            "testimonial": Testimonial.objects.all(),
+            "blogpost": BlogPost.objects.filter(is_published=True),
+            "galleryitem": GalleryItem.objects.all(),
+            "blogcategory": BlogCategory.objects.all(),
+            "blogtag": BlogTag.objects.all(),
+        }
+        stamps = {}
+        for name, queryset in querysets.items():
+            values = queryset.aggregate(updated=Max("updated_at"), rows=Count("id"))
+            stamps[name] = [values["updated"].isoformat() if values["updated"] else None, values["rows"]]
+        return stamps
+
+    def _pages(self) -> dict[str, list]:
+        """Path of every exported page mapped to the source values it was rendered from."""
+        stamps = self._model_stamps()
+        pages = {}
+        for pattern in core_urls.urlpatterns:
+            if not isinstance(pattern, URLPattern) or pattern.name in DYNAMIC_ROUTES or pattern.name.startswith("api_"):
+                continue
+            if pattern.pattern.converters:
+                continue
+            sources = PAGE_SOURCES.get(pattern.name, tuple(stamps))
+            pages[reverse(f"core:{pattern.name}")] = [stamps[name] for name in sources]
+
+        media = {
+            row["related_service"]: [row["updated"].isoformat(), row["rows"]]
+            for row in GalleryItem.objects.filter(related_service__isnull=False)
+            .values("related_service")
+            .annotate(updated=Max("updated_at"), rows=Count("id"))
+            .order_by()
+        }
+        for service_id, slug, updated in Service.objects.values_list("id", "slug", "updated_at"):
+            pages[reverse("core:service_detail", kwargs={"slug": slug})] = [updated.isoformat(), media.get(service_id)]
+
+        # A post page also shows its categories and tags, whose membership does not touch the
+        # post's updated_at, and lists the three newest other posts.
+        taxonomy = defaultdict(list)
+        for model in (BlogCategory, BlogTag):
+            rows = model.objects.filter(posts__is_published=True).values_list("posts", "id", "updated_at").order_by("posts", "id")
+            for post_id, row_id, updated in rows:
+                taxonomy[post_id].append([model._meta.model_name, row_id, updated.isoformat()])
+        posts = list(BlogPost.objects.filter(is_published=True).values_list("id", "slug", "updated_at"))
+        for post_id, slug, updated in posts:
+            related = [[other_id, other_updated.isoformat()] for other_id, _, other_updated in posts if other_id != post_id][:3]
+            pages[reverse("core:blog_detail", kwargs={"slug": slug})] = [updated.isoformat(), related, taxonomy[post_id]]
+        return pages
+
+    def _target(self, directory: Path, path: str) -> Path:
+        relative = path.lstrip("/")
+        return directory / relative / "index.html" if not relative or relative.endswith("/") else directory / relative
+
+    def _write(self, target: Path, content: bytes) -> None:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(content)
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, target)
+
+    def handle(self, *args, **options):
+        directory = Path(options["directory"])
+        manifest_path = directory / MANIFEST_NAME
+        try:
+            previous = json.loads(manifest_path.read_text())
+        except (OSError, ValueError):
+            previous = {}
+
+        # Templates, static asset hashes and the footer year affect every page.
+        site = [release_time().isoformat(), timezone.localdate().year]
+        site_url = urlsplit(settings.SITE_URL)
+        client = Client(HTTP_HOST=site_url.netloc, secure=site_url.scheme == "https")
+
+        exported = {}
+        rendered = 0
+        failed = set()
+        for path, sources in self._pages().items():
+            stamp = hashlib.blake2b(json.dumps([site, sources]).encode(), digest_size=12).hexdigest()
+            target = self._target(directory, path)
+            if not options["force"] and previous.get(path) == stamp and target.exists():
+                exported[path] = stamp
+                continue
+            response = client.get(path)
+            if response.status_code != 200:
+                self.stderr.write(self.style.WARNING(f"Skipped {path}: HTTP {response.status_code}"))
+                target.unlink(missing_ok=True)
+                failed.add(path)
+                continue
+            self._write(target, response.content)
+            exported[path] = stamp
+            rendered += 1
+
+        # Unpublished or deleted rows must fall back to Django rather than a stale file.
+        removed = 0
+        for path in previous.keys() - exported.keys() - failed:
+            self._target(directory, path).unlink(missing_ok=True)
+            removed += 1
+
+        self._write(manifest_path, json.dumps(exported, indent=2, sort_keys=True).encode())
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Exported {len(exported)} page(s) to {directory}: {rendered} rendered, "
+                f"{len(exported) - rendered} unchanged, {removed} removed, {len(failed)} failed."
+            )
+        )
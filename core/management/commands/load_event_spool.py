@@ -0,0 +1,114 @@
+import csv
+import io
+import json
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+from django.core.management import BaseCommand
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from core.models import Event, EventSpoolSegment
+from core.ingest import build_events
+from core.spool import EventSpool, read_records
+from core.user_agents import intern_user_agents
+
+COPY_COLUMNS = ("timestamp", "event_type", "element", "page", "user_agent", "session_id", "additional_data")
+NULLABLE_COPY_COLUMNS = ("user_agent",)
+
+
+class Command(BaseCommand):
+    help = "Loads sealed event spool segments into core_event (COPY on PostgreSQL, bulk_create elsewhere)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000, help="Events per transaction.")
+        parser.add_argument("--keep-files", action="store_true", help="Do not delete segments once fully loaded.")
+        parser.add_argument("--prune-days", type=int, default=7, help="Forget completed segment records older than this.")
+
+    def _normalize(self, record: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "event_type": record.get("event_type", ""),
+            "element": record.get("element", ""),
+            "timestamp": parse_datetime(record["timestamp"]) if record.get("timestamp") else timezone.now(),
+            "page": record.get("page", ""),
+            "user_agent": record.get("user_agent", ""),
+            "session_id": record.get("session_id", ""),
+            "additional_data": record.get("additional_data") or {},
+        }
+
+    def _copy_events(self, rows: list[dict[str, Any]], user_agent_ids: dict[str, int]) -> None:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+        for row in rows:
+            writer.writerow(
+                [
+                    row["timestamp"].isoformat(),
+                    row["event_type"],
+                    row["element"],
+                    row["page"],
+                    user_agent_ids.get(row["user_agent"], ""),
+                    row["session_id"],
+                    json.dumps(row["additional_data"]),
+                ]
+            )
+        buffer.seek(0)
+        quote = connection.ops.quote_name
+        table = quote(Event._meta.db_table)
+        columns = ", ".join(quote(Event._meta.get_field(name).column) for name in COPY_COLUMNS)
+        nullable = ", ".join(quote(Event._meta.get_field(name).column) for name in NULLABLE_COPY_COLUMNS)
+        with connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv, FORCE_NULL ({nullable}))", buffer)
+
+    def _insert(self, records: list[dict[str, Any]]) -> None:
+        rows = [self._normalize(record) for record in records]
+        if not rows:
+            return
+        user_agent_ids = intern_user_agents({row["user_agent"] for row in rows})
+        if connection.vendor == "postgresql":
+            self._copy_events(rows, user_agent_ids)
+        else:
+            Event.objects.bulk_create(build_events(rows, user_agent_ids))
+
+    def _load_segment(self, path: Path, batch_size: int) -> int | None:
+        segment, _ = EventSpoolSegment.objects.get_or_create(name=path.name)
+        if segment.completed_at:
+            return 0
+
+        loaded = 0
+        offset = segment.offset
+        for records, next_offset in read_records(path, offset, batch_size):
+            with transaction.atomic():
+                locked = EventSpoolSegment.objects.select_for_update().get(pk=segment.pk)
+                if locked.offset != offset:
+                    self.stdout.write(self.style.WARNING(f"{path.name}: offset moved underneath us, skipping."))
+                    return None
+                self._insert(records)
+                EventSpoolSegment.objects.filter(pk=segment.pk).update(
+                    offset=next_offset,
+                    loaded_events=F("loaded_events") + len(records),
+                )
+            offset = next_offset
+            loaded += len(records)
+
+        EventSpoolSegment.objects.filter(pk=segment.pk, offset=offset).update(completed_at=timezone.now())
+        return loaded
+
+    def handle(self, *args, **options):
+        spool = EventSpool.from_settings()
+        segments = spool.sealed_segments()
+        total = 0
+        for path in segments:
+            loaded = self._load_segment(path, options["batch_size"])
+            if loaded is None:
+                continue
+            total += loaded
+            if not options["keep_files"]:
+                path.unlink(missing_ok=True)
+
+        cutoff = timezone.now() - timedelta(days=options["prune_days"])
+        stale = EventSpoolSegment.objects.filter(completed_at__lt=cutoff).values_list("name", flat=True)
+        EventSpoolSegment.objects.filter(name__in=[name for name in stale if not (spool.directory / name).exists()]).delete()
+        self.stdout.write(self.style.SUCCESS(f"Loaded {total} event(s) from {len(segments)} sealed segment(s)."))
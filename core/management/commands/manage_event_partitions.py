@@ -0,0 +1,81 @@
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Min
+from django.utils import timezone
+
+from core.models import Event
+from core.partitions import (
+    EVENT_TABLE,
+    add_months,
+    convert_to_partitioned_sql,
+    create_partition_sql,
+    existing_partitions,
+    is_partitioned,
+    month_range,
+    month_start,
+)
+
+
+class Command(BaseCommand):
+    help = "Pre-creates upcoming monthly core_event partitions and detaches or drops expired ones (PostgreSQL only)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--convert", action="store_true", help="One-time rebuild of core_event as a partitioned table.")
+        parser.add_argument("--months-ahead", type=int, default=settings.EVENT_PARTITIONING["months_ahead"])
+        parser.add_argument(
+            "--retention-months",
+            type=int,
+            default=settings.EVENT_PARTITIONING["retention_months"],
+            help="Partitions entirely older than this many months are removed (0 keeps everything).",
+        )
+        parser.add_argument("--drop", action="store_true", default=settings.EVENT_PARTITIONING["drop_expired"], help="Drop expired partitions instead of detaching them.")
+        parser.add_argument("--dry-run", action="store_true")
+
+    def _execute(self, statements: list[str], dry_run: bool) -> None:
+        if dry_run:
+            for statement in statements:
+                self.stdout.write(f"{statement};")
+            return
+        with transaction.atomic(), connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            self.stdout.write(self.style.WARNING("Event partitioning requires PostgreSQL; nothing to do."))
+            return
+
+        # Partition bounds are compared in the connection time zone, which Django pins to UTC.
+        current = month_start(timezone.now().date())
+        last_month = add_months(current, options["months_ahead"])
+
+        if not is_partitioned():
+            if not options["convert"]:
+                raise CommandError(f"{EVENT_TABLE} is not partitioned yet; run with --convert first.")
+            oldest = Event.objects.aggregate(oldest=Min("timestamp"))["oldest"]
+            first_month = month_start(oldest.date()) if oldest else current
+            self._execute(convert_to_partitioned_sql(first_month, last_month), options["dry_run"])
+            self.stdout.write(self.style.SUCCESS(f"Converted {EVENT_TABLE} to monthly partitions from {first_month:%Y-%m}."))
+            if options["dry_run"]:
+                return
+
+        partitions = existing_partitions()
+        known_months = {month for month in partitions.values() if month}
+        missing = [month for month in month_range(current, last_month) if month not in known_months]
+        self._execute([create_partition_sql(month) for month in missing], options["dry_run"])
+
+        expired = []
+        if options["retention_months"] > 0:
+            cutoff = add_months(current, -options["retention_months"])
+            expired = sorted(name for name, month in partitions.items() if month and add_months(month, 1) <= cutoff)
+        quote = connection.ops.quote_name
+        statements = []
+        for name in expired:
+            statements.append(f"ALTER TABLE {quote(EVENT_TABLE)} DETACH PARTITION {quote(name)}")
+            if options["drop"]:
+                statements.append(f"DROP TABLE {quote(name)}")
+        self._execute(statements, options["dry_run"])
+
+        action = "dropped" if options["drop"] else "detached"
+        self.stdout.write(self.style.SUCCESS(f"Created {len(missing)} partition(s); {action} {len(expired)} expired partition(s)."))
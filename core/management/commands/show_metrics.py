@@ -0,0 +1,26 @@
+from django.core.management import BaseCommand
+
+from core import metrics
+
+
+class Command(BaseCommand):
+    help = "Prints persisted MetricCounter totals (e.g. bot filter hits per signature)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("prefix", nargs="?", default="", help="Only show counters starting with this prefix, e.g. 'bots.'.")
+
+    def handle(self, *args, **options):
+        totals = metrics.snapshot(options["prefix"])
+        if not totals:
+            self.stdout.write(self.style.WARNING("No counters recorded yet."))
+            return
+        width = max(len(name) for name in totals)
+        for name, value in sorted(totals.items()):
+            self.stdout.write(f"{name.ljust(width)}  {value}")
+
+        original = totals.get("response_cache.original_bytes")
+        if original:
+            for encoding in ("gzip", "br"):
+                compressed = totals.get(f"response_cache.{encoding}_bytes")
+                if compressed:
+                    self.stdout.write(f"response_cache {encoding} compression ratio: {original / compressed:.2f}x")
@@ -0,0 +1,71 @@
+import asyncio
+import threading
+import time
+from collections import Counter
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError, transaction
+from django.db.models import F
+
+from .models import MetricCounter
+
+_pending: Counter[str] = Counter()
+_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+
+def incr(name: str, amount: int = 1) -> None:
+    """Count in process memory; totals reach ``MetricCounter`` at most every flush interval."""
+    with _lock:
+        _pending[name] += amount
+    if _flush_due() and not _in_event_loop():
+        flush()
+
+
+def _flush_due() -> bool:
+    return time.monotonic() - _last_flush >= settings.METRICS["flush_seconds"]
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def flush() -> None:
+    global _last_flush
+    with _lock:
+        pending = dict(_pending)
+        _pending.clear()
+        _last_flush = time.monotonic()
+    try:
+        for name in list(pending):
+            amount = pending[name]
+            if not MetricCounter.objects.filter(name=name).update(value=F("value") + amount):
+                try:
+                    with transaction.atomic():
+                        MetricCounter.objects.create(name=name, value=amount)
+                except IntegrityError:
+                    MetricCounter.objects.filter(name=name).update(value=F("value") + amount)
+            del pending[name]
+    except DatabaseError:
+        # Keep what could not be written for the next flush.
+        with _lock:
+            _pending.update(pending)
+
+
+async def aflush_if_due() -> None:
+    if _flush_due():
+        await sync_to_async(flush)()
+
+
+def snapshot(prefix: str = "") -> dict[str, int]:
+    totals = dict(MetricCounter.objects.filter(name__startswith=prefix).values_list("name", "value"))
+    with _lock:
+        for name, amount in _pending.items():
+            if name.startswith(prefix):
+                totals[name] = totals.get(name, 0) + amount
+    return totals
@@ -0,0 +1,142 @@
+import gzip
+import hashlib
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import parse_http_date_safe
+
+from . import metrics
+from .caching import content_versions
+from .conditional import release_time
+from .models import BlogCategory, BlogPost, BlogTag, GalleryItem, Service, Testimonial
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional, gzip is always available
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/xml", "application/javascript")
+# Cookies that may change what a page renders for this visitor.
+PERSONAL_COOKIES = (settings.SESSION_COOKIE_NAME, "messages")
+# Header names are stored lower-cased; these are recomputed for each variant.
+VARIANT_HEADERS = {"content-length", "content-encoding", "etag"}
+# Query parameters the cached views read. Requests with any other parameter (utm_source,
+# fbclid, cache busters) bypass the cache so they cannot each add a render and new entries.
+KEY_PARAMETERS = ("page", "category", "tag", "service")
+# Compression runs on the request path of every miss; quality 5 costs about as much as gzip -9.
+BROTLI_QUALITY = 5
+
+
+def encodings() -> tuple[str, ...]:
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(accept_encoding: str) -> str:
+    """Best stored encoding acceptable to the client, or ``identity``."""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                continue
+        accepted[name.strip().lower()] = quality
+    for encoding in encodings():
+        if accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return "identity"
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+class CompressedResponseCacheMiddleware:
+    """Serve anonymous GET responses from the cache, pre-compressed with brotli and gzip.
+
+    A miss renders the page once, compresses it once per encoding and stores every variant
+    under the URL, the encoding and the content versions bumped by ``core.signals``, so an
+    admin edit starts a new set of entries. Requests with a session or messages cookie or
+    with query parameters outside ``KEY_PARAMETERS``, and responses that set cookies (e.g. a
+    CSRF token), are never cached or compressed.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        options = settings.RESPONSE_CACHE
+        if not options["enabled"] or request.method not in ("GET", "HEAD") or any(name in request.COOKIES for name in PERSONAL_COOKIES):
+            return self.get_response(request)
+        if not request.GET.keys() <= set(KEY_PARAMETERS):
+            metrics.incr("response_cache.bypass")
+            return self.get_response(request)
+
+        encoding = negotiate(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        prefix = self._key_prefix(request)
+        entry = cache.get(f"{prefix}:{encoding}")
+        if entry is not None:
+            metrics.incr("response_cache.hit")
+            metrics.incr(f"response_cache.sent_bytes.{encoding}", len(entry["body"]))
+            return self._respond(request, entry)
+
+        response = self.get_response(request)
+        if request.method != "GET" or not self._cacheable(response):
+            metrics.incr("response_cache.bypass")
+            return response
+
+        metrics.incr("response_cache.miss")
+        body = response.content
+        headers = [(name.lower(), value) for name, value in response.items() if name.lower() not in VARIANT_HEADERS]
+        etag = response.get("ETag", "").removeprefix("W/")
+        entries = {"identity": {"status": response.status_code, "headers": headers, "body": body, "encoding": "", "etag": etag}}
+        metrics.incr("response_cache.original_bytes", len(body))
+        for name in encodings():
+            compressed = compress(body, name)
+            metrics.incr(f"response_cache.{name}_bytes", len(compressed))
+            if len(compressed) < len(body):
+                entries[name] = {**entries["identity"], "body": compressed, "encoding": name, "etag": f"W/{etag}" if etag else ""}
+            else:
+                entries[name] = entries["identity"]
+        cache.set_many({f"{prefix}:{name}": entry for name, entry in entries.items()}, options["timeout"])
+        return self._respond(request, entries[encoding])
+
+    def _key_prefix(self, request: HttpRequest) -> str:
+        versions = content_versions(Service, Testimonial, BlogPost, GalleryItem, BlogCategory, BlogTag)
+        query = urlencode([(name, value) for name in KEY_PARAMETERS for value in request.GET.getlist(name)])
+        url = request.build_absolute_uri(request.path)
+        source = "|".join([f"{url}?{query}", release_time().isoformat(), *map(str, versions.values())])
+        return f"response:{hashlib.blake2b(source.encode(), digest_size=16).hexdigest()}"
+
+    def _cacheable(self, response: HttpResponse) -> bool:
+        cache_control = response.get("Cache-Control", "")
+        return (
+            response.status_code == 200
+            and not response.streaming
+            and not response.cookies
+            and not response.has_header("Content-Encoding")
+            and response.get("Content-Type", "").startswith(COMPRESSIBLE_TYPES)
+            and not any(directive in cache_control for directive in ("private", "no-store", "no-cache"))
+        )
+
+    def _respond(self, request: HttpRequest, entry: dict) -> HttpResponse:
+        response = HttpResponse(entry["body"], status=entry["status"])
+        for name, value in entry["headers"]:
+            response[name] = value
+        if entry["encoding"]:
+            response["Content-Encoding"] = entry["encoding"]
+        if entry["etag"]:
+            response["ETag"] = entry["etag"]
+        if request.method == "HEAD":
+            response.content = b""
+        response["Content-Length"] = str(len(entry["body"]))
+        patch_vary_headers(response, ("Accept-Encoding",))
+        last_modified = parse_http_date_safe(response.get("Last-Modified", ""))
+        return get_conditional_response(request, etag=entry["etag"] or None, last_modified=last_modified, response=response)
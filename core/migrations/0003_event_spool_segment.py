@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_rename_core_event_event_ty_1763ff_idx_core_event_event_t_996a6f_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventSpoolSegment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('offset', models.PositiveBigIntegerField(default=0)),
+                ('loaded_events', models.PositiveIntegerField(default=0)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.30 on 2026-10-17 23:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_event_spool_segment'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProcessingCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=80, unique=True)),
+                ('position', models.DateTimeField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='EventRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('granularity', models.CharField(choices=[('hour', 'Hour'), ('day', 'Day')], max_length=8)),
+                ('bucket', models.DateTimeField()),
+                ('event_type', models.CharField(max_length=100)),
+                ('page', models.CharField(blank=True, max_length=255)),
+                ('element', models.CharField(blank=True, max_length=255)),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['-bucket'],
+                'indexes': [models.Index(fields=['granularity', 'bucket'], name='core_eventr_granula_79f598_idx'), models.Index(fields=['granularity', 'event_type', 'bucket'], name='core_eventr_granula_6576dc_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='eventrollup',
+            constraint=models.UniqueConstraint(fields=('granularity', 'bucket', 'event_type', 'page', 'element'), name='core_eventrollup_unique_bucket'),
+        ),
+    ]
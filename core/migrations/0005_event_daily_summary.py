@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-17 23:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_event_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventDailySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('event_type', models.CharField(max_length=100)),
+                ('page', models.CharField(blank=True, max_length=255)),
+                ('events', models.PositiveIntegerField(default=0)),
+                ('sessions', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'Event daily summaries',
+                'ordering': ['-day'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='eventdailysummary',
+            constraint=models.UniqueConstraint(fields=('day', 'event_type', 'page'), name='core_eventdailysummary_unique_day'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-17 23:03
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    # Schema, backfill and swap are separate migrations so a failed backfill can be re-run.
+
+    dependencies = [
+        ('core', '0005_event_daily_summary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserAgent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest', models.CharField(max_length=32, unique=True)),
+                ('value', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['value'],
+            },
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='user_agent_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='events', to='core.useragent'),
+        ),
+    ]
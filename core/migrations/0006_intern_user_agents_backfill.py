@@ -0,0 +1,48 @@
+# Generated by Django 4.2.30 on 2026-10-17 23:03
+
+import hashlib
+
+from django.db import migrations, transaction
+
+BACKFILL_CHUNK_SIZE = 5000
+
+
+def backfill_user_agents(apps, schema_editor):
+    Event = apps.get_model("core", "Event")
+    UserAgent = apps.get_model("core", "UserAgent")
+
+    last_id = 0
+    while True:
+        rows = list(
+            Event.objects.filter(id__gt=last_id, user_agent_ref__isnull=True).exclude(user_agent="").order_by("id").values_list("id", "user_agent")[:BACKFILL_CHUNK_SIZE]
+        )
+        if not rows:
+            return
+        last_id = rows[-1][0]
+
+        ids_by_value: dict[str, list[int]] = {}
+        for pk, value in rows:
+            ids_by_value.setdefault(value, []).append(pk)
+        digests = {hashlib.blake2b(value.encode("utf-8"), digest_size=16).hexdigest(): value for value in ids_by_value}
+
+        with transaction.atomic():
+            UserAgent.objects.bulk_create(
+                [UserAgent(digest=digest, value=value) for digest, value in digests.items()],
+                ignore_conflicts=True,
+            )
+            for digest, user_agent_id in UserAgent.objects.filter(digest__in=digests).values_list("digest", "id"):
+                Event.objects.filter(id__in=ids_by_value[digests[digest]]).update(user_agent_ref=user_agent_id)
+
+
+class Migration(migrations.Migration):
+    # The backfill commits chunk by chunk instead of holding one long transaction; rows already
+    # linked are skipped, so a failed run can simply be repeated.
+    atomic = False
+
+    dependencies = [
+        ('core', '0006_intern_user_agents'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_user_agents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-17 23:03
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_intern_user_agents_backfill'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='event',
+            name='user_agent',
+        ),
+        migrations.RenameField(
+            model_name='event',
+            old_name='user_agent_ref',
+            new_name='user_agent',
+        ),
+    ]
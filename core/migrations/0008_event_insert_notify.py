@@ -0,0 +1,41 @@
+# Generated by Django 4.2.30 on 2026-10-17 23:14
+
+from django.db import migrations
+
+# Statement-level, so a COPY or bulk insert from the spool loader sends one notification.
+# Listeners (the dashboard live stream) re-read rows above their last seen id.
+CREATE_TRIGGER = """
+CREATE OR REPLACE FUNCTION core_event_notify() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM pg_notify('core_event_insert', '');
+    RETURN NULL;
+END
+$$;
+CREATE TRIGGER core_event_notify AFTER INSERT ON core_event FOR EACH STATEMENT EXECUTE FUNCTION core_event_notify();
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS core_event_notify ON core_event;
+DROP FUNCTION IF EXISTS core_event_notify();
+"""
+
+
+def create_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(CREATE_TRIGGER)
+
+
+def drop_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_TRIGGER)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_metric_counter'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigger, drop_trigger),
+    ]
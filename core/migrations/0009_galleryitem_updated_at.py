@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 23:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_event_insert_notify'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='galleryitem',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
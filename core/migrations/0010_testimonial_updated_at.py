@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 23:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_galleryitem_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='testimonial',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
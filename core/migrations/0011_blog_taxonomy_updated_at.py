@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-17 23:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_testimonial_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogcategory',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='blogtag',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
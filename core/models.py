@@ -47,6 +47,7 @@ class GalleryItem(models.Model):
     is_featured = models.BooleanField(default=False)
     sort_order = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["sort_order", "-created_at"]
@@ -58,6 +59,7 @@ class GalleryItem(models.Model):
 class BlogCategory(models.Model):
     name = models.CharField(max_length=80, unique=True)
     slug = models.SlugField(unique=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "Blog categories"
@@ -70,6 +72,7 @@ class BlogCategory(models.Model):
 class BlogTag(models.Model):
     name = models.CharField(max_length=80, unique=True)
     slug = models.SlugField(unique=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["name"]
@@ -118,6 +121,7 @@ class Testimonial(models.Model):
     source = models.CharField(max_length=80, default="Google")
     is_featured = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-date", "-created_at"]
@@ -142,12 +146,24 @@ class ContactMessage(models.Model):
         return f"{self.name} - {self.subject}"
 
 
+class UserAgent(models.Model):
+    digest = models.CharField(max_length=32, unique=True)
+    value = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["value"]
+
+    def __str__(self) -> str:
+        return self.value
+
+
 class Event(models.Model):
     event_type = models.CharField(max_length=100)
     element = models.CharField(max_length=255, blank=True)
     timestamp = models.DateTimeField(default=timezone.now, db_index=True)
     page = models.CharField(max_length=255, blank=True)
-    user_agent = models.TextField(blank=True)
+    user_agent = models.ForeignKey(UserAgent, on_delete=models.PROTECT, null=True, blank=True, related_name="events")
     session_id = models.CharField(max_length=128, blank=True, db_index=True)
     additional_data = models.JSONField(default=dict, blank=True)
 
@@ -160,3 +176,89 @@ class Event(models.Model):
 
     def __str__(self) -> str:
         return f"{self.event_type} @ {self.page}"
+
+
+class EventSpoolSegment(models.Model):
+    name = models.CharField(max_length=255, unique=True)
+    offset = models.PositiveBigIntegerField(default=0)
+    loaded_events = models.PositiveIntegerField(default=0)
+    completed_at = models.DateTimeField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class EventRollup(models.Model):
+    GRANULARITY_CHOICES = [
+        ("hour", "Hour"),
+        ("day", "Day"),
+    ]
+
+    granularity = models.CharField(max_length=8, choices=GRANULARITY_CHOICES)
+    bucket = models.DateTimeField()
+    event_type = models.CharField(max_length=100)
+    page = models.CharField(max_length=255, blank=True)
+    element = models.CharField(max_length=255, blank=True)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["-bucket"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["granularity", "bucket", "event_type", "page", "element"],
+                name="core_eventrollup_unique_bucket",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["granularity", "bucket"]),
+            models.Index(fields=["granularity", "event_type", "bucket"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.event_type} @ {self.page} [{self.granularity} {self.bucket:%Y-%m-%d %H:%M}] = {self.count}"
+
+
+class ProcessingCheckpoint(models.Model):
+    name = models.CharField(max_length=80, unique=True)
+    position = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self) -> str:
+        return f"{self.name} @ {self.position:%Y-%m-%d %H:%M:%S}"
+
+
+class EventDailySummary(models.Model):
+    day = models.DateField()
+    event_type = models.CharField(max_length=100)
+    page = models.CharField(max_length=255, blank=True)
+    events = models.PositiveIntegerField(default=0)
+    sessions = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["-day"]
+        verbose_name_plural = "Event daily summaries"
+        constraints = [
+            models.UniqueConstraint(fields=["day", "event_type", "page"], name="core_eventdailysummary_unique_day"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.event_type} @ {self.page} [{self.day}] = {self.events}"
+
+
+class MetricCounter(models.Model):
+    name = models.CharField(max_length=160, unique=True)
+    value = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self) -> str:
+        return f"{self.name} = {self.value}"
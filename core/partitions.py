@@ -0,0 +1,131 @@
+from datetime import date
+
+from django.db import connection
+
+from .models import Event
+
+EVENT_TABLE = Event._meta.db_table
+DEFAULT_PARTITION = f"{EVENT_TABLE}_default"
+
+
+def month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{EVENT_TABLE}_p{month:%Y_%m}"
+
+
+def month_range(first: date, last: date) -> list[date]:
+    months = []
+    current = month_start(first)
+    while current <= month_start(last):
+        months.append(current)
+        current = add_months(current, 1)
+    return months
+
+
+def is_partitioned() -> bool:
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)",
+            [EVENT_TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+def existing_partitions() -> dict[str, date | None]:
+    """Map partition table name to its lower bound month (``None`` for the default partition)."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s
+            """,
+            [EVENT_TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions: dict[str, date | None] = {}
+    prefix = f"{EVENT_TABLE}_p"
+    for name in names:
+        if name.startswith(prefix):
+            year, month = name[len(prefix):].split("_")
+            partitions[name] = date(int(year), int(month), 1)
+        else:
+            partitions[name] = None
+    return partitions
+
+
+def create_partition_sql(month: date) -> str:
+    quote = connection.ops.quote_name
+    return (
+        f"CREATE TABLE IF NOT EXISTS {quote(partition_name(month))} PARTITION OF {quote(EVENT_TABLE)} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+def convert_to_partitioned_sql(first_month: date, last_month: date) -> list[str]:
+    """Statements that rebuild ``core_event`` as a monthly range-partitioned table.
+
+    Index, foreign key and trigger definitions are captured from the catalog and replayed
+    with the same names, so later schema migrations still find them; the ``timestamp``
+    index becomes BRIN.
+    """
+    quote = connection.ops.quote_name
+    table = quote(EVENT_TABLE)
+    legacy = quote(f"{EVENT_TABLE}_legacy")
+    id_column = quote(Event._meta.pk.column)
+    timestamp_column = quote(Event._meta.get_field("timestamp").column)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT indexdef FROM pg_indexes
+            WHERE tablename = %s AND indexname NOT IN (
+                SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'p'
+            )
+            ORDER BY indexname
+            """,
+            [EVENT_TABLE, EVENT_TABLE],
+        )
+        index_statements = [
+            row[0].replace("USING btree", "USING brin") if row[0].endswith(f"({timestamp_column})") else row[0]
+            for row in cursor.fetchall()
+        ]
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'f'",
+            [EVENT_TABLE],
+        )
+        foreign_key_statements = [f"ALTER TABLE {table} ADD CONSTRAINT {quote(name)} {definition}" for name, definition in cursor.fetchall()]
+        cursor.execute(
+            "SELECT pg_get_triggerdef(oid) FROM pg_trigger WHERE tgrelid = to_regclass(%s) AND NOT tgisinternal ORDER BY tgname",
+            [EVENT_TABLE],
+        )
+        trigger_statements = [row[0] for row in cursor.fetchall()]
+
+    return [
+        f"ALTER TABLE {table} RENAME TO {legacy}",
+        f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS INCLUDING IDENTITY INCLUDING CONSTRAINTS) "
+        f"PARTITION BY RANGE ({timestamp_column})",
+        *(create_partition_sql(month) for month in month_range(first_month, last_month)),
+        f"CREATE TABLE {quote(DEFAULT_PARTITION)} PARTITION OF {table} DEFAULT",
+        f"INSERT INTO {table} OVERRIDING SYSTEM VALUE SELECT * FROM {legacy}",
+        f"DROP TABLE {legacy}",
+        f"ALTER TABLE {table} ADD PRIMARY KEY ({id_column}, {timestamp_column})",
+        *index_statements,
+        *foreign_key_statements,
+        *trigger_statements,
+        f"SELECT setval(pg_get_serial_sequence('{EVENT_TABLE}', '{Event._meta.pk.column}'), "
+        f"COALESCE((SELECT MAX({id_column}) FROM {table}), 0) + 1, false)",
+    ]
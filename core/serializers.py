@@ -4,6 +4,8 @@ from .models import BlogPost, ContactMessage, Event
 
 
 class EventSerializer(serializers.ModelSerializer):
+    user_agent = serializers.CharField(required=False, allow_blank=True)
+
     class Meta:
         model = Event
         fields = ["event_type", "element", "page", "user_agent", "session_id", "additional_data"]
@@ -0,0 +1,29 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .caching import bump_content_version
+from .models import BlogCategory, BlogPost, BlogTag, GalleryItem, Service, Testimonial
+
+
+@receiver(post_save, sender=Service)
+@receiver(post_delete, sender=Service)
+@receiver(post_save, sender=Testimonial)
+@receiver(post_delete, sender=Testimonial)
+@receiver(post_save, sender=BlogPost)
+@receiver(post_delete, sender=BlogPost)
+@receiver(post_save, sender=GalleryItem)
+@receiver(post_delete, sender=GalleryItem)
+@receiver(post_save, sender=BlogCategory)
+@receiver(post_delete, sender=BlogCategory)
+@receiver(post_save, sender=BlogTag)
+@receiver(post_delete, sender=BlogTag)
+def invalidate_cached_content(sender, **kwargs) -> None:
+    bump_content_version(sender)
+
+
+@receiver(m2m_changed, sender=BlogPost.categories.through)
+@receiver(m2m_changed, sender=BlogPost.tags.through)
+def invalidate_post_taxonomy(sender, action, **kwargs) -> None:
+    # Adding or removing a category or tag does not save the post itself.
+    if action in ("post_add", "post_remove", "post_clear"):
+        bump_content_version(BlogPost)
@@ -0,0 +1,102 @@
+import json
+import os
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+
+SEGMENT_SUFFIX = ".ndjson"
+
+
+class EventSpool:
+    """Append-only NDJSON segments, one file per worker, rotation window and size step.
+
+    Segment names look like ``events-<window>-<pid>-<seq>.ndjson``. A writer only ever
+    appends to the segment of the current window, so a segment is sealed (safe to load)
+    once its window has ended and the grace period has passed.
+    """
+
+    def __init__(self, directory: Path, rotate_seconds: int = 60, max_segment_bytes: int = 8 * 1024 * 1024, grace_seconds: int = 5):
+        self.directory = Path(directory)
+        self.rotate_seconds = max(1, rotate_seconds)
+        self.max_segment_bytes = max_segment_bytes
+        self.grace_seconds = grace_seconds
+
+    @classmethod
+    def from_settings(cls) -> "EventSpool":
+        config = settings.EVENT_SPOOL
+        return cls(
+            config["directory"],
+            rotate_seconds=config["rotate_seconds"],
+            max_segment_bytes=config["max_segment_bytes"],
+            grace_seconds=config["grace_seconds"],
+        )
+
+    def _window_start(self, now: float) -> int:
+        return int(now) - int(now) % self.rotate_seconds
+
+    def _current_path(self, now: float) -> Path:
+        prefix = f"events-{self._window_start(now)}-{os.getpid()}-"
+        seq = 0
+        while True:
+            path = self.directory / f"{prefix}{seq:04d}{SEGMENT_SUFFIX}"
+            try:
+                if path.stat().st_size < self.max_segment_bytes:
+                    return path
+            except FileNotFoundError:
+                return path
+            seq += 1
+
+    def append(self, records: list[dict[str, Any]]) -> None:
+        if not records:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        data = "".join(json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n" for record in records)
+        fd = os.open(self._current_path(time.time()), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+    def sealed_segments(self, now: float | None = None) -> list[Path]:
+        if not self.directory.exists():
+            return []
+        cutoff = (time.time() if now is None else now) - self.rotate_seconds - self.grace_seconds
+        segments = []
+        for path in self.directory.glob(f"events-*{SEGMENT_SUFFIX}"):
+            try:
+                window_start = int(path.name.split("-")[1])
+            except (IndexError, ValueError):
+                continue
+            if window_start <= cutoff:
+                segments.append((window_start, path))
+        return [path for _, path in sorted(segments)]
+
+
+def read_records(path: Path, offset: int, limit: int) -> Iterator[tuple[list[dict[str, Any]], int]]:
+    """Yield ``(records, next_offset)`` chunks of complete lines starting at ``offset``.
+
+    A trailing line without a newline (a torn write) is never returned, so its offset is
+    never committed.
+    """
+    with path.open("rb") as handle:
+        handle.seek(offset)
+        records: list[dict[str, Any]] = []
+        position = committed = offset
+        for line in handle:
+            if not line.endswith(b"\n"):
+                break
+            position += len(line)
+            line = line.strip()
+            if line:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    pass
+            if len(records) >= limit:
+                yield records, position
+                records, committed = [], position
+        if position != committed:
+            yield records, position
@@ -1,10 +1,12 @@
 import json
 
-from django.test import TestCase
+from django.conf import settings
+from django.test import AsyncRequestFactory, TestCase
 from django.urls import reverse
 from django.utils import timezone
 
 from core.models import BlogPost, ContactMessage, Event
+from core.views import AsyncContactSubmissionView, AsyncTrackEventBatchView, AsyncTrackEventView
 
 
 class ApiTests(TestCase):
@@ -26,6 +28,56 @@ class ApiTests(TestCase):
         self.assertEqual(response.status_code, 201)
         self.assertEqual(Event.objects.count(), 1)
 
+    def test_track_event_batch_api(self):
+        response = self.client.post(
+            reverse("core:api_track_batch"),
+            data=json.dumps(
+                {
+                    "events": [
+                        {"event_type": "page_view", "element": "body", "page": "/", "session_id": "test-session"},
+                        {"event_type": "cta_click", "element": "hero_contact", "page": "/", "session_id": "test-session"},
+                    ]
+                }
+            ),
+            content_type="application/json",
+            HTTP_USER_AGENT="unit-test-agent",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["count"], 2)
+        self.assertEqual(Event.objects.filter(user_agent__value="unit-test-agent").count(), 2)
+
+    def test_track_event_batch_api_rejects_invalid_event(self):
+        response = self.client.post(
+            reverse("core:api_track_batch"),
+            data=json.dumps([{"event_type": "page_view", "page": "/"}, {"event_type": "x", "page": "/"}]),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Event.objects.count(), 0)
+
+    def test_track_event_api_enforces_model_limits(self):
+        response = self.client.post(
+            reverse("core:api_track"),
+            data=json.dumps({"event_type": "x" * 101, "page": "/", "additional_data": {"blob": "y" * 4096}}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json()), {"event_type", "additional_data"})
+        self.assertEqual(Event.objects.count(), 0)
+
+    def test_track_event_api_rejects_oversized_body(self):
+        with self.settings(EVENT_INGEST={**settings.EVENT_INGEST, "max_body_bytes": 64}):
+            response = self.client.post(
+                reverse("core:api_track"),
+                data=json.dumps({"event_type": "page_view", "page": "/" + "p" * 100}),
+                content_type="application/json",
+            )
+
+        self.assertEqual(response.status_code, 413)
+
     def test_contact_api(self):
         response = self.client.post(
             reverse("core:api_contact"),
@@ -56,3 +108,42 @@ class ApiTests(TestCase):
         response = self.client.get("/api/blog/posts/")
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.json()), 1)
+
+
+class AsyncApiTests(TestCase):
+    async def test_async_track_event_batch_view(self):
+        request = AsyncRequestFactory().post(
+            "/api/track/batch/",
+            data=json.dumps({"events": [{"event_type": "page_view", "page": "/"}, {"event_type": "cta_click", "page": "/"}]}),
+            content_type="application/json",
+            headers={"User-Agent": "async-agent"},
+        )
+        response = await AsyncTrackEventBatchView.as_view()(request)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(await Event.objects.filter(user_agent__value="async-agent").acount(), 2)
+
+    async def test_async_track_event_view_rejects_invalid_payload(self):
+        request = AsyncRequestFactory().post("/api/track/", data=json.dumps({"event_type": "x"}), content_type="application/json")
+        response = await AsyncTrackEventView.as_view()(request)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("event_type", json.loads(response.content))
+
+    async def test_async_contact_view(self):
+        request = AsyncRequestFactory().post(
+            "/api/contact/",
+            data=json.dumps(
+                {
+                    "name": "Client Test",
+                    "email": "client@test.ro",
+                    "subject": "Programare",
+                    "message": "As dori o programare pentru ceramic coating.",
+                }
+            ),
+            content_type="application/json",
+        )
+        response = await AsyncContactSubmissionView.as_view()(request)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(await ContactMessage.objects.acount(), 1)
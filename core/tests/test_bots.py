@@ -0,0 +1,43 @@
+import json
+
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from core import metrics
+from core.bots import BotMatcher
+from core.models import Event, MetricCounter
+
+
+class BotMatcherTests(SimpleTestCase):
+    def test_reports_matching_signature(self):
+        matcher = BotMatcher(("bot", "HeadlessChrome", "curl/"))
+
+        self.assertEqual(matcher.match("Mozilla/5.0 (compatible; Googlebot/2.1)"), "bot")
+        self.assertEqual(matcher.match("Mozilla/5.0 HeadlessChrome/120.0"), "HeadlessChrome")
+        self.assertIsNone(matcher.match("Mozilla/5.0 (iPhone; CPU iPhone OS 17_4 like Mac OS X)"))
+
+    def test_default_signatures_keep_devices_named_bot(self):
+        matcher = BotMatcher(tuple(settings.BOT_FILTER["signatures"]))
+
+        self.assertEqual(matcher.match("Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)"), "bot/")
+        self.assertEqual(matcher.match("Slackbot-LinkExpanding 1.0 (+https://api.slack.com/robots)"), "bot-")
+        self.assertIsNone(matcher.match("Mozilla/5.0 (Linux; Android 10; CUBOT X30) AppleWebKit/537.36 Chrome/120.0 Mobile Safari/537.36"))
+
+    def test_empty_signature_list_matches_nothing(self):
+        self.assertIsNone(BotMatcher(()).match("Googlebot"))
+
+
+class BotFilterApiTests(TestCase):
+    def test_bot_events_are_counted_not_stored(self):
+        response = self.client.post(
+            reverse("core:api_track"),
+            data=json.dumps({"event_type": "page_view", "page": "/"}),
+            content_type="application/json",
+            HTTP_USER_AGENT="Mozilla/5.0 (compatible; bingbot/2.0)",
+        )
+        metrics.flush()
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(Event.objects.count(), 0)
+        self.assertEqual(MetricCounter.objects.get(name="bots.bot/").value, 1)
@@ -0,0 +1,85 @@
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from core.cache import SQLiteCache
+
+
+def increment(location: str, times: int) -> None:
+    cache = SQLiteCache(location, {})
+    for _ in range(times):
+        cache.incr("hits")
+
+
+class SQLiteCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.location = str(Path(self.tmp.name) / "cache.sqlite3")
+        self.cache = SQLiteCache(self.location, {})
+
+    def test_round_trips_values(self):
+        self.cache.set("page", {"html": "<p>x</p>", "rows": [1, 2]})
+        self.cache.set_many({"a": 1, "b": "doi"})
+
+        self.assertEqual(self.cache.get("page"), {"html": "<p>x</p>", "rows": [1, 2]})
+        self.assertEqual(self.cache.get_many(["a", "b", "missing"]), {"a": 1, "b": "doi"})
+        self.assertTrue(self.cache.delete("a"))
+        self.assertFalse(self.cache.delete("a"))
+        self.assertIsNone(self.cache.get("a"))
+
+    def test_add_only_replaces_expired_entries(self):
+        self.assertTrue(self.cache.add("key", 1))
+        self.assertFalse(self.cache.add("key", 2))
+        self.cache.set("stale", 1, timeout=0.01)
+        time.sleep(0.02)
+
+        self.assertTrue(self.cache.add("stale", 2))
+        self.assertEqual(self.cache.get("key"), 1)
+        self.assertEqual(self.cache.get("stale"), 2)
+
+    def test_entries_expire(self):
+        self.cache.set("short", "value", timeout=0.01)
+        self.cache.set("forever", "value", timeout=None)
+        time.sleep(0.02)
+
+        self.assertFalse(self.cache.has_key("short"))
+        self.assertTrue(self.cache.has_key("forever"))
+        with self.assertRaises(ValueError):
+            self.cache.incr("short")
+
+    def test_incr_is_atomic_across_processes(self):
+        self.cache.set("hits", 0)
+        context = multiprocessing.get_context("fork")
+        workers = [context.Process(target=increment, args=(self.location, 200)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(self.cache.get("hits"), 800)
+        self.assertEqual(self.cache.decr("hits", 10), 790)
+
+    def test_culls_least_recently_used_entries(self):
+        cache = SQLiteCache(self.location, {"OPTIONS": {"MAX_ENTRIES": 10, "CULL_EVERY": 1, "ACCESS_RESOLUTION": 0}})
+        cache.set("kept", "value")
+        for index in range(30):
+            cache.get("kept")
+            cache.set(f"key-{index}", index)
+
+        rows = cache._connection.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+        self.assertLessEqual(rows, 10)
+        self.assertEqual(cache.get("kept"), "value")
+        self.assertEqual(cache.get("key-29"), 29)
+
+    def test_culls_by_size(self):
+        cache = SQLiteCache(self.location, {"OPTIONS": {"MAX_BYTES": 10_000, "CULL_EVERY": 1}})
+        for index in range(20):
+            cache.set(f"blob-{index}", b"x" * 1_000)
+
+        size = cache._connection.execute("SELECT SUM(size) FROM cache_entries").fetchone()[0]
+        self.assertLessEqual(size, 10_000)
+        self.assertIsNotNone(cache.get("blob-19"))
@@ -0,0 +1,62 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from core.caching import content_versions
+from core.models import BlogPost, Service, Testimonial
+
+
+@override_settings(RESPONSE_CACHE={"enabled": False, "timeout": 0})
+class HomeContentCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.service = Service.objects.create(
+            name="Paint Protection Film",
+            slug="ppf",
+            description="Descriere",
+            short_description="Short",
+            category="ppf",
+        )
+        cls.post = BlogPost.objects.create(
+            title="Ghid PPF",
+            slug="ghid-ppf",
+            summary="Rezumat",
+            content="Continut articol",
+            is_published=True,
+            published_at=timezone.now(),
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_warm_home_page_runs_no_queries(self):
+        self.client.get(reverse("core:home"))
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("core:home"))
+        self.assertContains(response, self.service.name)
+        self.assertContains(response, self.post.title)
+
+    def test_saving_a_model_refreshes_its_block(self):
+        self.client.get(reverse("core:home"))
+        self.service.name = "Folie PPF Premium"
+        self.service.save()
+        Testimonial.objects.create(author="Andrei", comment="Treaba impecabila", rating=5)
+
+        response = self.client.get(reverse("core:home"))
+        self.assertContains(response, "Folie PPF Premium")
+        self.assertContains(response, "Treaba impecabila")
+
+    def test_deleting_a_model_refreshes_its_block(self):
+        self.client.get(reverse("core:home"))
+        self.post.delete()
+
+        response = self.client.get(reverse("core:home"))
+        self.assertNotContains(response, "Ghid PPF")
+
+    def test_versions_change_only_for_the_saved_model(self):
+        before = content_versions(Service, BlogPost)
+        Service.objects.create(name="Ceramic", slug="ceramic", description="Descriere", category="ceramic")
+        after = content_versions(Service, BlogPost)
+        self.assertNotEqual(before["service"], after["service"])
+        self.assertEqual(before["blogpost"], after["blogpost"])
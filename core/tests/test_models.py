@@ -1,7 +1,8 @@
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.utils import timezone
 
-from core.models import BlogPost, Event, Service, Testimonial
+from core.models import BlogPost, Event, Service, Testimonial, UserAgent
+from core.user_agents import LRUCache, intern_user_agents
 
 
 class ModelTests(TestCase):
@@ -28,3 +29,24 @@ class ModelTests(TestCase):
     def test_event_string_representation(self):
         event = Event.objects.create(event_type="page_view", page="/")
         self.assertIn("page_view", str(event))
+
+
+class UserAgentInterningTests(TestCase):
+    def test_intern_reuses_existing_rows(self):
+        first = intern_user_agents({"Mozilla/5.0 Test", ""})
+        second = intern_user_agents({"Mozilla/5.0 Test"})
+
+        self.assertEqual(first, second)
+        self.assertEqual(UserAgent.objects.count(), 1)
+
+
+class LRUCacheTests(SimpleTestCase):
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
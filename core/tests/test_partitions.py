@@ -0,0 +1,83 @@
+from datetime import date
+from io import StringIO
+from unittest import skipUnless
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from core.models import Event, UserAgent
+from core.partitions import (
+    DEFAULT_PARTITION,
+    EVENT_TABLE,
+    add_months,
+    create_partition_sql,
+    existing_partitions,
+    is_partitioned,
+    month_range,
+    month_start,
+    partition_name,
+)
+
+
+class PartitionHelperTests(SimpleTestCase):
+    def test_add_months_wraps_years(self):
+        self.assertEqual(add_months(date(2026, 11, 1), 3), date(2027, 2, 1))
+        self.assertEqual(add_months(date(2026, 1, 1), -1), date(2025, 12, 1))
+
+    def test_month_range_is_inclusive(self):
+        months = month_range(date(2026, 10, 17), date(2027, 1, 5))
+        self.assertEqual([partition_name(month) for month in months][-1], "core_event_p2027_01")
+        self.assertEqual(len(months), 4)
+
+    def test_partition_bounds_cover_one_month(self):
+        sql = create_partition_sql(date(2026, 12, 1))
+        self.assertIn("FROM ('2026-12-01') TO ('2027-01-01')", sql)
+
+
+class PartitionCommandTests(TestCase):
+    @skipUnless(connection.vendor != "postgresql", "PostgreSQL runs the real conversion below.")
+    def test_command_is_noop_without_postgresql(self):
+        out = StringIO()
+        call_command("manage_event_partitions", stdout=out)
+        self.assertIn("requires PostgreSQL", out.getvalue())
+
+
+@skipUnless(connection.vendor == "postgresql", "Event partitioning requires PostgreSQL.")
+class PostgresPartitionCommandTests(TestCase):
+    def setUp(self):
+        agent = UserAgent.objects.create(digest="a" * 32, value="Mozilla/5.0")
+        self.event = Event.objects.create(event_type="page_view", page="/", user_agent=agent)
+
+    def _catalog(self, query: str) -> list:
+        with connection.cursor() as cursor:
+            cursor.execute(query, [EVENT_TABLE])
+            return [row[0] for row in cursor.fetchall()]
+
+    def test_dry_run_prints_statements_without_converting(self):
+        out = StringIO()
+        call_command("manage_event_partitions", "--convert", "--dry-run", stdout=out)
+        self.assertIn("PARTITION BY RANGE", out.getvalue())
+        self.assertFalse(is_partitioned())
+
+    def test_convert_keeps_rows_indexes_foreign_keys_and_trigger(self):
+        call_command("manage_event_partitions", "--convert", "--months-ahead", "2", "--retention-months", "0", stdout=StringIO())
+
+        self.assertTrue(is_partitioned())
+        current = month_start(timezone.now().date())
+        partitions = existing_partitions()
+        self.assertIn(DEFAULT_PARTITION, partitions)
+        for month in month_range(current, add_months(current, 2)):
+            self.assertIn(partition_name(month), partitions)
+
+        indexes = self._catalog("SELECT indexdef FROM pg_indexes WHERE tablename = %s")
+        self.assertTrue(any("USING brin" in definition and '"timestamp"' in definition for definition in indexes))
+        foreign_keys = self._catalog("SELECT pg_get_constraintdef(oid) FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'f'")
+        self.assertTrue(any("core_useragent" in definition for definition in foreign_keys))
+        triggers = self._catalog("SELECT tgname FROM pg_trigger WHERE tgrelid = to_regclass(%s) AND NOT tgisinternal")
+        self.assertIn("core_event_notify", triggers)
+
+        self.assertTrue(Event.objects.filter(pk=self.event.pk).exists())
+        newer = Event.objects.create(event_type="click", page="/")
+        self.assertGreater(newer.pk, self.event.pk)
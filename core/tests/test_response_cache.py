@@ -0,0 +1,131 @@
+import gzip
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from core import metrics
+from core.middleware import negotiate
+from core.models import BlogCategory, BlogPost, BlogTag, Service
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class CompressedResponseCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.service = Service.objects.create(
+            name="Paint Protection Film",
+            slug="ppf",
+            description="Descriere",
+            short_description="Short",
+            category="ppf",
+        )
+        cls.post = BlogPost.objects.create(
+            title="Ghid PPF",
+            slug="ghid-ppf",
+            summary="Rezumat",
+            content="Continut articol",
+            is_published=True,
+            published_at=timezone.now(),
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_serves_gzip_variant_from_cache_without_queries(self):
+        url = reverse("core:service_list")
+        first = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(first["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", first["Vary"])
+        self.assertIn(self.service.name, gzip.decompress(first.content).decode())
+
+        metrics.flush()
+        with self.assertNumQueries(0):
+            second = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(int(second["Content-Length"]), len(second.content))
+
+    def test_identity_and_brotli_variants(self):
+        url = reverse("core:blog_detail", kwargs={"slug": self.post.slug})
+        plain = self.client.get(url)
+        self.assertFalse(plain.has_header("Content-Encoding"))
+        self.assertContains(plain, self.post.title)
+        if brotli is not None:
+            compressed = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip, br")
+            self.assertEqual(compressed["Content-Encoding"], "br")
+            self.assertEqual(brotli.decompress(compressed.content), plain.content)
+
+    def test_cached_response_revalidates(self):
+        url = reverse("core:blog_list")
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertTrue(response["ETag"].startswith("W/"))
+        cached = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(cached.status_code, 304)
+
+    def test_content_edit_replaces_cached_page(self):
+        url = reverse("core:service_detail", kwargs={"slug": self.service.slug})
+        self.client.get(url)
+        self.service.name = "Folie PPF Premium"
+        self.service.save()
+
+        self.assertContains(self.client.get(url), "Folie PPF Premium")
+
+    def test_category_rename_and_new_tag_replace_cached_post(self):
+        category = BlogCategory.objects.create(name="Protectie", slug="protectie")
+        self.post.categories.add(category)
+        url = reverse("core:blog_detail", kwargs={"slug": self.post.slug})
+        self.assertContains(self.client.get(url), "Protectie")
+        self.client.get(url)
+
+        category.name = "Folie PPF"
+        category.save()
+        self.assertContains(self.client.get(url), "Folie PPF")
+
+        self.post.tags.add(BlogTag.objects.create(name="Ceramica", slug="ceramica"))
+        self.assertContains(self.client.get(url), "Ceramica")
+
+    def test_only_parameters_the_views_read_are_cached(self):
+        url = reverse("core:blog_list")
+        self.client.get(url, {"category": "ppf"}, HTTP_ACCEPT_ENCODING="gzip")
+        metrics.flush()
+        with self.assertNumQueries(0):
+            cached = self.client.get(url, {"category": "ppf"}, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(cached["Content-Encoding"], "gzip")
+
+        self.client.get(url, {"category": "ppf", "utm_source": "facebook"}, HTTP_ACCEPT_ENCODING="gzip")
+        tracked = self.client.get(url, {"category": "ppf", "utm_source": "facebook"}, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertFalse(tracked.has_header("Content-Encoding"))
+        self.assertEqual(tracked.status_code, 200)
+
+    def test_pages_that_set_cookies_are_not_cached(self):
+        url = reverse("core:contact")
+        first = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertFalse(first.has_header("Content-Encoding"))
+        self.assertIn("csrftoken", first.cookies)
+        self.client.cookies.clear()
+        self.assertIn("csrftoken", self.client.get(url).cookies)
+
+    def test_counts_hits_misses_and_bytes(self):
+        url = reverse("core:service_list")
+        before = metrics.snapshot("response_cache.")
+        self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+        self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+        after = metrics.snapshot("response_cache.")
+
+        def added(name: str) -> int:
+            return after.get(name, 0) - before.get(name, 0)
+
+        self.assertEqual(added("response_cache.miss"), 1)
+        self.assertEqual(added("response_cache.hit"), 1)
+        self.assertLess(added("response_cache.gzip_bytes"), added("response_cache.original_bytes"))
+
+    def test_negotiate(self):
+        self.assertEqual(negotiate(""), "identity")
+        self.assertEqual(negotiate("gzip;q=0, identity"), "identity")
+        self.assertEqual(negotiate("deflate, gzip;q=0.5"), "gzip")
+        self.assertEqual(negotiate("*"), "br" if brotli is not None else "gzip")
@@ -0,0 +1,69 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db.models import Sum
+from django.test import TestCase
+from django.utils import timezone
+
+from core.models import Event, EventDailySummary, EventRollup, ProcessingCheckpoint
+
+
+class RollupCommandTests(TestCase):
+    def _rollup(self, *args):
+        call_command("rollup_events", *args, stdout=StringIO())
+
+    def test_rollup_counts_hours_and_days(self):
+        now = timezone.now()
+        Event.objects.bulk_create(
+            [
+                Event(event_type="page_view", page="/", timestamp=now - timedelta(minutes=5)),
+                Event(event_type="page_view", page="/", timestamp=now - timedelta(minutes=4)),
+                Event(event_type="cta_click", page="/", element="hero_contact", timestamp=now - timedelta(minutes=3)),
+            ]
+        )
+        self._rollup()
+
+        hourly = EventRollup.objects.filter(granularity="hour")
+        self.assertEqual(hourly.aggregate(total=Sum("count"))["total"], 3)
+        self.assertEqual(EventRollup.objects.filter(granularity="day").aggregate(total=Sum("count"))["total"], 3)
+        self.assertTrue(ProcessingCheckpoint.objects.filter(name="event_rollup").exists())
+
+    def test_rerun_is_idempotent_and_picks_up_late_rows(self):
+        now = timezone.now()
+        Event.objects.create(event_type="page_view", page="/", timestamp=now - timedelta(minutes=2))
+        self._rollup()
+        self._rollup()
+        Event.objects.create(event_type="page_view", page="/", timestamp=now - timedelta(minutes=1))
+        self._rollup()
+
+        self.assertEqual(EventRollup.objects.filter(granularity="hour").aggregate(total=Sum("count"))["total"], 2)
+        self.assertEqual(EventRollup.objects.filter(granularity="day").aggregate(total=Sum("count"))["total"], 2)
+
+
+class CompactEventsCommandTests(TestCase):
+    def setUp(self):
+        old = timezone.now() - timedelta(days=40)
+        Event.objects.bulk_create(
+            [
+                Event(event_type="page_view", page="/", session_id="a", timestamp=old),
+                Event(event_type="page_view", page="/", session_id="a", timestamp=old),
+                Event(event_type="page_view", page="/", session_id="b", timestamp=old),
+                Event(event_type="page_view", page="/", session_id="c", timestamp=timezone.now()),
+            ]
+        )
+
+    def test_dry_run_reports_without_deleting(self):
+        out = StringIO()
+        call_command("compact_events", "--days", "30", "--dry-run", stdout=out)
+
+        self.assertIn("3 event(s)", out.getvalue())
+        self.assertEqual(Event.objects.count(), 4)
+        self.assertFalse(EventDailySummary.objects.exists())
+
+    def test_compaction_keeps_daily_counts_and_sessions(self):
+        call_command("compact_events", "--days", "30", "--batch-size", "2", stdout=StringIO())
+
+        self.assertEqual(Event.objects.count(), 1)
+        summary = EventDailySummary.objects.get()
+        self.assertEqual((summary.events, summary.sessions), (3, 2))
@@ -0,0 +1,50 @@
+import json
+import tempfile
+import time
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from core.models import Event, EventSpoolSegment
+from core.spool import EventSpool
+
+
+class EventSpoolTests(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.spool_settings = {**settings.EVENT_SPOOL, "enabled": True, "directory": Path(self.tmp.name)}
+
+    def test_track_api_appends_to_spool_instead_of_inserting(self):
+        with override_settings(EVENT_SPOOL=self.spool_settings):
+            response = self.client.post(
+                reverse("core:api_track"),
+                data=json.dumps({"event_type": "page_view", "page": "/", "session_id": "s1"}),
+                content_type="application/json",
+            )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Event.objects.count(), 0)
+        lines = [line for path in Path(self.tmp.name).iterdir() for line in path.read_text().splitlines()]
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])["event_type"], "page_view")
+
+    def test_loader_is_idempotent_and_skips_torn_lines(self):
+        spool = EventSpool(Path(self.tmp.name), rotate_seconds=60)
+        spool.append([{"event_type": "page_view", "page": "/", "timestamp": "2026-01-01T10:00:00+00:00"}] * 3)
+        segment = next(Path(self.tmp.name).iterdir())
+        with segment.open("a") as handle:
+            handle.write('{"event_type": "cta_cl')
+
+        with override_settings(EVENT_SPOOL=self.spool_settings), patch("core.spool.time.time", return_value=time.time() + 120):
+            call_command("load_event_spool", "--batch-size", "2", "--keep-files", stdout=StringIO())
+            call_command("load_event_spool", "--keep-files", stdout=StringIO())
+
+        self.assertEqual(Event.objects.count(), 3)
+        self.assertIsNotNone(EventSpoolSegment.objects.get(name=segment.name).completed_at)
+
@@ -0,0 +1,103 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.models import BlogCategory, BlogPost, BlogTag, Service
+
+
+@override_settings(SITE_URL="http://testserver")
+class ExportStaticSiteTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.service = Service.objects.create(
+            name="Paint Protection Film",
+            slug="ppf",
+            description="Descriere",
+            short_description="Short",
+            category="ppf",
+        )
+        cls.post = BlogPost.objects.create(
+            title="Ghid PPF",
+            slug="ghid-ppf",
+            summary="Rezumat",
+            content="Continut articol",
+            is_published=True,
+            published_at=timezone.now(),
+        )
+        cls.category = BlogCategory.objects.create(name="Protectie", slug="protectie")
+        cls.post.categories.add(cls.category)
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.directory = Path(self.tmp.name)
+
+    def export(self) -> str:
+        output = StringIO()
+        call_command("export_static_site", directory=str(self.directory), stdout=output, stderr=StringIO())
+        return output.getvalue()
+
+    def mtimes(self) -> dict[str, int]:
+        return {str(path.relative_to(self.directory)): path.stat().st_mtime_ns for path in self.directory.rglob("*") if path.is_file()}
+
+    def test_exports_public_pages_but_not_dynamic_routes(self):
+        self.export()
+
+        self.assertIn("Protectie auto", (self.directory / "index.html").read_text())
+        self.assertIn(self.service.name, (self.directory / "services/ppf/index.html").read_text())
+        self.assertIn(self.post.title, (self.directory / "blog/ghid-ppf/index.html").read_text())
+        self.assertTrue((self.directory / "robots.txt").exists())
+        self.assertFalse((self.directory / "contact").exists())
+        self.assertFalse((self.directory / "api").exists())
+        self.assertIn("/blog/ghid-ppf/", json.loads((self.directory / ".export-manifest.json").read_text()))
+
+    def test_second_export_renders_only_changed_pages(self):
+        self.export()
+        self.assertIn("0 rendered", self.export())
+
+        before = self.mtimes()
+        self.post.title = "Ghid PPF actualizat"
+        self.post.save()
+        self.export()
+        after = self.mtimes()
+
+        changed = {path for path in after if after[path] != before.get(path)}
+        self.assertIn("blog/ghid-ppf/index.html", changed)
+        self.assertIn("blog/index.html", changed)
+        self.assertIn("index.html", changed)
+        self.assertNotIn("services/ppf/index.html", changed)
+        self.assertNotIn("services/index.html", changed)
+
+    def test_renamed_category_and_new_tag_rerender_the_post(self):
+        self.export()
+
+        before = self.mtimes()
+        self.category.name = "Folie PPF"
+        self.category.save()
+        self.export()
+        after = self.mtimes()
+
+        changed = {path for path in after if after[path] != before.get(path)}
+        self.assertIn("blog/ghid-ppf/index.html", changed)
+        self.assertIn("blog/index.html", changed)
+        self.assertNotIn("services/ppf/index.html", changed)
+        self.assertIn("Folie PPF", (self.directory / "blog/ghid-ppf/index.html").read_text())
+
+        self.post.tags.add(BlogTag.objects.create(name="Ceramica", slug="ceramica"))
+        self.export()
+        self.assertNotEqual(self.mtimes()["blog/ghid-ppf/index.html"], after["blog/ghid-ppf/index.html"])
+        self.assertIn("Ceramica", (self.directory / "blog/ghid-ppf/index.html").read_text())
+
+    def test_unpublished_post_page_is_removed(self):
+        self.export()
+        self.post.is_published = False
+        self.post.save()
+
+        output = self.export()
+        self.assertIn("1 removed", output)
+        self.assertFalse((self.directory / "blog/ghid-ppf/index.html").exists())
@@ -0,0 +1,122 @@
+import json
+
+from django.test import AsyncRequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from core.models import Event
+from core.throttling import TokenBucketLimiter, limiter
+from core.views import AsyncTrackEventBatchView, AsyncTrackEventView
+
+TIGHT_LIMITS = {
+    "enabled": True,
+    "max_keys": 100,
+    "scopes": {"track": {"rate": 0.001, "burst": 3}, "contact": {"rate": 0.001, "burst": 1}},
+}
+
+
+class TokenBucketLimiterTests(SimpleTestCase):
+    def test_allows_burst_then_reports_wait(self):
+        buckets = TokenBucketLimiter(max_keys=10)
+
+        self.assertEqual([buckets.consume("a", rate=1.0, burst=2, now=0.0) for _ in range(2)], [0.0, 0.0])
+        self.assertAlmostEqual(buckets.consume("a", rate=1.0, burst=2, now=0.0), 1.0)
+        self.assertEqual(buckets.consume("a", rate=1.0, burst=2, now=1.5), 0.0)
+
+    def test_cost_spends_several_tokens(self):
+        buckets = TokenBucketLimiter(max_keys=10)
+
+        self.assertEqual(buckets.consume("a", rate=1.0, burst=10, cost=8, now=0.0), 0.0)
+        self.assertAlmostEqual(buckets.consume("a", rate=1.0, burst=10, cost=5, now=0.0), 3.0)
+
+    def test_rejected_request_spends_no_bucket(self):
+        buckets = TokenBucketLimiter(max_keys=10)
+        buckets.consume("session", rate=1.0, burst=2, cost=2, now=0.0)
+
+        self.assertAlmostEqual(buckets.consume_all(["ip", "session"], rate=1.0, burst=2, now=0.0), 1.0)
+        self.assertEqual(buckets.consume("ip", rate=1.0, burst=2, cost=2, now=0.0), 0.0)
+
+    def test_evicts_least_recently_used_keys(self):
+        buckets = TokenBucketLimiter(max_keys=2)
+        buckets.consume("a", rate=1.0, burst=1, now=0.0)
+        buckets.consume("b", rate=1.0, burst=1, now=0.0)
+        buckets.consume("c", rate=1.0, burst=1, now=0.0)
+
+        self.assertEqual(list(buckets._buckets), ["b", "c"])
+
+
+@override_settings(RATE_LIMIT=TIGHT_LIMITS)
+class RateLimitApiTests(TestCase):
+    def setUp(self):
+        limiter.clear()
+
+    def tearDown(self):
+        limiter.clear()
+
+    def test_batch_counts_each_event_against_the_bucket(self):
+        payload = {"events": [{"event_type": "page_view", "page": "/"}] * 3}
+        first = self.client.post(reverse("core:api_track_batch"), data=json.dumps(payload), content_type="application/json")
+        second = self.client.post(
+            reverse("core:api_track"), data=json.dumps({"event_type": "page_view", "page": "/"}), content_type="application/json"
+        )
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(second.status_code, 429)
+        self.assertIn("Retry-After", second)
+        self.assertEqual(Event.objects.count(), 3)
+
+    def test_batch_larger_than_burst_can_still_succeed(self):
+        payload = {"events": [{"event_type": "page_view", "page": "/"}] * 5}
+        response = self.client.post(reverse("core:api_track_batch"), data=json.dumps(payload), content_type="application/json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Event.objects.count(), 5)
+
+    def test_client_supplied_forwarded_for_is_ignored(self):
+        payload = json.dumps({"event_type": "page_view", "page": "/"})
+        statuses = [
+            self.client.post(
+                reverse("core:api_track"), data=payload, content_type="application/json", HTTP_X_FORWARDED_FOR=f"10.0.0.{i}"
+            ).status_code
+            for i in range(4)
+        ]
+
+        self.assertEqual(statuses, [201, 201, 201, 429])
+
+    def test_session_bucket_applies_across_addresses(self):
+        payload = json.dumps({"event_type": "page_view", "page": "/", "session_id": "s-1"})
+        statuses = [
+            self.client.post(reverse("core:api_track"), data=payload, content_type="application/json", REMOTE_ADDR=f"10.0.0.{i}").status_code
+            for i in range(4)
+        ]
+
+        self.assertEqual(statuses, [201, 201, 201, 429])
+
+    def test_contact_scope_is_independent(self):
+        self.client.post(
+            reverse("core:api_track_batch"),
+            data=json.dumps({"events": [{"event_type": "page_view", "page": "/"}] * 3}),
+            content_type="application/json",
+        )
+        payload = json.dumps({"name": "Ana", "email": "ana@example.com", "phone": "0700000000", "subject": "PPF", "message": "As dori o programare pentru PPF."})
+
+        self.assertEqual(self.client.post(reverse("core:api_contact"), data=payload, content_type="application/json").status_code, 201)
+        self.assertEqual(self.client.post(reverse("core:api_contact"), data=payload, content_type="application/json").status_code, 429)
+
+    async def test_async_view_returns_429_with_retry_after(self):
+        payload = json.dumps({"events": [{"event_type": "page_view", "page": "/"}] * 2})
+        statuses = []
+        for _ in range(2):
+            request = AsyncRequestFactory().post("/api/track/batch/", data=payload, content_type="application/json")
+            response = await AsyncTrackEventBatchView.as_view()(request)
+            statuses.append(response.status_code)
+
+        self.assertEqual(statuses, [201, 429])
+        self.assertTrue(int(response["Retry-After"]) > 0)
+
+    async def test_async_view_throttles_malformed_bodies(self):
+        statuses = []
+        for _ in range(4):
+            request = AsyncRequestFactory().post("/api/track/", data="{not json", content_type="application/json")
+            statuses.append((await AsyncTrackEventView.as_view()(request)).status_code)
+
+        self.assertEqual(statuses, [400, 400, 400, 429])
@@ -1,8 +1,8 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 
-from core.models import BlogPost, Service
+from core.models import BlogCategory, BlogPost, GalleryItem, Service
 
 
 class ViewTests(TestCase):
@@ -47,3 +47,76 @@ class ViewTests(TestCase):
     def test_django_admin_not_exposed(self):
         response = self.client.get("/admin/")
         self.assertEqual(response.status_code, 404)
+
+
+# Checks the views themselves; cached responses are covered in test_response_cache.
+@override_settings(RESPONSE_CACHE={"enabled": False, "timeout": 0})
+class ConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.service = Service.objects.create(
+            name="Paint Protection Film",
+            slug="ppf",
+            description="Descriere",
+            short_description="Short",
+            category="ppf",
+        )
+        cls.post = BlogPost.objects.create(
+            title="Ghid PPF",
+            slug="ghid-ppf",
+            summary="Rezumat",
+            content="Continut articol",
+            is_published=True,
+            published_at=timezone.now(),
+        )
+
+    def assert_revalidates(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.has_header("ETag"))
+        with self.assertNumQueries(1):
+            cached = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.content, b"")
+        return response["ETag"]
+
+    def test_content_pages_and_api_return_not_modified(self):
+        for url in (
+            reverse("core:service_detail", kwargs={"slug": self.service.slug}),
+            reverse("core:blog_list"),
+            reverse("core:blog_detail", kwargs={"slug": self.post.slug}),
+            "/api/blog/posts/",
+            f"/api/blog/posts/{self.post.slug}/",
+        ):
+            with self.subTest(url=url):
+                self.assert_revalidates(url)
+
+    def test_if_modified_since_alone_never_returns_not_modified(self):
+        # Last-Modified has one-second resolution and would hide a second edit within that second.
+        url = reverse("core:blog_detail", kwargs={"slug": self.post.slug})
+        self.assertFalse(self.client.get(url).has_header("Last-Modified"))
+        cached = self.client.get(url, HTTP_IF_MODIFIED_SINCE="Thu, 01 Jan 2099 00:00:00 GMT")
+        self.assertEqual(cached.status_code, 200)
+
+    def test_edits_change_the_validators(self):
+        blog_url = reverse("core:blog_list")
+        etag = self.assert_revalidates(blog_url)
+        BlogPost.objects.create(title="Ceramic", slug="ceramic", summary="Rezumat", content="Text", is_published=True)
+        self.assertEqual(self.client.get(blog_url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        category = BlogCategory.objects.create(name="Ghiduri", slug="ghiduri")
+        self.post.categories.add(category)
+        detail_url = reverse("core:blog_detail", kwargs={"slug": self.post.slug})
+        etag = self.assert_revalidates(detail_url)
+        category.name = "Ghiduri PPF"
+        category.save()
+        self.assertEqual(self.client.get(detail_url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        service_url = reverse("core:service_detail", kwargs={"slug": self.service.slug})
+        etag = self.assert_revalidates(service_url)
+        GalleryItem.objects.create(title="Lucrare", related_service=self.service)
+        self.assertEqual(self.client.get(service_url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_unknown_slug_still_returns_404(self):
+        response = self.client.get(reverse("core:blog_detail", kwargs={"slug": "missing"}))
+        self.assertEqual(response.status_code, 404)
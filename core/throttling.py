@@ -0,0 +1,104 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from django.conf import settings
+from rest_framework.throttling import BaseThrottle
+
+from . import metrics
+from .ingest import request_body_too_large
+
+
+class TokenBucketLimiter:
+    """Token buckets in a bounded LRU map.
+
+    A bucket idle for ``burst / rate`` seconds is full again and can be forgotten safely.
+    Once more than ``max_keys`` clients are active at the same time, though, a limited
+    client's bucket may be evicted and start over full; size ``max_keys`` above the number
+    of concurrently active clients.
+    """
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, key: str, rate: float, burst: int, cost: int = 1, now: float | None = None) -> float:
+        """Take ``cost`` tokens; return 0 when allowed, otherwise the seconds until they are available."""
+        return self.consume_all([key], rate, burst, cost, now)
+
+    def consume_all(self, keys: list[str], rate: float, burst: int, cost: int = 1, now: float | None = None) -> float:
+        """Take ``cost`` tokens from every bucket in ``keys``, or from none of them.
+
+        Returns 0 when every bucket had enough tokens, otherwise the longest wait.
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            refilled = {}
+            for key in keys:
+                tokens, updated = self._buckets.pop(key, (float(burst), now))
+                refilled[key] = min(float(burst), tokens + (now - updated) * rate)
+            wait = 0.0
+            for tokens in refilled.values():
+                if tokens < cost:
+                    wait = max(wait, (cost - tokens) / rate if rate > 0 else float("inf"))
+            for key, tokens in refilled.items():
+                self._buckets[key] = (tokens if wait else tokens - cost, now)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return wait
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+limiter = TokenBucketLimiter(settings.RATE_LIMIT["max_keys"])
+
+
+def request_session_id(data: Any) -> str:
+    if isinstance(data, dict) and isinstance(data.get("events"), list):
+        data = data["events"]
+    if isinstance(data, list):
+        data = data[0] if data else {}
+    session_id = data.get("session_id") if isinstance(data, dict) else None
+    return session_id[:128] if isinstance(session_id, str) else ""
+
+
+def request_cost(data: Any) -> int:
+    events = data.get("events") if isinstance(data, dict) else data
+    return max(1, len(events)) if isinstance(events, list) else 1
+
+
+def check_rate_limit(scope: str, ident: str, data: Any = None) -> float:
+    """Return 0 if the request may proceed, else the number of seconds to wait.
+
+    The client IP and, when present, the payload ``session_id`` each get a bucket, so
+    rotating session ids from one address does not escape the limit. Tokens are only
+    spent when every bucket allows the request. A batch never costs more than ``burst``,
+    which a full bucket can always pay.
+    """
+    config = settings.RATE_LIMIT
+    rule = config["scopes"].get(scope)
+    if not config["enabled"] or rule is None:
+        return 0.0
+    cost = min(request_cost(data), rule["burst"])
+    keys = [f"{scope}:ip:{ident}"]
+    session_id = request_session_id(data)
+    if session_id:
+        keys.append(f"{scope}:session:{session_id}")
+    wait = limiter.consume_all(keys, rule["rate"], rule["burst"], cost)
+    if wait:
+        metrics.incr(f"ratelimit.{scope}.rejected")
+    return wait
+
+
+class TokenBucketThrottle(BaseThrottle):
+    def allow_request(self, request, view) -> bool:
+        data = None if request_body_too_large(request) else request.data
+        self.wait_seconds = check_rate_limit(getattr(view, "throttle_scope", ""), self.get_ident(request), data)
+        return not self.wait_seconds
+
+    def wait(self) -> float:
+        return self.wait_seconds
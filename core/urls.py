@@ -1,9 +1,13 @@
+from django.conf import settings
 from django.urls import include, path
 from django.views.generic import TemplateView
 from rest_framework.routers import DefaultRouter
 
 from .views import (
     AboutView,
+    AsyncContactSubmissionView,
+    AsyncTrackEventBatchView,
+    AsyncTrackEventView,
     BlogDetailView,
     BlogListView,
     ContactSubmissionAPIView,
@@ -15,11 +19,21 @@ from .views import (
     ServiceListView,
     TestimonialListView,
     TrackEventAPIView,
+    TrackEventBatchAPIView,
     robots_txt,
 )
 
 app_name = "core"
 
+if settings.ASYNC_API_VIEWS:
+    track_view = AsyncTrackEventView.as_view()
+    track_batch_view = AsyncTrackEventBatchView.as_view()
+    contact_api_view = AsyncContactSubmissionView.as_view()
+else:
+    track_view = TrackEventAPIView.as_view()
+    track_batch_view = TrackEventBatchAPIView.as_view()
+    contact_api_view = ContactSubmissionAPIView.as_view()
+
 router = DefaultRouter()
 router.register("blog/posts", PublishedBlogPostViewSet, basename="blog-post")
 
@@ -35,7 +49,8 @@ urlpatterns = [
     path("testimonials/", TestimonialListView.as_view(), name="testimonials"),
     path("privacy/", TemplateView.as_view(template_name="core/privacy.html"), name="privacy"),
     path("robots.txt", robots_txt, name="robots_txt"),
-    path("api/track/", TrackEventAPIView.as_view(), name="api_track"),
-    path("api/contact/", ContactSubmissionAPIView.as_view(), name="api_contact"),
+    path("api/track/", track_view, name="api_track"),
+    path("api/track/batch/", track_batch_view, name="api_track_batch"),
+    path("api/contact/", contact_api_view, name="api_contact"),
     path("api/", include(router.urls)),
 ]
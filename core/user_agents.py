@@ -0,0 +1,89 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import partial
+
+from asgiref.sync import sync_to_async
+
+from django.conf import settings
+from django.db import transaction
+
+from .models import UserAgent
+
+
+def user_agent_digest(value: str) -> str:
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class LRUCache:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> int | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: int) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+user_agent_ids = LRUCache(settings.EVENT_INGEST["user_agent_cache_size"])
+
+
+def _split_cached(values: set[str]) -> tuple[dict[str, int], dict[str, str]]:
+    resolved: dict[str, int] = {}
+    missing: dict[str, str] = {}
+    for value in values:
+        if not value:
+            continue
+        digest = user_agent_digest(value)
+        cached = user_agent_ids.get(digest)
+        if cached is None:
+            missing[digest] = value
+        else:
+            resolved[value] = cached
+    return resolved, missing
+
+
+def _remember(rows: list[tuple[str, int]]) -> None:
+    for digest, pk in rows:
+        user_agent_ids.put(digest, pk)
+
+
+def _create_missing(missing: dict[str, str]) -> dict[str, int]:
+    UserAgent.objects.bulk_create(
+        [UserAgent(digest=digest, value=value) for digest, value in missing.items()],
+        ignore_conflicts=True,
+    )
+    rows = list(UserAgent.objects.filter(digest__in=missing).values_list("digest", "id"))
+    # Only cache ids once they are committed, so a rolled back insert never leaves a
+    # dangling id in the process-wide cache.
+    transaction.on_commit(partial(_remember, rows))
+    return {missing[digest]: pk for digest, pk in rows}
+
+
+def intern_user_agents(values: set[str]) -> dict[str, int]:
+    resolved, missing = _split_cached(values)
+    if missing:
+        resolved.update(_create_missing(missing))
+    return resolved
+
+
+async def aintern_user_agents(values: set[str]) -> dict[str, int]:
+    resolved, missing = _split_cached(values)
+    if missing:
+        resolved.update(await sync_to_async(_create_missing)(missing))
+    return resolved
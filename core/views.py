@@ -1,20 +1,33 @@
+import abc
+import json
+import math
 from typing import Any
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.contrib import messages
 from django.core.mail import send_mail
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.urls import reverse_lazy
-from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_GET
 from django.views.generic import DetailView, FormView, ListView, TemplateView
 from rest_framework import permissions, status, viewsets
+from rest_framework.exceptions import APIException, ParseError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from . import metrics
+from .bots import filter_bot_request
+from .caching import cached_rows, content_versions
+from .conditional import content_condition, published_posts, service_page
 from .forms import ContactForm
-from .models import BlogPost, Event, GalleryItem, Service, Testimonial
-from .serializers import BlogPostSerializer, ContactSerializer, EventSerializer
+from .ingest import arecord_events, record_events, request_body_too_large, validate_event, validate_event_batch
+from .models import BlogPost, ContactMessage, GalleryItem, Service, Testimonial
+from .serializers import BlogPostSerializer, ContactSerializer
+from .throttling import TokenBucketThrottle, check_rate_limit
 
 
 SERVICE_FAQS = {
@@ -37,15 +50,42 @@ SERVICE_FAQS = {
 }
 
 
+def send_contact_notification(message: ContactMessage, source: str) -> None:
+    send_mail(
+        subject=f"[{source}] {message.subject}",
+        message=(
+            f"Nume: {message.name}\n"
+            f"Email: {message.email}\n"
+            f"Telefon: {message.phone}\n"
+            f"Mesaj:\n{message.message}"
+        ),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        recipient_list=[settings.CONTACT_EMAIL],
+        fail_silently=True,
+    )
+
+
 class HomeView(TemplateView):
     template_name = "core/home.html"
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
-        context["services"] = Service.objects.filter(is_featured=True)[:4]
-        context["testimonials"] = Testimonial.objects.filter(is_featured=True)[:6]
-        context["recent_posts"] = BlogPost.objects.filter(is_published=True)[:3]
-        context["gallery_highlights"] = GalleryItem.objects.filter(is_featured=True)[:6]
+        versions = content_versions(Service, Testimonial, BlogPost, GalleryItem)
+        # Callables are only evaluated by the template when the matching fragment cache misses.
+        context["services"] = lambda: cached_rows(
+            "home:services", versions["service"], Service.objects.filter(is_featured=True)[:4]
+        )
+        context["testimonials"] = lambda: cached_rows(
+            "home:testimonials", versions["testimonial"], Testimonial.objects.filter(is_featured=True)[:6]
+        )
+        context["recent_posts"] = lambda: cached_rows(
+            "home:recent_posts", versions["blogpost"], BlogPost.objects.filter(is_published=True)[:3]
+        )
+        context["gallery_highlights"] = lambda: cached_rows(
+            "home:gallery_highlights", versions["galleryitem"], GalleryItem.objects.filter(is_featured=True)[:6]
+        )
+        context["content_versions"] = versions
+        context["content_cache_timeout"] = settings.CONTENT_CACHE["timeout"]
         return context
 
 
@@ -55,6 +95,7 @@ class ServiceListView(ListView):
     queryset = Service.objects.all()
 
 
+@method_decorator(content_condition(service_page), name="get")
 class ServiceDetailView(DetailView):
     template_name = "core/service_detail.html"
     context_object_name = "service"
@@ -87,6 +128,7 @@ class AboutView(TemplateView):
     template_name = "core/about.html"
 
 
+@method_decorator(content_condition(published_posts), name="get")
 class BlogListView(ListView):
     template_name = "core/blog_list.html"
     context_object_name = "posts"
@@ -103,6 +145,7 @@ class BlogListView(ListView):
         return queryset.distinct()
 
 
+@method_decorator(content_condition(published_posts), name="get")
 class BlogDetailView(DetailView):
     template_name = "core/blog_detail.html"
     context_object_name = "post"
@@ -123,18 +166,7 @@ class ContactView(FormView):
 
     def form_valid(self, form: ContactForm):
         message = form.save()
-        send_mail(
-            subject=f"[Website] {message.subject}",
-            message=(
-                f"Nume: {message.name}\n"
-                f"Email: {message.email}\n"
-                f"Telefon: {message.phone}\n"
-                f"Mesaj:\n{message.message}"
-            ),
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[settings.CONTACT_EMAIL],
-            fail_silently=True,
-        )
+        send_contact_notification(message, "Website")
 
         if self.request.headers.get("x-requested-with") == "XMLHttpRequest":
             return JsonResponse({"status": "ok", "message": "Mesaj trimis cu succes."}, status=201)
@@ -168,39 +200,126 @@ def robots_txt(_: HttpRequest) -> HttpResponse:
 class TrackEventAPIView(APIView):
     permission_classes = [permissions.AllowAny]
     authentication_classes = []
+    throttle_classes = [TokenBucketThrottle]
+    throttle_scope = "track"
 
     def post(self, request: HttpRequest) -> Response:
-        payload = request.data.copy()
-        payload.setdefault("user_agent", request.META.get("HTTP_USER_AGENT", ""))
-        serializer = EventSerializer(data=payload)
-        serializer.is_valid(raise_exception=True)
-        serializer.save(timestamp=timezone.now())
+        if filter_bot_request(request.META.get("HTTP_USER_AGENT", "")):
+            return Response({"status": "ignored"}, status=status.HTTP_202_ACCEPTED)
+        if request_body_too_large(request):
+            return Response({"detail": "Request body too large."}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        record_events([validate_event(request.data, request.META.get("HTTP_USER_AGENT", ""))])
         return Response({"status": "tracked"}, status=status.HTTP_201_CREATED)
 
 
+class TrackEventBatchAPIView(APIView):
+    permission_classes = [permissions.AllowAny]
+    authentication_classes = []
+    throttle_classes = [TokenBucketThrottle]
+    throttle_scope = "track"
+
+    def post(self, request: HttpRequest) -> Response:
+        if filter_bot_request(request.META.get("HTTP_USER_AGENT", "")):
+            return Response({"status": "ignored"}, status=status.HTTP_202_ACCEPTED)
+        if request_body_too_large(request):
+            return Response({"detail": "Request body too large."}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        events = validate_event_batch(request.data, request.META.get("HTTP_USER_AGENT", ""))
+        record_events(events)
+        return Response({"status": "tracked", "count": len(events)}, status=status.HTTP_201_CREATED)
+
+
 class ContactSubmissionAPIView(APIView):
     permission_classes = [permissions.AllowAny]
     authentication_classes = []
+    throttle_classes = [TokenBucketThrottle]
+    throttle_scope = "contact"
 
     def post(self, request: HttpRequest) -> Response:
         serializer = ContactSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         contact = serializer.save()
-        send_mail(
-            subject=f"[Website API] {contact.subject}",
-            message=(
-                f"Nume: {contact.name}\n"
-                f"Email: {contact.email}\n"
-                f"Telefon: {contact.phone}\n"
-                f"Mesaj:\n{contact.message}"
-            ),
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[settings.CONTACT_EMAIL],
-            fail_silently=True,
-        )
+        send_contact_notification(contact, "Website API")
         return Response({"status": "ok", "id": contact.id}, status=status.HTTP_201_CREATED)
 
 
+def parse_json_body(request: HttpRequest) -> Any:
+    try:
+        return json.loads(request.body)
+    except ValueError as exc:
+        raise ParseError(f"JSON parse error - {exc}") from exc
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncAPIView(abc.ABC, View):
+    http_method_names = ["post", "options"]
+    throttle_scope = ""
+
+    async def post(self, request: HttpRequest) -> JsonResponse:
+        try:
+            data, parse_error = None, None
+            if not request_body_too_large(request):
+                try:
+                    data = parse_json_body(request)
+                except ParseError as exc:
+                    # Malformed bodies still spend a token from the client's IP bucket.
+                    parse_error = exc
+            wait = check_rate_limit(self.throttle_scope, TokenBucketThrottle().get_ident(request), data)
+            if wait:
+                response = JsonResponse({"detail": f"Request was throttled. Expected available in {math.ceil(wait)} seconds."}, status=status.HTTP_429_TOO_MANY_REQUESTS)
+                response["Retry-After"] = str(math.ceil(wait))
+                return response
+            if parse_error is not None:
+                raise parse_error
+            return await self.handle(request, data)
+        except APIException as exc:
+            detail = exc.detail if isinstance(exc.detail, (dict, list)) else {"detail": exc.detail}
+            return JsonResponse(detail, status=exc.status_code, safe=False)
+        finally:
+            await metrics.aflush_if_due()
+
+    @abc.abstractmethod
+    async def handle(self, request: HttpRequest, data: Any) -> JsonResponse:
+        """Answer a request that passed the rate limit; ``data`` is ``None`` when the body was too large."""
+
+
+class AsyncTrackEventView(AsyncAPIView):
+    throttle_scope = "track"
+
+    async def handle(self, request: HttpRequest, data: Any) -> JsonResponse:
+        if filter_bot_request(request.META.get("HTTP_USER_AGENT", "")):
+            return JsonResponse({"status": "ignored"}, status=status.HTTP_202_ACCEPTED)
+        if data is None:
+            return JsonResponse({"detail": "Request body too large."}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        event = validate_event(data, request.META.get("HTTP_USER_AGENT", ""))
+        await arecord_events([event])
+        return JsonResponse({"status": "tracked"}, status=status.HTTP_201_CREATED)
+
+
+class AsyncTrackEventBatchView(AsyncAPIView):
+    throttle_scope = "track"
+
+    async def handle(self, request: HttpRequest, data: Any) -> JsonResponse:
+        if filter_bot_request(request.META.get("HTTP_USER_AGENT", "")):
+            return JsonResponse({"status": "ignored"}, status=status.HTTP_202_ACCEPTED)
+        if data is None:
+            return JsonResponse({"detail": "Request body too large."}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        events = validate_event_batch(data, request.META.get("HTTP_USER_AGENT", ""))
+        await arecord_events(events)
+        return JsonResponse({"status": "tracked", "count": len(events)}, status=status.HTTP_201_CREATED)
+
+
+class AsyncContactSubmissionView(AsyncAPIView):
+    throttle_scope = "contact"
+
+    async def handle(self, request: HttpRequest, data: Any) -> JsonResponse:
+        serializer = ContactSerializer(data=data)
+        serializer.is_valid(raise_exception=True)
+        contact = await ContactMessage.objects.acreate(**serializer.validated_data)
+        await sync_to_async(send_contact_notification, thread_sensitive=False)(contact, "Website API")
+        return JsonResponse({"status": "ok", "id": contact.id}, status=status.HTTP_201_CREATED)
+
+
+@method_decorator(content_condition(published_posts), name="dispatch")
 class PublishedBlogPostViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = BlogPostSerializer
     permission_classes = [permissions.AllowAny]
@@ -1,14 +1,30 @@
 import hmac
+import json
+import logging
 import os
-from datetime import datetime
+import tempfile
+from datetime import datetime, timedelta
 from urllib.parse import quote, unquote
+from zoneinfo import ZoneInfo
 
-import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from dash import Dash, Input, Output, dcc, html
-from flask import redirect, render_template_string, request, session
-from sqlalchemy import create_engine, text
+from dash.exceptions import PreventUpdate
+from flask import Response, redirect, render_template_string, request, session, stream_with_context
+from sqlalchemy import create_engine
+
+from columnar import ColumnarEventStore
+from downsample import downsample_frame, uses_webgl
+from funnels import SESSION_GAP_MINUTES, load_funnel
+from live import EventFeed
+from queries import CONTACT_EVENT_TYPES, DASH_TIME_ZONE, DEFAULT_TIME_WINDOW, TIME_WINDOWS, EventSummary, load_event_summary, window_start
+from result_cache import ResultCache
+from retention import RetentionAnalyzer
+from timing import install as install_query_timing
+from timing import timed_callback
+from window import EventWindow
 
 
 def get_database_url() -> str:
@@ -19,11 +35,39 @@ def get_database_url() -> str:
     return url
 
 
-ENGINE = create_engine(get_database_url())
+def create_dashboard_engine(url: str):
+    if not url.startswith("postgresql"):
+        return create_engine(url)
+    # Sized per worker process: gunicorn workers x (pool size + overflow) must fit under max_connections.
+    statement_timeout_ms = int(os.getenv("DASH_DB_STATEMENT_TIMEOUT_MS", "15000"))
+    return create_engine(
+        url,
+        pool_size=int(os.getenv("DASH_DB_POOL_SIZE", "5")),
+        max_overflow=int(os.getenv("DASH_DB_MAX_OVERFLOW", "5")),
+        pool_timeout=float(os.getenv("DASH_DB_POOL_TIMEOUT", "10")),
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        connect_args={"options": f"-c statement_timeout={statement_timeout_ms}"},
+    )
+
+
+logging.basicConfig(level=os.getenv("DASH_LOG_LEVEL", "INFO"), format="%(asctime)s %(levelname)s %(name)s %(message)s")
+ENGINE = create_dashboard_engine(get_database_url())
+install_query_timing(ENGINE)
 DASH_USER = os.getenv("OWNER_DASH_USERNAME", "owner")
 DASH_PASSWORD = os.getenv("OWNER_DASH_PASSWORD", "change-me")
 DASH_SESSION_SECRET = os.getenv("DASH_SESSION_SECRET", os.getenv("SECRET_KEY", "change-me-dash-secret"))
 DASH_URL_BASE_PATHNAME = os.getenv("DASH_URL_BASE_PATHNAME", "/")
+RESULT_CACHE = ResultCache(
+    os.getenv("DASH_CACHE_DIR", os.path.join(tempfile.gettempdir(), "premiere-dash-cache")),
+    ttl=float(os.getenv("DASH_CACHE_TTL_SECONDS", "55")),
+)
+COLUMNAR_STORE = ColumnarEventStore(os.environ["DASH_COLUMNAR_DIR"]) if os.getenv("DASH_COLUMNAR_DIR") else None
+RETENTION = RetentionAnalyzer(ENGINE, COLUMNAR_STORE, RESULT_CACHE.directory / "retention_cohorts.json")
+LIVE_FEED = EventFeed(ENGINE, poll_seconds=float(os.getenv("DASH_LIVE_POLL_SECONDS", "2")))
+DASH_LIVE_DEFAULT = os.getenv("DASH_LIVE_DEFAULT", "True").lower() == "true"
+DASH_LIVE_RESYNC_SECONDS = int(os.getenv("DASH_LIVE_RESYNC_SECONDS", "600"))
+EVENT_WINDOW = EventWindow(ENGINE, timedelta(hours=int(os.getenv("DASH_MEMORY_WINDOW_HOURS", "168"))))
 
 
 def normalize_base_path(path_value: str) -> str:
@@ -46,25 +90,21 @@ os.environ.pop("DASH_URL_BASE_PATHNAME", None)
 os.environ.pop("DASH_REQUESTS_PATHNAME_PREFIX", None)
 os.environ.pop("DASH_ROUTES_PATHNAME_PREFIX", None)
 
-def load_events_df() -> pd.DataFrame:
-    query = text(
-        """
-        SELECT event_type, element, page, timestamp
-        FROM core_event
-        ORDER BY timestamp DESC
-        LIMIT 5000
-        """
-    )
+
+def load_summary(window: str) -> EventSummary:
+    if window not in TIME_WINDOWS:
+        window = DEFAULT_TIME_WINDOW
     try:
-        with ENGINE.connect() as conn:
-            df = pd.read_sql(query, conn)
+        if EVENT_WINDOW.covers(window):
+            EVENT_WINDOW.refresh()
+            return EVENT_WINDOW.summary(window)
+        if COLUMNAR_STORE is not None and COLUMNAR_STORE.load_manifest()["high_water_id"]:
+            COLUMNAR_STORE.export(ENGINE)
+            return COLUMNAR_STORE.summary(window)
+        return load_event_summary(ENGINE, window)
     except Exception:
-        df = pd.DataFrame(columns=["event_type", "element", "page", "timestamp"])
-
-    if not df.empty:
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
-        df["day"] = df["timestamp"].dt.date
-    return df
+        _, _, bucket = TIME_WINDOWS[window]
+        return EventSummary(window=window, bucket=bucket)
 
 
 app = Dash(
@@ -73,6 +113,7 @@ app = Dash(
     routes_pathname_prefix=DASH_BASE_PATH,
 )
 app.title = "Premiere Aesthetics Analytics"
+server = app.server
 app.server.secret_key = DASH_SESSION_SECRET
 app.server.config.update(
     SESSION_COOKIE_HTTPONLY=True,
@@ -238,6 +279,21 @@ METRIC_GRID_STYLE = {
     "marginBottom": "16px",
 }
 
+TAB_STYLE = {
+    "background": THEME["panel_soft"],
+    "border": f"1px solid {THEME['border']}",
+    "color": THEME["text_muted"],
+    "padding": "10px 16px",
+}
+
+TAB_SELECTED_STYLE = {
+    **TAB_STYLE,
+    "background": "rgba(179, 0, 27, 0.14)",
+    "borderTop": f"2px solid {THEME['accent']}",
+    "color": THEME["text"],
+    "fontWeight": "600",
+}
+
 GRAPH_GRID_STYLE = {
     "display": "grid",
     "gridTemplateColumns": "repeat(auto-fit, minmax(340px, 1fr))",
@@ -288,6 +344,17 @@ def dashboard_login():
     return render_template_string(LOGIN_TEMPLATE, error=error, next_path=next_path, login_path=LOGIN_PATH)
 
 
+@app.server.route(f"{DASH_BASE_PATH}live/events", methods=["GET"])
+def dashboard_live_events():
+    # EventSource resends the last frame id on reconnect; prefer it over the page's cursor.
+    after = request.headers.get("Last-Event-ID", type=int) or request.args.get("after", type=int)
+    return Response(
+        stream_with_context(LIVE_FEED.stream(after if after and after > 0 else None)),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.server.route(LOGOUT_PATH, methods=["GET"])
 def dashboard_logout():
     session.clear()
@@ -321,7 +388,7 @@ app.layout = html.Div(
                     },
                 ),
                 html.P(
-                    "Trafic, interactiuni si conversii. Date actualizate automat la fiecare 60 secunde.",
+                    "Trafic, interactiuni si conversii. Date actualizate live sau automat la fiecare 60 secunde.",
                     id="dashboardStatus",
                     style={"margin": 0, "color": THEME["text_muted"], "fontSize": "0.96rem"},
                 ),
@@ -349,16 +416,72 @@ app.layout = html.Div(
                 "padding": "18px 20px",
             },
         ),
-        dcc.Interval(id="refresh", interval=60_000, n_intervals=0),
-        html.Div(id="metrics", style=METRIC_GRID_STYLE),
+        dcc.Interval(id="refresh", interval=60_000, n_intervals=0, disabled=DASH_LIVE_DEFAULT),
+        # Live mode only: recompute what the streamed increments cannot, events leaving the window.
+        dcc.Interval(id="live_resync", interval=DASH_LIVE_RESYNC_SECONDS * 1000, n_intervals=0, disabled=not DASH_LIVE_DEFAULT),
         html.Div(
             [
-                html.Div([dcc.Graph(id="events_by_day", config={"displaylogo": False})], style=PANEL_STYLE),
-                html.Div([dcc.Graph(id="top_event_types", config={"displaylogo": False})], style=PANEL_STYLE),
+                html.Div(
+                    dcc.Dropdown(
+                        id="time_window",
+                        options=[{"label": label, "value": key} for key, (label, _, _) in TIME_WINDOWS.items()],
+                        value=DEFAULT_TIME_WINDOW,
+                        clearable=False,
+                        searchable=False,
+                        style={"color": "#111"},
+                    ),
+                    style={"width": "260px"},
+                ),
+                dcc.Checklist(
+                    id="live_mode",
+                    options=[{"label": " Live", "value": "live"}],
+                    value=["live"] if DASH_LIVE_DEFAULT else [],
+                    style={"color": THEME["text_muted"]},
+                ),
+                # Read by assets/live.js: last event id in the rendered figures and the window start.
+                html.Div(id="live_cursor", hidden=True, **{"data-contact-types": ",".join(CONTACT_EVENT_TYPES)}),
+            ],
+            style={"display": "flex", "alignItems": "center", "gap": "16px", "marginBottom": "16px"},
+        ),
+        dcc.Tabs(
+            id="dashboard_tabs",
+            value="overview",
+            children=[
+                dcc.Tab(
+                    label="Prezentare",
+                    value="overview",
+                    style=TAB_STYLE,
+                    selected_style=TAB_SELECTED_STYLE,
+                    children=[
+                        html.Div(id="metrics", style={**METRIC_GRID_STYLE, "marginTop": "16px"}),
+                        html.Div(
+                            [
+                                html.Div([dcc.Graph(id="events_by_day", config={"displaylogo": False})], style=PANEL_STYLE),
+                                html.Div([dcc.Graph(id="top_event_types", config={"displaylogo": False})], style=PANEL_STYLE),
+                            ],
+                            style=GRAPH_GRID_STYLE,
+                        ),
+                        html.Div([dcc.Graph(id="top_elements", config={"displaylogo": False})], style={**PANEL_STYLE, "marginTop": "16px"}),
+                        html.Div(
+                            [
+                                html.Div(id="session_metrics", style={**METRIC_GRID_STYLE, "marginBottom": "4px"}),
+                                dcc.Graph(id="funnel", config={"displaylogo": False}),
+                            ],
+                            style={**PANEL_STYLE, "marginTop": "16px"},
+                        ),
+                    ],
+                ),
+                dcc.Tab(
+                    label="Retentie",
+                    value="retention",
+                    style=TAB_STYLE,
+                    selected_style=TAB_SELECTED_STYLE,
+                    children=[
+                        html.Div([dcc.Graph(id="retention", config={"displaylogo": False})], style={**PANEL_STYLE, "marginTop": "16px"}),
+                    ],
+                ),
             ],
-            style=GRAPH_GRID_STYLE,
         ),
-        html.Div([dcc.Graph(id="top_elements", config={"displaylogo": False})], style={**PANEL_STYLE, "marginTop": "16px"}),
     ],
     style=APP_STYLE,
 )
@@ -370,62 +493,195 @@ app.layout = html.Div(
     Output("events_by_day", "figure"),
     Output("top_event_types", "figure"),
     Output("top_elements", "figure"),
+    Output("live_cursor", "children"),
+    Input("refresh", "n_intervals"),
+    Input("live_resync", "n_intervals"),
+    Input("time_window", "value"),
+)
+@timed_callback
+def refresh_dashboard(_, __, window):
+    if window not in TIME_WINDOWS:
+        window = DEFAULT_TIME_WINDOW
+    return tuple(RESULT_CACHE.get_or_compute({"view": "overview", "window": window}, lambda: build_dashboard(window)))
+
+
+@app.callback(
+    Output("session_metrics", "children"),
+    Output("funnel", "figure"),
+    Input("refresh", "n_intervals"),
+    Input("live_resync", "n_intervals"),
+    Input("time_window", "value"),
+)
+@timed_callback
+def refresh_funnel(_, __, window):
+    if window not in TIME_WINDOWS:
+        window = DEFAULT_TIME_WINDOW
+    return tuple(RESULT_CACHE.get_or_compute({"view": "funnel", "window": window}, lambda: build_funnel(window)))
+
+
+def build_funnel(window: str):
+    try:
+        result = load_funnel(ENGINE, window, COLUMNAR_STORE)
+    except Exception:
+        return [], empty_figure("Funnel indisponibil momentan.")
+
+    cards = [
+        metric_card("Vizitatori", format_number(result.visitors)),
+        metric_card("Vizite", format_number(result.visits), note=f"pauza > {SESSION_GAP_MINUTES} min = vizita noua"),
+        metric_card("Durata mediana vizita", f"{result.median_visit_seconds / 60:.1f} min".replace(".", ",")),
+    ]
+    if not result.visits:
+        return cards, empty_figure("Nu exista sesiuni in intervalul ales.")
+
+    frame = result.frame
+    fig = go.Figure(
+        go.Funnel(
+            y=frame["step"],
+            x=frame["visits"],
+            textinfo="value+percent initial+percent previous",
+            marker={"color": THEME["accent"], "line": {"color": "rgba(255,255,255,0.3)", "width": 1}},
+            customdata=frame["drop_off"],
+            hovertemplate="%{y}<br>%{x} vizite<br>Abandon fata de pasul anterior: %{customdata}<extra></extra>",
+        )
+    )
+    style_figure(fig, "Funnel Conversie pe Vizite")
+    fig.update_yaxes(automargin=True)
+    return cards, fig
+
+
+@app.callback(
+    Output("retention", "figure"),
+    Input("dashboard_tabs", "value"),
     Input("refresh", "n_intervals"),
+    Input("live_resync", "n_intervals"),
 )
-def refresh_dashboard(_):
-    df = load_events_df()
+@timed_callback
+def refresh_retention(tab, _, __):
+    if tab != "retention":
+        raise PreventUpdate
+    return RESULT_CACHE.get_or_compute({"view": "retention"}, build_retention)
+
+
+def build_retention():
+    try:
+        table = RETENTION.load()
+    except Exception:
+        return empty_figure("Retentia este indisponibila momentan.")
+    table = table[table["size"] > 0]
+    if table.empty:
+        return empty_figure("Nu exista vizitatori noi in ultimele saptamani.")
+
+    weeks = [column for column in table.columns if isinstance(column, int)]
+    shares = table[weeks].to_numpy(dtype=float)
+    labels = [f"{cohort:%d.%m.%Y} ({format_number(int(size))})" for cohort, size in zip(table["cohort"], table["size"])]
+    fig = go.Figure(
+        go.Heatmap(
+            z=shares,
+            x=[f"Sapt. {week}" for week in weeks],
+            y=labels,
+            text=[["" if np.isnan(share) else f"{share:.0%}" for share in row] for row in shares],
+            texttemplate="%{text}",
+            colorscale=[[0, "#111111"], [1, THEME["accent"]]],
+            zmin=0,
+            zmax=1,
+            hovertemplate="Cohorta %{y}<br>%{x}: %{z:.1%}<extra></extra>",
+            colorbar={"tickformat": ".0%"},
+        )
+    )
+    style_figure(fig, "Retentie Vizitatori pe Saptamana Primei Vizite")
+    fig.update_xaxes(showgrid=False, side="top")
+    fig.update_yaxes(showgrid=False, autorange="reversed", automargin=True)
+    fig.update_layout(height=max(360, 28 * len(labels) + 140))
+    return fig
+
+
+@app.callback(Output("refresh", "disabled"), Output("live_resync", "disabled"), Input("live_mode", "value"))
+def toggle_refresh_timer(live_mode):
+    # In live mode assets/live.js applies streamed events; a full recompute follows a window
+    # change and the slower live_resync timer.
+    live = "live" in (live_mode or [])
+    return live, not live
+
+
+def build_dashboard(window: str):
+    summary = load_summary(window)
+    window_label = TIME_WINDOWS[summary.window][0].lower()
     refreshed_at = datetime.now().strftime("%d.%m.%Y %H:%M:%S")
 
-    if df.empty:
+    if not summary.total_events:
         blank_fig = empty_figure("Nu exista date disponibile inca.")
         cards = [
-            metric_card("Total evenimente", "0", emphasize=True),
-            metric_card("Page views", "0"),
-            metric_card("Formulare trimise", "0"),
+            metric_card("Total evenimente", "0", emphasize=True, live_metric="total_events"),
+            metric_card("Page views", "0", live_metric="page_views"),
+            metric_card("Formulare trimise", "0", live_metric="contacts"),
             metric_card("Pagini unice", "0"),
         ]
-        return cards, f"Actualizat la {refreshed_at} · Fara evenimente inregistrate.", blank_fig, blank_fig, blank_fig
-
-    total_events = len(df)
-    page_views = int((df["event_type"] == "page_view").sum())
-    contacts = int(df["event_type"].isin(["contact_submit", "contact_form_submit"]).sum())
-    unique_pages = int(df["page"].nunique())
-    unique_elements = int(df[df["element"].astype(str).str.len() > 0]["element"].nunique())
-
-    by_day = df.groupby("day", as_index=False).size()
-    fig_day = px.area(by_day, x="day", y="size", color_discrete_sequence=[THEME["accent"]])
-    fig_day.update_traces(line={"width": 2.6}, fillcolor="rgba(179, 0, 27, 0.28)")
-    style_figure(fig_day, "Evenimente pe Zi")
+        status = f"Actualizat la {refreshed_at} · Fara evenimente in {window_label}."
+        return cards, status, blank_fig, blank_fig, blank_fig, live_cursor(summary)
+
+    trend = downsample_frame(summary.trend, "bucket", "size")
+    trend_trace = go.Scattergl if uses_webgl(len(trend)) else go.Scatter
+    fig_day = go.Figure(
+        trend_trace(
+            x=trend["bucket"],
+            y=trend["size"],
+            mode="lines",
+            fill="tozeroy",
+            line={"width": 2.6, "color": THEME["accent"]},
+            fillcolor="rgba(179, 0, 27, 0.28)",
+            hovertemplate="%{x}<br>%{y} evenimente<extra></extra>",
+        )
+    )
+    style_figure(fig_day, "Evenimente pe Ora" if summary.bucket == "hour" else "Evenimente pe Zi")
+    fig_day.update_layout(meta={"bucket": summary.bucket})
     fig_day.update_xaxes(title=None)
     fig_day.update_yaxes(title="Evenimente")
 
-    top_types = df.groupby("event_type", as_index=False).size().sort_values("size", ascending=False).head(10)
-    fig_types = px.bar(top_types, x="event_type", y="size", color_discrete_sequence=[THEME["accent"]])
+    fig_types = px.bar(summary.top_types, x="event_type", y="size", color_discrete_sequence=[THEME["accent"]])
     fig_types.update_traces(marker_line_color="rgba(255,255,255,0.34)", marker_line_width=1.0)
     style_figure(fig_types, "Top Tipuri de Evenimente")
     fig_types.update_xaxes(title=None, tickangle=-24, automargin=True)
     fig_types.update_yaxes(title="Numar")
 
-    filtered_elements = df[df["element"].astype(str).str.len() > 0]
-    top_elements = filtered_elements.groupby("element", as_index=False).size().sort_values("size", ascending=False).head(10)
-    fig_elements = px.bar(top_elements, x="size", y="element", orientation="h", color_discrete_sequence=[THEME["accent"]])
+    top_elements = summary.top_elements.assign(upper=0)
+    approximate_top = bool((top_elements["error"] > 0).any())
+    fig_elements = px.bar(
+        top_elements,
+        x="size",
+        y="element",
+        orientation="h",
+        error_x="upper" if approximate_top else None,
+        error_x_minus="error" if approximate_top else None,
+        color_discrete_sequence=[THEME["accent"]],
+    )
     fig_elements.update_traces(marker_line_color="rgba(255,255,255,0.3)", marker_line_width=1.0)
-    style_figure(fig_elements, "Top Elemente Clickuite")
+    if approximate_top:
+        fig_elements.update_traces(error_x={"color": THEME["text_muted"]})
+    style_figure(
+        fig_elements,
+        f"Top Elemente Clickuite (±{format_number(int(top_elements['error'].max()))} max)" if approximate_top else "Top Elemente Clickuite",
+    )
     fig_elements.update_xaxes(title="Click-uri")
     fig_elements.update_yaxes(title=None, automargin=True, categoryorder="total ascending")
 
     metric_cards = [
-        metric_card("Total evenimente", format_number(total_events), emphasize=True),
-        metric_card("Page views", format_number(page_views)),
-        metric_card("Formulare trimise", format_number(contacts)),
-        metric_card("Pagini unice", format_number(unique_pages)),
-        metric_card("Elemente unice", format_number(unique_elements)),
+        metric_card("Total evenimente", format_number(summary.total_events), emphasize=True, live_metric="total_events"),
+        metric_card("Page views", format_number(summary.page_views), live_metric="page_views"),
+        metric_card("Formulare trimise", format_number(summary.contacts), live_metric="contacts"),
+        distinct_card("Pagini unice", summary, "unique_pages"),
+        distinct_card("Elemente unice", summary, "unique_elements"),
+        distinct_card("Sesiuni unice", summary, "unique_sessions"),
     ]
-    status = f"Actualizat la {refreshed_at} · Ultimele {format_number(total_events)} evenimente analizate."
-    return metric_cards, status, fig_day, fig_types, fig_elements
+    status = f"Actualizat la {refreshed_at} · {format_number(summary.total_events)} evenimente in {window_label}."
+    return metric_cards, status, fig_day, fig_types, fig_elements, live_cursor(summary)
+
 
+def live_cursor(summary: EventSummary) -> str:
+    since = window_start(summary.window).astimezone(ZoneInfo(DASH_TIME_ZONE)).replace(minute=0, second=0, microsecond=0, tzinfo=None)
+    return json.dumps({"after": summary.last_event_id, "since": since.isoformat()})
 
-def metric_card(label: str, value: str, emphasize: bool = False) -> html.Div:
+
+def metric_card(label: str, value: str, emphasize: bool = False, note: str = "", live_metric: str = "") -> html.Div:
     accent_border = "rgba(179, 0, 27, 0.66)" if emphasize else THEME["border"]
     accent_bg = "rgba(179, 0, 27, 0.14)" if emphasize else THEME["panel_soft"]
     return html.Div(
@@ -444,7 +700,9 @@ def metric_card(label: str, value: str, emphasize: bool = False) -> html.Div:
             html.P(
                 value,
                 style={"margin": 0, "fontSize": "1.56rem", "fontWeight": "700", "lineHeight": "1"},
+                **({"id": f"metric-{live_metric}", "data-value": value.replace(".", "")} if live_metric else {}),
             ),
+            html.P(note, style={"margin": "8px 0 0", "fontSize": "0.76rem", "color": THEME["text_muted"]}) if note else None,
         ],
         style={
             "background": accent_bg,
@@ -456,6 +714,14 @@ def metric_card(label: str, value: str, emphasize: bool = False) -> html.Div:
     )
 
 
+def distinct_card(label: str, summary: EventSummary, metric: str) -> html.Div:
+    value = format_number(getattr(summary, metric))
+    error = summary.error_bounds.get(metric)
+    if error is None:
+        return metric_card(label, value)
+    return metric_card(label, f"≈ {value}", note=f"±{error * 100:.1f}% (HyperLogLog, 1σ)".replace(".", ","))
+
+
 def style_figure(fig: go.Figure, title: str) -> None:
     fig.update_layout(
         title={"text": title, "x": 0.01, "xanchor": "left", "font": {"size": 22, "color": THEME["text"]}},
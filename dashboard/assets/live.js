@@ -0,0 +1,166 @@
+// Live mode: follow the server-sent event stream and apply new events to the rendered
+// cards and figures in place. The stream starts after the last event id included in the
+// current render (#live_cursor), so a full refresh and the stream never double count.
+// The window start moves forward with the clock: events timestamped before it are ignored
+// and trend buckets that fall out of it are dropped. Cards cannot subtract the events
+// that age out, so the server still recomputes everything every DASH_LIVE_RESYNC_SECONDS.
+(function () {
+  var source = null;
+  var rendered = null;
+  var resumeAfter = 0;
+  var since = "";
+  var sinceAt = 0;
+  var renderedAt = 0;
+
+  function basePath() {
+    var config = document.getElementById("_dash-config");
+    return config ? JSON.parse(config.textContent).requests_pathname_prefix : "/";
+  }
+
+  function liveEnabled() {
+    var checkbox = document.querySelector("#live_mode input[type=checkbox]");
+    return Boolean(checkbox && checkbox.checked);
+  }
+
+  function formatNumber(value) {
+    return value.toString().replace(/\B(?=(\d{3})+(?!\d))/g, ".");
+  }
+
+  function normalizeTime(value) {
+    var text = String(value).replace(" ", "T");
+    return (text.length === 10 ? text + "T00:00:00" : text).slice(0, 19);
+  }
+
+  function advanceSince() {
+    // Local wall-clock strings are shifted as if they were UTC; only the elapsed time matters.
+    var moved = new Date(sinceAt + Date.now() - renderedAt).toISOString();
+    since = moved.slice(0, 13) + ":00:00";
+  }
+
+  function graph(id) {
+    var gd = document.querySelector("#" + id + " .js-plotly-plot");
+    return gd && gd.data && gd.data.length ? gd : null;
+  }
+
+  function bumpMetric(metric, amount) {
+    var node = document.getElementById("metric-" + metric);
+    if (!node || !amount) {
+      return;
+    }
+    var value = Number(node.dataset.value || 0) + amount;
+    node.dataset.value = value;
+    node.textContent = formatNumber(value);
+  }
+
+  function bumpTrend(events) {
+    var gd = graph("events_by_day");
+    if (!gd) {
+      return;
+    }
+    var bucket = (gd.layout.meta || {}).bucket === "hour" ? "hour" : "day";
+    var first = bucket === "hour" ? since : since.slice(0, 10) + "T00:00:00";
+    var trace = gd.data[0];
+    var totals = {};
+    Array.from(trace.x).forEach(function (x, index) {
+      var key = normalizeTime(x);
+      if (key >= first) {
+        totals[key] = trace.y[index];
+      }
+    });
+    events.forEach(function (event) {
+      var key = normalizeTime(event[bucket]);
+      totals[key] = (totals[key] || 0) + 1;
+    });
+    var keys = Object.keys(totals).sort();
+    Plotly.restyle(gd, { x: [keys], y: [keys.map(function (key) { return totals[key]; })] }, [0]);
+  }
+
+  function bumpBars(id, counts, horizontal) {
+    var gd = graph(id);
+    if (!gd || !Object.keys(counts).length) {
+      return;
+    }
+    var trace = gd.data[0];
+    var labels = Array.from(horizontal ? trace.y : trace.x);
+    var values = Array.from(horizontal ? trace.x : trace.y);
+    Object.keys(counts).forEach(function (label) {
+      var index = labels.indexOf(label);
+      if (index === -1) {
+        labels.push(label);
+        values.push(counts[label]);
+      } else {
+        values[index] += counts[label];
+      }
+    });
+    Plotly.restyle(gd, horizontal ? { x: [values], y: [labels] } : { x: [labels], y: [values] }, [0]);
+  }
+
+  function apply(payload) {
+    resumeAfter = payload.last_id;
+    var contactTypes = (document.getElementById("live_cursor").dataset.contactTypes || "").split(",");
+    advanceSince();
+    var events = payload.events.filter(function (event) {
+      return normalizeTime(event.hour) >= since;
+    });
+    var types = {};
+    var elements = {};
+    var pageViews = 0;
+    var contacts = 0;
+    if (!events.length) {
+      return;
+    }
+    events.forEach(function (event) {
+      types[event.event_type] = (types[event.event_type] || 0) + 1;
+      if (event.element) {
+        elements[event.element] = (elements[event.element] || 0) + 1;
+      }
+      if (event.event_type === "page_view") {
+        pageViews += 1;
+      }
+      if (contactTypes.indexOf(event.event_type) !== -1) {
+        contacts += 1;
+      }
+    });
+    bumpMetric("total_events", events.length);
+    bumpMetric("page_views", pageViews);
+    bumpMetric("contacts", contacts);
+    bumpTrend(events);
+    bumpBars("top_event_types", types, false);
+    bumpBars("top_elements", elements, true);
+  }
+
+  function sync() {
+    var node = document.getElementById("live_cursor");
+    var current = node ? node.textContent : "";
+    if (current !== rendered) {
+      // A full refresh replaced the figures: restart from the ids they include.
+      rendered = current;
+      if (source) {
+        source.close();
+        source = null;
+      }
+      if (current) {
+        var state = JSON.parse(current);
+        since = normalizeTime(state.since);
+        sinceAt = Date.parse(since + "Z");
+        renderedAt = Date.now();
+        resumeAfter = state.after;
+      }
+    }
+    if (!liveEnabled() || !rendered) {
+      if (source) {
+        source.close();
+        source = null;
+      }
+      return;
+    }
+    if (!source) {
+      source = new EventSource(basePath() + "live/events" + (resumeAfter > 0 ? "?after=" + resumeAfter : ""));
+      source.addEventListener("events", function (message) {
+        apply(JSON.parse(message.data));
+      });
+    }
+  }
+
+  window.setInterval(sync, 1000);
+})();
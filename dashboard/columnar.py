@@ -0,0 +1,211 @@
+import argparse
+import fcntl
+import json
+import os
+import tempfile
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from cursor import EventCursor
+from queries import TOP_N, EventSummary, summary_from_counts, window_start
+from sketches import HyperLogLog
+
+US_PER_HOUR = 3_600_000_000
+US_PER_DAY = 24 * US_PER_HOUR
+EPOCH = pd.Timestamp(0, tz="UTC")
+
+COLUMNS = {
+    "timestamp": np.int64,  # microseconds since the epoch, UTC
+    "event_type": np.int32,
+    "page": np.int32,
+    "element": np.int32,
+    "session": np.uint64,  # hash of session_id, 0 when empty
+}
+DICTIONARY_COLUMNS = ("event_type", "page", "element")
+
+
+def to_microseconds(value: datetime) -> int:
+    return (pd.Timestamp(value) - EPOCH) // pd.Timedelta(microseconds=1)
+
+
+def hash_sessions(values: pd.Series) -> np.ndarray:
+    hashed = pd.util.hash_pandas_object(values, index=False).to_numpy(np.uint64)
+    hashed[(values == "").to_numpy()] = 0
+    return hashed
+
+
+class ColumnarEventStore:
+    """Append-only, dictionary-encoded copy of core_event for long-range aggregation.
+
+    Each UTC day is a directory of raw little-endian column files (``<column>.bin``) that are
+    opened with ``np.memmap``; string columns hold int32 codes into the dictionaries kept in
+    ``manifest.json`` together with the per-day row counts and the ``EventCursor`` state (last
+    exported event id plus the lower ids not seen yet, which a later commit may still fill).
+    The manifest is replaced atomically after each batch, so readers never see rows from a
+    partial append.
+
+    Pages and elements are counted exactly with ``bincount`` over their codes. Sessions are
+    only stored as hashes and are counted with a HyperLogLog sketch per day, cached for days
+    that are wholly inside the window.
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self.manifest_path = self.directory / "manifest.json"
+        self._session_sketches: dict[tuple[str, int], HyperLogLog] = {}
+
+    def load_manifest(self) -> dict:
+        try:
+            with self.manifest_path.open("r", encoding="utf-8") as handle:
+                return json.load(handle)
+        except FileNotFoundError:
+            return {"high_water_id": 0, "gaps": [], "rows": {}, "dictionaries": {name: [] for name in DICTIONARY_COLUMNS}}
+
+    def _save_manifest(self, manifest: dict) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle)
+        os.replace(tmp_name, self.manifest_path)
+
+    def _column_path(self, day: str, name: str) -> Path:
+        return self.directory / "days" / day / f"{name}.bin"
+
+    def _append_day(self, manifest: dict, day: str, columns: dict[str, np.ndarray]) -> None:
+        rows = manifest["rows"].get(day, 0)
+        for name, dtype in COLUMNS.items():
+            path = self._column_path(day, name)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("ab") as handle:
+                # Drop bytes left behind by an export that died before saving the manifest.
+                handle.truncate(rows * np.dtype(dtype).itemsize)
+                handle.write(np.ascontiguousarray(columns[name], dtype=dtype).tobytes())
+        manifest["rows"][day] = rows + len(columns["timestamp"])
+
+    def _encode(self, manifest: dict, frame: pd.DataFrame) -> dict[str, np.ndarray]:
+        columns = {
+            "timestamp": ((pd.to_datetime(frame["timestamp"], utc=True, format="ISO8601") - EPOCH) // pd.Timedelta(microseconds=1)).to_numpy(np.int64),
+            "session": hash_sessions(frame["session_id"].fillna("")),
+        }
+        for name in DICTIONARY_COLUMNS:
+            dictionary = manifest["dictionaries"][name]
+            codes = {value: code for code, value in enumerate(dictionary)}
+            values = frame[name].fillna("")
+            for value in values.unique():
+                if value not in codes:
+                    codes[value] = len(dictionary)
+                    dictionary.append(value)
+            columns[name] = values.map(codes).to_numpy(np.int32)
+        return columns
+
+    def export(self, engine: Engine, batch_size: int = 50_000) -> int:
+        """Append events the manifest's cursor has not exported yet; returns the number of rows written."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        exported = 0
+        with (self.directory / ".lock").open("a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            manifest = self.load_manifest()
+            cursor = EventCursor(manifest["high_water_id"], manifest.get("gaps", ()))
+            with engine.connect() as conn:
+                while True:
+                    condition, params = cursor.condition()
+                    rows = conn.execute(
+                        text(
+                            f"""
+                            SELECT id, timestamp, event_type, page, element, session_id
+                            FROM core_event
+                            WHERE {condition}
+                            ORDER BY id
+                            LIMIT :limit
+                            """
+                        ),
+                        {**params, "limit": batch_size},
+                    ).all()
+                    if not rows:
+                        break
+                    frame = pd.DataFrame(rows, columns=["id", "timestamp", "event_type", "page", "element", "session_id"])
+                    columns = self._encode(manifest, frame)
+                    days = columns["timestamp"] // US_PER_DAY
+                    for day in np.unique(days):
+                        selected = days == day
+                        label = (EPOCH + pd.Timedelta(days=int(day))).strftime("%Y-%m-%d")
+                        self._append_day(manifest, label, {name: values[selected] for name, values in columns.items()})
+                    cursor.advance(frame["id"].tolist())
+                    manifest.update(cursor.state())
+                    self._save_manifest(manifest)
+                    exported += len(frame)
+        return exported
+
+    def open_day(self, day: str, rows: int) -> dict[str, np.ndarray]:
+        return {
+            name: np.memmap(self._column_path(day, name), dtype=dtype, mode="r", shape=(rows,))
+            for name, dtype in COLUMNS.items()
+        }
+
+    def _day_sessions(self, day: str, rows: int, columns: dict[str, np.ndarray], selected) -> HyperLogLog:
+        cacheable = isinstance(selected, slice)
+        if cacheable and (day, rows) in self._session_sketches:
+            return self._session_sketches[(day, rows)]
+        sketch = HyperLogLog()
+        hashes = columns["session"][selected]
+        sketch.add_hashes(hashes[hashes != 0])
+        if cacheable:
+            self._session_sketches = {key: value for key, value in self._session_sketches.items() if key[0] != day}
+            self._session_sketches[(day, rows)] = sketch
+        return sketch
+
+    def summary(self, window: str, now: datetime | None = None) -> EventSummary:
+        manifest = self.load_manifest()
+        dictionaries = {name: manifest["dictionaries"][name] for name in DICTIONARY_COLUMNS}
+        start = to_microseconds(window_start(window, now))
+        type_counts = np.zeros(len(dictionaries["event_type"]), dtype=np.int64)
+        page_counts = np.zeros(len(dictionaries["page"]), dtype=np.int64)
+        element_counts = np.zeros(len(dictionaries["element"]), dtype=np.int64)
+        by_hour: Counter = Counter()
+        sessions = HyperLogLog()
+
+        for day, rows in manifest["rows"].items():
+            day_start = to_microseconds(datetime.fromisoformat(day).replace(tzinfo=timezone.utc))
+            if not rows or day_start + US_PER_DAY <= start:
+                continue
+            columns = self.open_day(day, rows)
+            selected = slice(None) if day_start >= start else columns["timestamp"] >= start
+            timestamps = columns["timestamp"][selected]
+            type_counts += np.bincount(columns["event_type"][selected], minlength=len(type_counts))
+            page_counts += np.bincount(columns["page"][selected], minlength=len(page_counts))
+            element_counts += np.bincount(columns["element"][selected], minlength=len(element_counts))
+            sessions.merge(self._day_sessions(day, rows, columns, selected))
+            hours, counts = np.unique(timestamps // US_PER_HOUR, return_counts=True)
+            for hour, count in zip(hours.tolist(), counts.tolist()):
+                by_hour[datetime.fromtimestamp(hour * 3600, tz=timezone.utc)] += count
+
+        by_type = Counter({value: int(count) for value, count in zip(dictionaries["event_type"], type_counts) if count})
+        by_element = Counter({value: int(count) for value, count in zip(dictionaries["element"], element_counts) if count and value})
+        return summary_from_counts(
+            window,
+            by_type,
+            by_hour,
+            unique_pages=int(np.count_nonzero(page_counts)),
+            unique_elements=len(by_element),
+            unique_sessions=sessions.count(),
+            top_elements=[(element, count, 0) for element, count in by_element.most_common(TOP_N)],
+            error_bounds={"unique_sessions": sessions.relative_error},
+            last_event_id=manifest["high_water_id"],
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Append new core_event rows to the columnar event store.")
+    parser.add_argument("--directory", default=os.getenv("DASH_COLUMNAR_DIR", "/app/var/columnar"))
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    args = parser.parse_args()
+
+    from app import ENGINE
+
+    written = ColumnarEventStore(args.directory).export(ENGINE, batch_size=args.batch_size)
+    print(f"Exported {written} event(s) to {args.directory}.")
@@ -0,0 +1,59 @@
+import os
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+
+# Missing ids further than this below the high-water mark are taken to be rolled back.
+RESCAN_IDS = int(os.getenv("DASH_RESCAN_IDS", "10000"))
+MAX_GAPS = 100
+
+
+class EventCursor:
+    """Read position in core_event by id that still picks up rows committed out of id order.
+
+    PostgreSQL assigns ids at insert time, so a spool load or a slow request can make id 100
+    visible after id 120 was read. Besides the high-water mark the cursor keeps the ranges of
+    ids below it that have not been seen and matches them again on every read, until they are
+    more than ``rescan_ids`` below the mark. Rows are therefore returned once each, by id.
+    """
+
+    def __init__(self, high_water_id: int = 0, gaps: Iterable[Iterable[int]] = (), rescan_ids: int = RESCAN_IDS):
+        self.high_water_id = high_water_id
+        # Inclusive (first, last) id ranges below the mark, oldest first.
+        self.gaps: list[tuple[int, int]] = [(int(first), int(last)) for first, last in gaps]
+        self.rescan_ids = rescan_ids
+
+    def condition(self, column: str = "id") -> tuple[str, dict]:
+        """SQL predicate and bind parameters matching ids the cursor has not returned yet."""
+        clauses, params = [f"{column} > :cursor_after"], {"cursor_after": self.high_water_id}
+        for index, (first, last) in enumerate(self.gaps):
+            clauses.append(f"{column} BETWEEN :cursor_gap{index}_first AND :cursor_gap{index}_last")
+            params[f"cursor_gap{index}_first"], params[f"cursor_gap{index}_last"] = first, last
+        return f"({' OR '.join(clauses)})", params
+
+    def is_new(self, event_id: int) -> bool:
+        return event_id > self.high_water_id or any(first <= event_id <= last for first, last in self.gaps)
+
+    def advance(self, ids: Iterable[int], upto: int | None = None) -> None:
+        """Record the ids a read under ``condition`` returned, covering everything up to ``upto``.
+
+        ``upto`` defaults to the largest id returned. Ids up to it that were not returned become
+        gaps; ids more than ``rescan_ids`` below it may be left out of ``ids``.
+        """
+        ids = sorted(set(ids))
+        upto = max(self.high_water_id, upto or 0, ids[-1] if ids else 0)
+        ranges = [*self.gaps, (self.high_water_id + 1, upto)] if upto > self.high_water_id else self.gaps
+        cutoff = upto - self.rescan_ids
+        gaps = []
+        for first, last in ranges:
+            start = max(first, cutoff + 1)
+            for event_id in ids[bisect_left(ids, start) : bisect_right(ids, last)]:
+                if event_id > start:
+                    gaps.append((start, event_id - 1))
+                start = event_id + 1
+            if start <= last:
+                gaps.append((start, last))
+        self.gaps = gaps[-MAX_GAPS:]
+        self.high_water_id = upto
+
+    def state(self) -> dict:
+        return {"high_water_id": self.high_water_id, "gaps": [list(gap) for gap in self.gaps]}
@@ -0,0 +1,57 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# Most points a time series sends to the browser; 0 sends every point.
+MAX_SERIES_POINTS = int(os.getenv("DASH_MAX_SERIES_POINTS", "1000"))
+# Series with more points than this are drawn with WebGL (scattergl) instead of SVG. Never
+# below the budget, so a downsampled series keeps SVG rendering; 0 disables WebGL.
+WEBGL_THRESHOLD = int(os.getenv("DASH_WEBGL_THRESHOLD", "1000"))
+if WEBGL_THRESHOLD and MAX_SERIES_POINTS:
+    WEBGL_THRESHOLD = max(WEBGL_THRESHOLD, MAX_SERIES_POINTS)
+
+
+def lttb(x: np.ndarray, y: np.ndarray, budget: int) -> np.ndarray:
+    """Indices of at most ``budget`` points chosen by Largest-Triangle-Three-Buckets.
+
+    ``x`` must be numeric and sorted. The first and last points are always kept; each
+    bucket in between contributes the point forming the largest triangle with the point
+    kept from the previous bucket and the mean of the next bucket.
+    """
+    size = len(x)
+    if budget <= 0 or size <= budget or budget < 3:
+        return np.arange(size)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, size - 1, budget - 1).astype(np.int64)
+    selected = np.empty(budget, dtype=np.int64)
+    selected[0], selected[-1] = 0, size - 1
+    previous = 0
+    for bucket in range(budget - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        following = slice(stop, edges[bucket + 2]) if bucket + 2 < len(edges) else slice(size - 1, size)
+        next_x, next_y = x[following].mean(), y[following].mean()
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:stop] - y[previous]) - (x[previous] - x[start:stop]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def downsample_frame(frame: pd.DataFrame, x: str, y: str, budget: int = MAX_SERIES_POINTS) -> pd.DataFrame:
+    """Rows of ``frame`` (sorted by ``x``) kept by :func:`lttb`."""
+    if budget <= 0 or len(frame) <= budget:
+        return frame
+    values = frame[x]
+    if pd.api.types.is_datetime64_any_dtype(values) or values.dtype == object:
+        positions = pd.to_datetime(values).to_numpy(dtype="datetime64[ns]").astype(np.int64)
+    else:
+        positions = values.to_numpy()
+    return frame.iloc[lttb(positions, frame[y].to_numpy(), budget)]
+
+
+def uses_webgl(points: int, threshold: int = WEBGL_THRESHOLD) -> bool:
+    return threshold > 0 and points > threshold
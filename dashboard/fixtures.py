@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+
+
+def event_engine() -> Engine:
+    """In-memory SQLite engine with a core_event table laid out like Django's."""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                CREATE TABLE core_event (
+                    id INTEGER PRIMARY KEY, event_type TEXT NOT NULL, element TEXT NOT NULL DEFAULT '',
+                    timestamp TEXT NOT NULL, page TEXT NOT NULL DEFAULT '', session_id TEXT NOT NULL DEFAULT '',
+                    additional_data TEXT NOT NULL DEFAULT '{}', user_agent_id INTEGER
+                )
+                """
+            )
+        )
+    return engine
+
+
+def insert_event(
+    engine: Engine, timestamp: datetime, event_type: str = "page_view", page: str = "/", element: str = "", session_id: str = "", id: int | None = None
+) -> None:
+    # Django stores naive UTC text on SQLite.
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO core_event (id, event_type, element, timestamp, page, session_id) "
+                "VALUES (:id, :event_type, :element, :timestamp, :page, :session_id)"
+            ),
+            {
+                "id": id,
+                "event_type": event_type,
+                "element": element,
+                "timestamp": timestamp.replace(tzinfo=None).strftime("%Y-%m-%d %H:%M:%S.%f"),
+                "page": page,
+                "session_id": session_id,
+            },
+        )
@@ -0,0 +1,151 @@
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from columnar import EPOCH, US_PER_DAY, ColumnarEventStore, to_microseconds
+from queries import since_param, window_start
+
+# Each step is one event type or several separated by "|", e.g. "cta_click|service_card_click".
+FUNNEL_STEPS = [
+    step.split("|")
+    for step in os.getenv("DASH_FUNNEL_STEPS", "page_view,cta_click|service_card_click,contact_form_submit,contact_submit").split(",")
+    if step
+]
+SESSION_GAP_MINUTES = int(os.getenv("DASH_SESSION_GAP_MINUTES", "30"))
+
+
+@dataclass
+class FunnelResult:
+    steps: list[str]
+    reached: list[int] = field(default_factory=list)
+    visitors: int = 0
+    visits: int = 0
+    events: int = 0
+    median_visit_seconds: float = 0.0
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        reached = np.asarray(self.reached, dtype=np.int64)
+        previous = np.concatenate(([self.visits], reached[:-1])) if len(reached) else reached
+        step_rate = np.where(previous > 0, reached / np.maximum(previous, 1), 0.0)
+        return pd.DataFrame(
+            {"step": self.steps, "visits": reached, "drop_off": previous - reached, "step_conversion": step_rate}
+        )
+
+
+@dataclass
+class EventArrays:
+    """Integer-coded events: visitor code, UTC microseconds and event-type code per row."""
+
+    sessions: np.ndarray
+    timestamps: np.ndarray
+    event_types: np.ndarray
+    type_codes: dict[str, int]
+
+
+def first_of_runs(values: np.ndarray) -> np.ndarray:
+    """Indices where a sorted array changes value."""
+    return np.flatnonzero(np.r_[True, values[1:] != values[:-1]]) if len(values) else np.empty(0, dtype=np.int64)
+
+
+def sessionize(sessions: np.ndarray, timestamps: np.ndarray, gap_us: int) -> tuple[np.ndarray, np.ndarray, int]:
+    """Sort by (session, time) and number visits split by ``gap_us`` of inactivity.
+
+    Returns the sort order, the visit number of each sorted row and the number of visitors.
+    """
+    order = np.lexsort((timestamps, sessions))
+    sessions, timestamps = sessions[order], timestamps[order]
+    new_visitor = np.r_[True, sessions[1:] != sessions[:-1]]
+    starts = new_visitor | np.r_[True, np.diff(timestamps) > gap_us]
+    return order, np.cumsum(starts) - 1, int(np.count_nonzero(new_visitor))
+
+
+def compute_funnel(arrays: EventArrays, steps: list[list[str]], gap_minutes: int = SESSION_GAP_MINUTES) -> FunnelResult:
+    """Count visits that reach each step in order, each step at or after the previous one."""
+    result = FunnelResult(steps=[" / ".join(step) for step in steps])
+    if not len(arrays.sessions):
+        result.reached = [0] * len(steps)
+        return result
+
+    order, visit, visitors = sessionize(arrays.sessions, arrays.timestamps, gap_minutes * 60_000_000)
+    timestamps, event_types = arrays.timestamps[order], arrays.event_types[order]
+    visits = int(visit[-1]) + 1
+
+    boundaries = np.r_[first_of_runs(visit), len(visit)]
+    durations = timestamps[boundaries[1:] - 1] - timestamps[boundaries[:-1]]
+    result.visits = visits
+    result.visitors = visitors
+    result.events = len(order)
+    result.median_visit_seconds = float(np.median(durations)) / 1_000_000
+
+    # reached_at[v] is when visit v completed the previous step; int64 max if it never did.
+    reached_at = np.full(visits, np.iinfo(np.int64).min, dtype=np.int64)
+    never = np.iinfo(np.int64).max
+    for step in steps:
+        codes = [arrays.type_codes[name] for name in step if name in arrays.type_codes]
+        candidates = np.isin(event_types, codes) & (timestamps >= reached_at[visit])
+        next_reached = np.full(visits, never, dtype=np.int64)
+        # Rows are time-ordered within a visit, so the first candidate per visit is the earliest.
+        candidate_visits = visit[candidates]
+        first_rows = first_of_runs(candidate_visits)
+        next_reached[candidate_visits[first_rows]] = timestamps[candidates][first_rows]
+        reached_at = next_reached
+        result.reached.append(int(np.count_nonzero(reached_at != never)))
+    return result
+
+
+def arrays_from_store(store: ColumnarEventStore, since: datetime) -> EventArrays:
+    manifest = store.load_manifest()
+    start = to_microseconds(since)
+    sessions, timestamps, event_types = [], [], []
+    for day, rows in manifest["rows"].items():
+        day_start = to_microseconds(pd.Timestamp(day, tz="UTC"))
+        if not rows or day_start + US_PER_DAY <= start:
+            continue
+        columns = store.open_day(day, rows)
+        selected = (columns["timestamp"] >= start) & (columns["session"] != 0)
+        sessions.append(columns["session"][selected])
+        timestamps.append(columns["timestamp"][selected])
+        event_types.append(columns["event_type"][selected])
+    if not sessions:
+        return EventArrays(np.empty(0, np.uint64), np.empty(0, np.int64), np.empty(0, np.int32), {})
+    return EventArrays(
+        np.concatenate(sessions),
+        np.concatenate(timestamps),
+        np.concatenate(event_types),
+        {name: code for code, name in enumerate(manifest["dictionaries"]["event_type"])},
+    )
+
+
+def arrays_from_database(engine: Engine, since: datetime) -> EventArrays:
+    dialect = engine.dialect.name
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT session_id, timestamp, event_type FROM core_event WHERE timestamp >= :since AND session_id <> ''"),
+            {"since": since_param(dialect, since)},
+        ).all()
+    frame = pd.DataFrame(rows, columns=["session_id", "timestamp", "event_type"])
+    session_codes, _ = pd.factorize(frame["session_id"])
+    type_codes, type_names = pd.factorize(frame["event_type"])
+    stamps = pd.to_datetime(frame["timestamp"], utc=True, format="ISO8601")
+    return EventArrays(
+        session_codes.astype(np.int64),
+        ((stamps - EPOCH) // pd.Timedelta(microseconds=1)).to_numpy(np.int64),
+        type_codes.astype(np.int32),
+        {name: code for code, name in enumerate(type_names)},
+    )
+
+
+def load_funnel(engine: Engine, window: str, store: ColumnarEventStore | None = None) -> FunnelResult:
+    since = window_start(window)
+    if store is not None and store.load_manifest()["high_water_id"]:
+        store.export(engine)
+        arrays = arrays_from_store(store, since)
+    else:
+        arrays = arrays_from_database(engine, since)
+    return compute_funnel(arrays, FUNNEL_STEPS)
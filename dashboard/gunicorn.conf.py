@@ -0,0 +1,18 @@
+import os
+
+wsgi_app = "app:server"
+pythonpath = os.path.dirname(os.path.abspath(__file__))
+bind = os.getenv("DASH_BIND", "0.0.0.0:8050")
+
+# Threaded workers: each open live/events stream holds a thread for as long as the tab is
+# open, so threads bound concurrent viewers while workers bound CPU-heavy callbacks.
+worker_class = "gthread"
+workers = int(os.getenv("DASH_WORKERS", "2"))
+threads = int(os.getenv("DASH_THREADS", "16"))
+timeout = int(os.getenv("DASH_WORKER_TIMEOUT", "60"))
+graceful_timeout = 20
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("DASH_LOG_LEVEL", "info").lower()
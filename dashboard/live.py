@@ -0,0 +1,167 @@
+import json
+import queue
+import select
+import threading
+import time
+from collections.abc import Iterator
+
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from cursor import EventCursor
+from queries import DASH_TIME_ZONE
+
+NOTIFY_CHANNEL = "core_event_insert"
+KEEPALIVE_SECONDS = 15
+
+
+class EventFeed:
+    """Fans new core_event rows out to server-sent-event subscribers.
+
+    One background thread per process follows the table with an ``EventCursor``, so rows that
+    commit after a higher id was published are still sent. On PostgreSQL it sleeps on
+    ``LISTEN core_event_insert`` (sent by a statement-level trigger) and also re-checks every
+    ``poll_seconds`` in case a notification was missed; elsewhere it just polls.
+    """
+
+    def __init__(self, engine: Engine, poll_seconds: float = 2.0, batch_size: int = 500, queue_size: int = 100):
+        self.engine = engine
+        self.poll_seconds = poll_seconds
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.cursor: EventCursor | None = None
+        self._subscribers: set[queue.Queue] = set()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def subscribe(self) -> queue.Queue:
+        subscriber: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.add(subscriber)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="event-feed", daemon=True)
+                self._thread.start()
+        return subscriber
+
+    def unsubscribe(self, subscriber: queue.Queue) -> None:
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, payload: dict) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(payload)
+            except queue.Full:
+                # A stalled client misses this batch; the next full refresh corrects its totals.
+                pass
+
+    def fetch(self, cursor: EventCursor) -> list[dict]:
+        """Next rows ``cursor`` has not returned yet, oldest id first; advances the cursor."""
+        condition, params = cursor.condition()
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                text(
+                    f"""
+                    SELECT id, timestamp, event_type, page, element
+                    FROM core_event
+                    WHERE {condition}
+                    ORDER BY id
+                    LIMIT :limit
+                    """
+                ),
+                {**params, "limit": self.batch_size},
+            ).all()
+        cursor.advance([row[0] for row in rows])
+        if not rows:
+            return []
+        local = pd.to_datetime([row[1] for row in rows], utc=True, format="ISO8601").tz_convert(DASH_TIME_ZONE).tz_localize(None)
+        return [
+            {
+                "id": row[0],
+                "hour": stamp.floor("h").isoformat(),
+                "day": stamp.floor("D").isoformat(),
+                "event_type": row[2],
+                "page": row[3],
+                "element": row[4],
+            }
+            for row, stamp in zip(rows, local)
+        ]
+
+    def poll_once(self) -> None:
+        if self.cursor is None:
+            with self.engine.connect() as conn:
+                self.cursor = EventCursor(conn.execute(text("SELECT COALESCE(MAX(id), 0) FROM core_event")).scalar())
+        while True:
+            events = self.fetch(self.cursor)
+            if events:
+                self.publish({"last_id": self.cursor.high_water_id, "events": events})
+            if len(events) < self.batch_size:
+                return
+
+    def _wait_postgresql(self, listener) -> None:
+        if select.select([listener], [], [], self.poll_seconds)[0]:
+            listener.poll()
+            listener.notifies.clear()
+
+    def _run(self) -> None:
+        listener = None
+        while True:
+            with self._lock:
+                if not self._subscribers:
+                    self._thread = None
+                    self.cursor = None
+                    break
+            try:
+                if listener is None and self.engine.dialect.name == "postgresql":
+                    raw = self.engine.raw_connection()
+                    listener = raw.driver_connection
+                    listener.autocommit = True
+                    listener.cursor().execute(f"LISTEN {NOTIFY_CHANNEL}")
+                self.poll_once()
+                if listener is not None:
+                    self._wait_postgresql(listener)
+                else:
+                    time.sleep(self.poll_seconds)
+            except Exception:
+                if listener is not None:
+                    raw.invalidate()
+                    listener = None
+                time.sleep(self.poll_seconds)
+        if listener is not None:
+            raw.invalidate()
+
+    def stream(self, after: int | None = None) -> Iterator[str]:
+        """Yield SSE frames; with ``after``, first replay rows the client's last full refresh missed."""
+        subscriber = self.subscribe()
+        try:
+            yield f"retry: {int(self.poll_seconds * 2000)}\n\n"
+            # Tracks what this client has been sent, so replayed rows are not repeated by the feed.
+            sent = EventCursor(after) if after is not None else None
+            while sent is not None:
+                events = self.fetch(sent)
+                if events:
+                    yield self.frame({"last_id": sent.high_water_id, "events": events})
+                if len(events) < self.batch_size:
+                    break
+            while True:
+                try:
+                    payload = subscriber.get(timeout=KEEPALIVE_SECONDS)
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                if sent is not None:
+                    events = [event for event in payload["events"] if sent.is_new(event["id"])]
+                    if not events:
+                        continue
+                    sent.advance([event["id"] for event in events])
+                    payload = {"last_id": sent.high_water_id, "events": events}
+                yield self.frame(payload)
+        finally:
+            self.unsubscribe(subscriber)
+
+    @staticmethod
+    def frame(payload: dict) -> str:
+        return f"id: {payload['last_id']}\nevent: events\ndata: {json.dumps(payload)}\n\n"
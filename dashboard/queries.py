@@ -0,0 +1,176 @@
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+DASH_TIME_ZONE = os.getenv("DASH_TIME_ZONE", "Europe/Bucharest")
+CONTACT_EVENT_TYPES = ("contact_submit", "contact_form_submit")
+TOP_N = 10
+
+# key -> (label, lookback, trend bucket)
+# Trends stay hourly on long windows; downsample.py caps the points sent to the browser.
+TIME_WINDOWS = {
+    "24h": ("Ultimele 24 de ore", timedelta(days=1), "hour"),
+    "7d": ("Ultimele 7 zile", timedelta(days=7), "hour"),
+    "30d": ("Ultimele 30 de zile", timedelta(days=30), "hour"),
+    "90d": ("Ultimele 90 de zile", timedelta(days=90), "hour"),
+    "365d": ("Ultimele 12 luni", timedelta(days=365), "hour"),
+}
+DEFAULT_TIME_WINDOW = "30d"
+
+
+@dataclass
+class EventSummary:
+    window: str
+    bucket: str
+    total_events: int = 0
+    page_views: int = 0
+    contacts: int = 0
+    unique_pages: int = 0
+    unique_elements: int = 0
+    unique_sessions: int = 0
+    # highest core_event id included, so the live stream can continue from it
+    last_event_id: int = 0
+    # metric name -> relative standard error for values estimated by a sketch
+    error_bounds: dict[str, float] = field(default_factory=dict)
+    trend: pd.DataFrame = field(default_factory=lambda: pd.DataFrame(columns=["bucket", "size"]))
+    top_types: pd.DataFrame = field(default_factory=lambda: pd.DataFrame(columns=["event_type", "size"]))
+    # ``error`` is the Space-Saving overestimate bound; the true count is in [size - error, size].
+    top_elements: pd.DataFrame = field(default_factory=lambda: pd.DataFrame(columns=["element", "size", "error"]))
+
+
+def window_start(window: str, now: datetime | None = None) -> datetime:
+    _, lookback, _ = TIME_WINDOWS[window]
+    return (now or datetime.now(timezone.utc)) - lookback
+
+
+def summary_from_counts(
+    window: str,
+    by_type: Counter,
+    by_hour: dict[datetime, int],
+    unique_pages: int,
+    unique_elements: int,
+    unique_sessions: int,
+    top_elements: list[tuple[str, int, int]],
+    error_bounds: dict[str, float] | None = None,
+    last_event_id: int = 0,
+) -> EventSummary:
+    """Build a summary from in-memory counts; ``by_hour`` is keyed by aware UTC hours."""
+    _, _, bucket = TIME_WINDOWS[window]
+    summary = EventSummary(window=window, bucket=bucket, last_event_id=last_event_id)
+    if not by_type:
+        return summary
+
+    summary.total_events = sum(by_type.values())
+    summary.page_views = by_type["page_view"]
+    summary.contacts = sum(by_type[event_type] for event_type in CONTACT_EVENT_TYPES)
+    summary.unique_pages = unique_pages
+    summary.unique_elements = unique_elements
+    summary.unique_sessions = unique_sessions
+    summary.error_bounds = error_bounds or {}
+    summary.top_types = pd.DataFrame(by_type.most_common(TOP_N), columns=["event_type", "size"])
+    summary.top_elements = pd.DataFrame(top_elements[:TOP_N], columns=["element", "size", "error"])
+
+    trend = pd.DataFrame(sorted(by_hour.items()), columns=["bucket", "size"])
+    trend["bucket"] = pd.to_datetime(trend["bucket"], utc=True).dt.tz_convert(DASH_TIME_ZONE).dt.tz_localize(None)
+    if bucket == "day":
+        trend = trend.assign(bucket=trend["bucket"].dt.floor("D")).groupby("bucket", as_index=False)["size"].sum()
+    summary.trend = trend
+    return summary
+
+
+def bucket_expression(dialect: str, bucket: str) -> str:
+    if dialect == "postgresql":
+        return f"date_trunc('{bucket}', timestamp AT TIME ZONE :tz)"
+    # SQLite (local development) stores naive UTC text, so buckets stay in UTC there.
+    fmt = "%Y-%m-%d %H:00:00" if bucket == "hour" else "%Y-%m-%d"
+    return f"strftime('{fmt}', timestamp)"
+
+
+def since_param(dialect: str, since: datetime):
+    if dialect == "postgresql":
+        return since
+    return since.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def fetch_frame(conn: Connection, sql: str, params: dict, columns: list[str]) -> pd.DataFrame:
+    return pd.DataFrame(conn.execute(text(sql), params).all(), columns=columns)
+
+
+def load_event_summary(engine: Engine, window: str = DEFAULT_TIME_WINDOW, now: datetime | None = None) -> EventSummary:
+    """Aggregate core_event over ``window`` in the database; only grouped rows are transferred."""
+    _, _, bucket = TIME_WINDOWS[window]
+    dialect = engine.dialect.name
+    params = {"since": since_param(dialect, window_start(window, now)), "tz": DASH_TIME_ZONE, "top_n": TOP_N}
+    summary = EventSummary(window=window, bucket=bucket)
+
+    with engine.connect() as conn:
+        summary.last_event_id = int(conn.execute(text("SELECT COALESCE(MAX(id), 0) FROM core_event")).scalar())
+        by_type = fetch_frame(
+            conn,
+            """
+            SELECT event_type, COUNT(*) AS size
+            FROM core_event
+            WHERE timestamp >= :since
+            GROUP BY event_type
+            ORDER BY size DESC, event_type
+            """,
+            params,
+            ["event_type", "size"],
+        )
+        if by_type.empty:
+            return summary
+
+        counts = dict(zip(by_type["event_type"], by_type["size"]))
+        summary.total_events = int(by_type["size"].sum())
+        summary.page_views = int(counts.get("page_view", 0))
+        summary.contacts = int(sum(counts.get(event_type, 0) for event_type in CONTACT_EVENT_TYPES))
+        summary.top_types = by_type.head(TOP_N)
+
+        unique_pages, unique_sessions = conn.execute(
+            text(
+                """
+                SELECT COUNT(DISTINCT page), COUNT(DISTINCT NULLIF(session_id, ''))
+                FROM core_event
+                WHERE timestamp >= :since
+                """
+            ),
+            params,
+        ).one()
+        summary.unique_pages = int(unique_pages or 0)
+        summary.unique_sessions = int(unique_sessions or 0)
+        summary.trend = fetch_frame(
+            conn,
+            f"""
+            SELECT {bucket_expression(dialect, bucket)} AS bucket, COUNT(*) AS size
+            FROM core_event
+            WHERE timestamp >= :since
+            GROUP BY 1
+            ORDER BY 1
+            """,
+            params,
+            ["bucket", "size"],
+        )
+        top_elements = fetch_frame(
+            conn,
+            """
+            SELECT element, COUNT(*) AS size, COUNT(*) OVER () AS distinct_elements
+            FROM core_event
+            WHERE timestamp >= :since AND element <> ''
+            GROUP BY element
+            ORDER BY size DESC, element
+            LIMIT :top_n
+            """,
+            params,
+            ["element", "size", "distinct_elements"],
+        )
+
+    summary.trend["bucket"] = pd.to_datetime(summary.trend["bucket"])
+    if not top_elements.empty:
+        summary.unique_elements = int(top_elements["distinct_elements"].iloc[0])
+    summary.top_elements = top_elements[["element", "size"]].assign(error=0)
+    return summary
@@ -0,0 +1,69 @@
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from plotly.utils import PlotlyJSONEncoder
+
+
+class ResultCache:
+    """TTL cache of JSON-serialised callback results in a directory shared by all workers.
+
+    A miss takes an exclusive ``flock`` on the key's lock file before computing, so concurrent
+    tabs, threads and worker processes wait for one computation instead of each querying the
+    database when an entry expires. Dash components and figures are stored in their JSON form,
+    which Dash accepts back as callback output.
+    """
+
+    def __init__(self, directory: str | Path, ttl: float):
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    def _path(self, key: dict) -> Path:
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()[:32]
+        return self.directory / f"{digest}.json"
+
+    def _read_fresh(self, path: Path) -> Any | None:
+        try:
+            if time.time() - path.stat().st_mtime >= self.ttl:
+                return None
+            with path.open("r", encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, path: Path, value: Any) -> Any:
+        payload = json.dumps(value, cls=PlotlyJSONEncoder)
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(payload)
+        os.replace(tmp_name, path)
+        return json.loads(payload)
+
+    def get_or_compute(self, key: dict, compute: Callable[[], Any]) -> Any:
+        if self.ttl <= 0:
+            return compute()
+        path = self._path(key)
+        cached = self._read_fresh(path)
+        if cached is not None:
+            return cached
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            lock = path.with_suffix(".lock").open("a")
+        except OSError:
+            return compute()
+        with lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                cached = self._read_fresh(path)
+                if cached is not None:
+                    return cached
+                return self._write(path, compute())
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
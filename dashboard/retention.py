@@ -0,0 +1,159 @@
+import json
+import os
+import tempfile
+import threading
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from columnar import EPOCH, ColumnarEventStore, to_microseconds
+from queries import DASH_TIME_ZONE, since_param
+
+RETENTION_COHORTS = int(os.getenv("DASH_RETENTION_COHORTS", "26"))
+RETENTION_WEEKS = int(os.getenv("DASH_RETENTION_WEEKS", "12"))
+
+
+def local_weeks(timestamps: np.ndarray) -> np.ndarray:
+    """Monday-based week numbers (week 0 starts 1969-12-29) of UTC microsecond timestamps."""
+    local = pd.to_datetime(timestamps, unit="us", utc=True).tz_convert(DASH_TIME_ZONE).tz_localize(None)
+    days = local.to_numpy().astype("datetime64[D]").astype(np.int64)
+    return (days + 3) // 7
+
+
+def week_start(week: int) -> date:
+    return date(1970, 1, 1) + timedelta(days=week * 7 - 3)
+
+
+def cohort_counts(visitors: np.ndarray, first_weeks: np.ndarray, weeks: np.ndarray, horizon: int) -> dict[int, list[int]]:
+    """Active visitors per (first-seen week, weeks since) from integer-coded activity rows.
+
+    ``visitors`` and ``weeks`` describe one activity row each; ``first_weeks`` is indexed by
+    visitor code. Offset 0 of every cohort is its size.
+    """
+    offsets = weeks - first_weeks[visitors]
+    kept = (offsets >= 0) & (offsets < horizon)
+    pairs = np.unique(visitors[kept].astype(np.int64) * horizon + offsets[kept])
+    if not len(pairs):
+        return {}
+    cohorts = first_weeks[pairs // horizon]
+    oldest = int(cohorts.min())
+    cells = np.bincount((cohorts - oldest) * horizon + pairs % horizon, minlength=(int(cohorts.max()) - oldest + 1) * horizon)
+    table = cells.reshape(-1, horizon)
+    return {oldest + row: table[row].tolist() for row in range(len(table)) if table[row, 0]}
+
+
+class RetentionAnalyzer:
+    """Weekly return-visitor retention by first-seen week of ``session_id``.
+
+    A cohort is final once all ``weeks`` of its horizon are in the past; its row is stored in
+    ``cache_path`` and never recomputed, so each load only reads events from the oldest
+    cohort that is still open.
+    """
+
+    def __init__(self, engine: Engine, store: ColumnarEventStore | None, cache_path: str | Path,
+                 cohorts: int = RETENTION_COHORTS, weeks: int = RETENTION_WEEKS):
+        self.engine = engine
+        self.store = store
+        self.cache_path = Path(cache_path)
+        self.cohorts = cohorts
+        self.weeks = weeks
+        self._lock = threading.Lock()
+
+    def _read_cache(self) -> dict[str, list[int]]:
+        try:
+            with self.cache_path.open("r", encoding="utf-8") as handle:
+                cached = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+        return cached["cohorts"] if cached.get("weeks") == self.weeks else {}
+
+    def _write_cache(self, cohorts: dict[str, list[int]]) -> None:
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump({"weeks": self.weeks, "cohorts": cohorts}, handle)
+        os.replace(tmp_name, self.cache_path)
+
+    def _since(self, week: int) -> datetime:
+        return datetime.combine(week_start(week), time.min, tzinfo=ZoneInfo(DASH_TIME_ZONE)).astimezone(timezone.utc)
+
+    def _activity_from_store(self, since_week: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        self.store.export(self.engine)
+        manifest = self.store.load_manifest()
+        sessions, timestamps = [], []
+        for day, rows in manifest["rows"].items():
+            if rows:
+                columns = self.store.open_day(day, rows)
+                selected = columns["session"] != 0
+                sessions.append(columns["session"][selected])
+                timestamps.append(columns["timestamp"][selected])
+        if not sessions:
+            return np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0, np.int64)
+        _, visitors = np.unique(np.concatenate(sessions), return_inverse=True)
+        timestamps = np.concatenate(timestamps)
+        first_seen = np.full(int(visitors.max()) + 1, np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(first_seen, visitors, timestamps)
+        recent = timestamps >= to_microseconds(self._since(since_week))
+        return visitors[recent], local_weeks(first_seen), local_weeks(timestamps[recent])
+
+    def _activity_from_database(self, since_week: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        params = {"since": since_param(self.engine.dialect.name, self._since(since_week))}
+        with self.engine.connect() as conn:
+            first = pd.DataFrame(
+                conn.execute(
+                    text(
+                        """
+                        SELECT session_id, MIN(timestamp) FROM core_event
+                        WHERE session_id <> ''
+                        GROUP BY session_id
+                        HAVING MIN(timestamp) >= :since
+                        """
+                    ),
+                    params,
+                ).all(),
+                columns=["session_id", "first_seen"],
+            )
+            activity = pd.DataFrame(
+                conn.execute(text("SELECT session_id, timestamp FROM core_event WHERE timestamp >= :since AND session_id <> ''"), params).all(),
+                columns=["session_id", "timestamp"],
+            )
+        visitors = pd.Index(first["session_id"]).get_indexer(activity["session_id"])
+        kept = visitors >= 0
+
+        def microseconds(values: pd.Series) -> np.ndarray:
+            return ((pd.to_datetime(values, utc=True, format="ISO8601") - EPOCH) // pd.Timedelta(microseconds=1)).to_numpy(np.int64)
+
+        return visitors[kept], local_weeks(microseconds(first["first_seen"])), local_weeks(microseconds(activity["timestamp"][kept]))
+
+    def load(self, now: datetime | None = None) -> pd.DataFrame:
+        """Rows per cohort week (newest first): ``size`` plus the share active in week 0..N-1."""
+        now = now or datetime.now(timezone.utc)
+        current = int(local_weeks(np.array([to_microseconds(now)]))[0])
+        shown = range(current - self.cohorts + 1, current + 1)
+        final_until = current - self.weeks
+
+        with self._lock:
+            cached = self._read_cache()
+            missing = [week for week in shown if week > final_until or str(week) not in cached]
+            if missing:
+                if self.store is not None and self.store.load_manifest()["high_water_id"]:
+                    visitors, first_weeks, weeks = self._activity_from_store(missing[0])
+                else:
+                    visitors, first_weeks, weeks = self._activity_from_database(missing[0])
+                computed = cohort_counts(visitors, first_weeks, weeks, self.weeks)
+                for week in missing:
+                    cached[str(week)] = computed.get(week, [0] * self.weeks)
+                self._write_cache({key: row for key, row in cached.items() if final_until >= int(key) >= shown.start})
+
+        rows = []
+        for week in reversed(shown):
+            counts = cached[str(week)]
+            size = counts[0]
+            shares = [count / size if size and week + offset <= current else None for offset, count in enumerate(counts)]
+            rows.append({"cohort": week_start(week), "size": size, **{offset: share for offset, share in enumerate(shares)}})
+        return pd.DataFrame(rows)
@@ -0,0 +1,100 @@
+import hashlib
+import math
+from collections.abc import Iterable
+
+import numpy as np
+
+
+def hash_values(values: Iterable[str]) -> np.ndarray:
+    return np.fromiter(
+        (int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "little") for value in values),
+        dtype=np.uint64,
+    )
+
+
+def bit_length(values: np.ndarray) -> np.ndarray:
+    values = values.copy()
+    length = np.zeros(values.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        large = values >= np.uint64(1 << shift)
+        length[large] += shift
+        values[large] >>= np.uint64(shift)
+    return length + (values > 0)
+
+
+class HyperLogLog:
+    """Distinct-count sketch over 64-bit hashes; ``2 ** precision`` one-byte registers."""
+
+    def __init__(self, precision: int = 12):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        if not len(hashes):
+            return
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.int64)
+        rest = hashes << np.uint64(self.precision)
+        rank = (64 - bit_length(rest) + 1).clip(max=64 - self.precision + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def add(self, values: Iterable[str]) -> None:
+        self.add_hashes(hash_values(values))
+
+    def merge(self, other: "HyperLogLog") -> None:
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self) -> int:
+        m = len(self.registers)
+        estimate = 0.7213 / (1 + 1.079 / m) * m * m / float(np.sum(np.ldexp(1.0, -self.registers.astype(np.int64))))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class SpaceSaving:
+    """Top-k heavy hitters with per-item overestimation bounds (Metwally et al.).
+
+    ``counts[item] - errors[item]`` is a lower bound on the true count, ``counts[item]`` an
+    upper bound. Merging adds the bounds of both sketches, treating an item missing from a
+    full sketch as if it had that sketch's minimum count.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity
+        self.counts: dict[str, int] = {}
+        self.errors: dict[str, int] = {}
+
+    def floor(self) -> int:
+        return min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+
+    def add(self, item: str, count: int = 1) -> None:
+        if item in self.counts:
+            self.counts[item] += count
+            return
+        error = 0
+        if len(self.counts) >= self.capacity:
+            evicted = min(self.counts, key=self.counts.__getitem__)
+            error = self.counts.pop(evicted)
+            self.errors.pop(evicted)
+        self.counts[item] = error + count
+        self.errors[item] = error
+
+    def merge(self, other: "SpaceSaving") -> None:
+        own_floor, other_floor = self.floor(), other.floor()
+        counts, errors = {}, {}
+        for item in self.counts.keys() | other.counts.keys():
+            counts[item] = self.counts.get(item, own_floor) + other.counts.get(item, other_floor)
+            errors[item] = self.errors.get(item, own_floor) + other.errors.get(item, other_floor)
+        kept = sorted(counts, key=counts.__getitem__, reverse=True)[: self.capacity]
+        self.counts = {item: counts[item] for item in kept}
+        self.errors = {item: errors[item] for item in kept}
+
+    def top(self, n: int) -> list[tuple[str, int, int]]:
+        ranked = sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))[:n]
+        return [(item, count, self.errors[item]) for item, count in ranked]
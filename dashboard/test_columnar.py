@@ -0,0 +1,66 @@
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from columnar import ColumnarEventStore
+from fixtures import event_engine, insert_event
+
+
+class ColumnarEventStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.store = ColumnarEventStore(self.tmp.name)
+        self.engine = event_engine()
+        self.now = datetime.now(timezone.utc)
+
+    def test_export_in_batches_and_summarise_a_window(self):
+        insert_event(self.engine, self.now - timedelta(days=10), page="/vechi/", session_id="a")
+        insert_event(self.engine, self.now - timedelta(hours=2), page="/", session_id="a")
+        insert_event(self.engine, self.now - timedelta(hours=1), "cta_click", page="/", element="hero-cta", session_id="b")
+
+        self.assertEqual(self.store.export(self.engine, batch_size=2), 3)
+        self.assertEqual(self.store.export(self.engine), 0)
+
+        day = self.store.summary("24h")
+        self.assertEqual(day.total_events, 2)
+        self.assertEqual(day.page_views, 1)
+        self.assertEqual(day.unique_pages, 1)
+        self.assertEqual(day.unique_sessions, 2)
+        self.assertEqual(day.top_elements["element"].tolist(), ["hero-cta"])
+        self.assertEqual(day.last_event_id, 3)
+        self.assertEqual(self.store.summary("30d").total_events, 3)
+
+    def test_resume_drops_bytes_from_an_unfinished_export(self):
+        insert_event(self.engine, self.now - timedelta(hours=1))
+        self.store.export(self.engine)
+        manifest = self.store.load_manifest()
+        (day,) = manifest["rows"]
+        # An export that appended to the column files but died before saving the manifest.
+        for path in Path(self.tmp.name, "days", day).glob("*.bin"):
+            with path.open("ab") as handle:
+                handle.write(b"\xff" * 5)
+
+        insert_event(self.engine, self.now - timedelta(minutes=30), "cta_click")
+        self.store.export(self.engine)
+
+        self.assertEqual(self.store.load_manifest()["rows"][day], 2)
+        summary = self.store.summary("24h")
+        self.assertEqual(summary.total_events, 2)
+        self.assertEqual(summary.page_views, 1)
+
+    def test_late_committed_rows_are_exported(self):
+        for event_id in (1, 2, 4):
+            insert_event(self.engine, self.now - timedelta(hours=1), id=event_id)
+        self.store.export(self.engine)
+        self.assertEqual(self.store.load_manifest()["gaps"], [[3, 3]])
+
+        insert_event(self.engine, self.now - timedelta(hours=1), id=3)
+        self.assertEqual(self.store.export(self.engine), 1)
+        self.assertEqual(self.store.load_manifest()["gaps"], [])
+        self.assertEqual(self.store.summary("24h").total_events, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from downsample import MAX_SERIES_POINTS, WEBGL_THRESHOLD, downsample_frame, uses_webgl
+from queries import summary_from_counts
+
+
+class DownsampleTrendTests(unittest.TestCase):
+    def yearly_summary(self):
+        now = datetime(2026, 10, 17, 12, tzinfo=timezone.utc)
+        by_hour = {now - timedelta(hours=hour): 5 + hour % 24 for hour in range(365 * 24)}
+        by_hour[now - timedelta(days=100)] = 900
+        return summary_from_counts("365d", Counter(page_view=sum(by_hour.values())), by_hour, 1, 0, 0, [])
+
+    def test_yearly_hourly_trend_is_capped_and_keeps_its_peak(self):
+        trend = self.yearly_summary().trend
+        sampled = downsample_frame(trend, "bucket", "size")
+
+        self.assertGreater(len(trend), MAX_SERIES_POINTS)
+        self.assertEqual(len(sampled), MAX_SERIES_POINTS)
+        self.assertEqual(sampled["bucket"].iloc[0], trend["bucket"].iloc[0])
+        self.assertEqual(sampled["bucket"].iloc[-1], trend["bucket"].iloc[-1])
+        self.assertEqual(sampled["size"].max(), 900)
+        self.assertFalse(uses_webgl(len(sampled)))
+
+    def test_webgl_threshold_is_not_below_the_budget(self):
+        self.assertGreaterEqual(WEBGL_THRESHOLD, MAX_SERIES_POINTS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from funnels import arrays_from_database, compute_funnel, load_funnel
+from fixtures import event_engine, insert_event
+
+STEPS = [["page_view"], ["cta_click", "service_card_click"], ["contact_submit"]]
+
+
+class FunnelTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = event_engine()
+        self.start = datetime.now(timezone.utc) - timedelta(hours=6)
+
+    def add(self, minutes, event_type, session_id):
+        insert_event(self.engine, self.start + timedelta(minutes=minutes), event_type, session_id=session_id)
+
+    def funnel(self, gap_minutes=30):
+        arrays = arrays_from_database(self.engine, self.start - timedelta(hours=1))
+        return compute_funnel(arrays, STEPS, gap_minutes)
+
+    def test_a_pause_longer_than_the_gap_starts_a_new_visit(self):
+        self.add(0, "page_view", "a")
+        self.add(10, "cta_click", "a")
+        self.add(60, "contact_submit", "a")
+
+        result = self.funnel(gap_minutes=30)
+        self.assertEqual((result.visitors, result.visits), (1, 2))
+        # The submit belongs to the second visit, which never passed the first two steps.
+        self.assertEqual(result.reached, [1, 1, 0])
+        self.assertEqual(result.median_visit_seconds, 300)
+
+        self.assertEqual(self.funnel(gap_minutes=90).reached, [1, 1, 1])
+
+    def test_any_alternative_completes_a_step(self):
+        self.add(0, "page_view", "a")
+        self.add(1, "cta_click", "a")
+        self.add(2, "contact_submit", "a")
+        self.add(0, "page_view", "b")
+        self.add(1, "service_card_click", "b")
+        self.add(0, "page_view", "c")
+        self.add(1, "contact_submit", "c")
+
+        result = self.funnel()
+        self.assertEqual(result.visits, 3)
+        self.assertEqual(result.reached, [3, 2, 1])
+        self.assertEqual(result.frame["drop_off"].tolist(), [0, 1, 1])
+
+    def test_steps_must_happen_in_order(self):
+        self.add(0, "cta_click", "a")
+        self.add(1, "page_view", "a")
+
+        self.assertEqual(self.funnel().reached, [1, 0, 0])
+
+    def test_load_funnel_ignores_events_without_a_session(self):
+        insert_event(self.engine, datetime.now(timezone.utc) - timedelta(hours=1), "page_view", session_id="a")
+        insert_event(self.engine, datetime.now(timezone.utc) - timedelta(hours=1), "page_view")
+
+        result = load_funnel(self.engine, "24h")
+        self.assertEqual((result.visitors, result.events), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from fixtures import event_engine, insert_event
+from queries import load_event_summary
+
+NOW = datetime(2026, 10, 17, 12, 30, tzinfo=timezone.utc)
+
+
+class LoadEventSummaryTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = event_engine()
+        insert_event(self.engine, NOW - timedelta(hours=1), page="/", session_id="a")
+        insert_event(self.engine, NOW - timedelta(hours=1), page="/servicii/", session_id="b")
+        insert_event(self.engine, NOW - timedelta(minutes=10), "cta_click", page="/", element="hero-cta", session_id="a")
+        insert_event(self.engine, NOW - timedelta(minutes=5), "contact_submit", page="/contact/", session_id="a")
+        insert_event(self.engine, NOW - timedelta(days=3), page="/vechi/")
+
+    def test_counts_only_events_inside_the_window(self):
+        summary = load_event_summary(self.engine, "24h", now=NOW)
+
+        self.assertEqual(summary.total_events, 4)
+        self.assertEqual(summary.page_views, 2)
+        self.assertEqual(summary.contacts, 1)
+        self.assertEqual(summary.unique_pages, 3)
+        self.assertEqual(summary.unique_sessions, 2)
+        self.assertEqual(summary.unique_elements, 1)
+        self.assertEqual(summary.last_event_id, 5)
+        self.assertEqual(summary.trend["size"].tolist(), [2, 2])
+        self.assertEqual(summary.top_elements["element"].tolist(), ["hero-cta"])
+
+    def test_longer_window_includes_older_events(self):
+        self.assertEqual(load_event_summary(self.engine, "7d", now=NOW).total_events, 5)
+
+    def test_empty_window_returns_zero_summary(self):
+        summary = load_event_summary(self.engine, "24h", now=NOW + timedelta(days=30))
+
+        self.assertEqual(summary.total_events, 0)
+        self.assertEqual(summary.last_event_id, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
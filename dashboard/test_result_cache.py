@@ -0,0 +1,56 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from result_cache import ResultCache
+
+
+class ResultCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache = ResultCache(self.tmp.name, ttl=60)
+        self.calls = 0
+
+    def compute(self):
+        self.calls += 1
+        return {"calls": self.calls}
+
+    def test_serves_fresh_entries_and_recomputes_expired_ones(self):
+        key = {"view": "summary", "window": "24h"}
+        self.assertEqual(self.cache.get_or_compute(key, self.compute), {"calls": 1})
+        self.assertEqual(self.cache.get_or_compute(key, self.compute), {"calls": 1})
+        self.assertEqual(self.cache.get_or_compute({"view": "summary", "window": "7d"}, self.compute), {"calls": 2})
+
+        path = self.cache._path(key)
+        stale = time.time() - 61
+        os.utime(path, (stale, stale))
+        self.assertEqual(self.cache.get_or_compute(key, self.compute), {"calls": 3})
+
+    def test_zero_ttl_disables_caching(self):
+        cache = ResultCache(self.tmp.name, ttl=0)
+        cache.get_or_compute({"view": "x"}, self.compute)
+        cache.get_or_compute({"view": "x"}, self.compute)
+
+        self.assertEqual(self.calls, 2)
+
+    def test_concurrent_misses_compute_once(self):
+        def slow():
+            time.sleep(0.2)
+            return self.compute()
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.cache.get_or_compute({"view": "slow"}, slow))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results, [{"calls": 1}] * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
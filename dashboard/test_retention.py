@@ -0,0 +1,72 @@
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from columnar import to_microseconds
+from fixtures import event_engine, insert_event
+from queries import DASH_TIME_ZONE
+from retention import RetentionAnalyzer, cohort_counts, local_weeks, week_start
+
+
+def at(day: date) -> datetime:
+    return datetime(day.year, day.month, day.day, 12, tzinfo=timezone.utc)
+
+
+class LocalWeekTests(unittest.TestCase):
+    def test_weeks_start_on_local_monday(self):
+        moment = datetime(2026, 10, 11, 22, 30, tzinfo=timezone.utc)
+        local_day = moment.astimezone(ZoneInfo(DASH_TIME_ZONE)).date()
+
+        week = int(local_weeks(np.array([to_microseconds(moment)]))[0])
+        self.assertEqual(week_start(week), local_day - timedelta(days=local_day.weekday()))
+        self.assertEqual(week_start(week).weekday(), 0)
+
+
+class CohortCountTests(unittest.TestCase):
+    def test_counts_each_visitor_once_per_week_since_first_seen(self):
+        visitors = np.array([0, 0, 0, 0, 1, 1])
+        first_weeks = np.array([10, 11])
+        weeks = np.array([10, 10, 11, 13, 11, 12])
+
+        self.assertEqual(cohort_counts(visitors, first_weeks, weeks, horizon=3), {10: [1, 1, 0], 11: [1, 1, 0]})
+
+    def test_no_activity(self):
+        self.assertEqual(cohort_counts(np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0, np.int64), 3), {})
+
+
+class RetentionAnalyzerTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.engine = event_engine()
+        self.analyzer = RetentionAnalyzer(self.engine, None, Path(tmp.name) / "retention.json", cohorts=3, weeks=3)
+        self.now = at(date(2026, 10, 14))
+
+    def test_visitors_are_assigned_to_the_week_of_their_first_visit(self):
+        insert_event(self.engine, at(date(2026, 9, 30)), session_id="a")
+        insert_event(self.engine, at(date(2026, 10, 7)), session_id="a")
+        insert_event(self.engine, at(date(2026, 10, 13)), session_id="a")
+        insert_event(self.engine, at(date(2026, 10, 6)), session_id="b")
+        insert_event(self.engine, at(date(2026, 10, 13)), session_id="c")
+        insert_event(self.engine, at(date(2026, 10, 14)), session_id="c")
+        # First seen before the oldest cohort shown: counted in no cohort.
+        insert_event(self.engine, at(date(2026, 9, 1)), session_id="d")
+        insert_event(self.engine, at(date(2026, 10, 13)), session_id="d")
+
+        table = self.analyzer.load(self.now)
+
+        self.assertEqual(table["cohort"].tolist(), [date(2026, 10, 12), date(2026, 10, 5), date(2026, 9, 28)])
+        self.assertEqual(table["size"].tolist(), [1, 1, 1])
+        self.assertEqual(table.loc[2, [0, 1, 2]].tolist(), [1.0, 1.0, 1.0])
+        self.assertEqual(table.loc[1, [0, 1]].tolist(), [1.0, 0.0])
+        self.assertTrue(np.isnan(table.loc[1, 2]))
+        self.assertEqual(table.loc[0, 0], 1.0)
+        self.assertTrue(table.loc[0, [1, 2]].isna().all())
+
+
+if __name__ == "__main__":
+    unittest.main()
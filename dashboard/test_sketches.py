@@ -0,0 +1,62 @@
+import unittest
+from collections import Counter
+
+from sketches import HyperLogLog, SpaceSaving
+
+
+class HyperLogLogTests(unittest.TestCase):
+    def test_count_is_within_the_expected_error(self):
+        sketch = HyperLogLog()
+        sketch.add(f"session-{number}" for number in range(10_000))
+
+        self.assertLess(abs(sketch.count() - 10_000) / 10_000, 3 * sketch.relative_error)
+
+    def test_small_counts_are_close_to_exact(self):
+        sketch = HyperLogLog()
+        sketch.add(["a", "b", "c", "a", "b"])
+
+        self.assertEqual(sketch.count(), 3)
+
+    def test_merge_counts_the_union(self):
+        first, second = HyperLogLog(), HyperLogLog()
+        first.add(f"session-{number}" for number in range(6_000))
+        second.add(f"session-{number}" for number in range(4_000, 10_000))
+        first.merge(second)
+
+        self.assertLess(abs(first.count() - 10_000) / 10_000, 3 * first.relative_error)
+
+
+class SpaceSavingTests(unittest.TestCase):
+    def skewed_stream(self):
+        # Element i is clicked 1000 // i times: a few heavy hitters and a long tail of singletons.
+        return [f"element-{rank}" for rank in range(1, 501) for _ in range(1000 // rank)]
+
+    def assert_bounds_hold(self, sketch, truth):
+        for item, count, error in sketch.top(sketch.capacity):
+            self.assertLessEqual(count - error, truth[item])
+            self.assertGreaterEqual(count, truth[item])
+
+    def test_top_k_of_a_skewed_stream(self):
+        stream = self.skewed_stream()
+        sketch = SpaceSaving(capacity=32)
+        for item in stream:
+            sketch.add(item)
+
+        top = sketch.top(5)
+        self.assertEqual([item for item, _, _ in top], [f"element-{rank}" for rank in range(1, 6)])
+        self.assertEqual(top[0][1:], (1000, 0))
+        self.assert_bounds_hold(sketch, Counter(stream))
+
+    def test_merge_keeps_the_bounds(self):
+        stream = self.skewed_stream()
+        first, second = SpaceSaving(capacity=32), SpaceSaving(capacity=32)
+        for index, item in enumerate(stream):
+            (first if index % 2 else second).add(item)
+        first.merge(second)
+
+        self.assertEqual([item for item, _, _ in first.top(3)], ["element-1", "element-2", "element-3"])
+        self.assert_bounds_hold(first, Counter(stream))
+
+
+if __name__ == "__main__":
+    unittest.main()
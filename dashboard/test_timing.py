@@ -0,0 +1,50 @@
+import logging
+import unittest
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from fixtures import event_engine
+from timing import install, timed_callback
+
+
+class TimedCallbackTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = event_engine()
+        install(self.engine)
+
+    def run_callback(self, callback):
+        with self.assertLogs("dashboard.timing", logging.INFO) as logs:
+            callback()
+        return logs.output[-1]
+
+    def test_counts_the_statements_of_one_callback(self):
+        @timed_callback
+        def callback():
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT COUNT(*) FROM core_event"))
+                conn.execute(text("SELECT 1"))
+
+        line = self.run_callback(callback)
+        self.assertIn("callback=callback", line)
+        self.assertIn("queries=2", line)
+
+    def test_a_failed_statement_does_not_skew_later_timings(self):
+        with self.engine.connect() as conn:
+            with self.assertRaises(OperationalError):
+                conn.execute(text("SELECT * FROM missing_table"))
+            self.assertNotIn("query_started", conn.info)
+
+        @timed_callback
+        def callback():
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        line = self.run_callback(callback)
+        self.assertIn("queries=1", line)
+        query_ms = float(line.split("query_ms=")[1].split()[0])
+        self.assertLess(query_ms, 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
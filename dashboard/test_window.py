@@ -0,0 +1,71 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from cursor import EventCursor
+from fixtures import event_engine, insert_event
+from window import EventWindow
+
+
+class EventCursorTests(unittest.TestCase):
+    def test_missing_ids_become_gaps_and_are_filled_later(self):
+        cursor = EventCursor()
+        cursor.advance([1, 2, 5, 6, 9])
+
+        self.assertEqual(cursor.high_water_id, 9)
+        self.assertEqual(cursor.gaps, [(3, 4), (7, 8)])
+        self.assertTrue(cursor.is_new(4))
+        self.assertFalse(cursor.is_new(5))
+
+        cursor.advance([4, 10])
+        self.assertEqual(cursor.gaps, [(3, 3), (7, 8)])
+        self.assertEqual(cursor.high_water_id, 10)
+
+    def test_gaps_expire_below_the_rescan_margin(self):
+        cursor = EventCursor(rescan_ids=5)
+        cursor.advance([1, 3, 20])
+        self.assertEqual(cursor.gaps, [(16, 19)])
+
+        cursor.advance([], upto=30)
+        self.assertEqual(cursor.gaps, [(26, 30)])
+
+    def test_condition_matches_the_mark_and_every_gap(self):
+        cursor = EventCursor(9, [(3, 4)])
+        condition, params = cursor.condition()
+
+        self.assertEqual(condition, "(id > :cursor_after OR id BETWEEN :cursor_gap0_first AND :cursor_gap0_last)")
+        self.assertEqual(params, {"cursor_after": 9, "cursor_gap0_first": 3, "cursor_gap0_last": 4})
+
+
+class EventWindowTests(unittest.TestCase):
+    def setUp(self):
+        self.now = datetime.now(timezone.utc)
+        self.engine = event_engine()
+        self.window = EventWindow(self.engine, timedelta(hours=24))
+
+    def test_counts_late_committed_rows_once(self):
+        for event_id in (1, 2, 5):
+            insert_event(self.engine, self.now - timedelta(minutes=30), session_id="a", id=event_id)
+        self.assertEqual(self.window.refresh(), 3)
+
+        insert_event(self.engine, self.now - timedelta(minutes=20), "cta_click", element="hero-cta", session_id="b", id=3)
+        self.assertEqual(self.window.refresh(), 1)
+        self.assertEqual(self.window.refresh(), 0)
+
+        summary = self.window.summary("24h")
+        self.assertEqual(summary.total_events, 4)
+        self.assertEqual(summary.unique_sessions, 2)
+        self.assertEqual(summary.top_elements["element"].tolist(), ["hero-cta"])
+        self.assertEqual(summary.last_event_id, 5)
+
+    def test_ignores_rows_older_than_the_span(self):
+        insert_event(self.engine, self.now - timedelta(days=3))
+        insert_event(self.engine, self.now - timedelta(minutes=5))
+        self.window.refresh()
+
+        self.assertEqual(self.window.summary("24h").total_events, 1)
+        self.assertTrue(self.window.covers("24h"))
+        self.assertFalse(self.window.covers("7d"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import functools
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from dash.exceptions import PreventUpdate
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("dashboard.timing")
+
+_current = threading.local()
+
+
+class QueryTimings:
+    """Statements run by the current thread while a callback is being timed."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.slowest = 0.0
+        self.slowest_statement = ""
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        if seconds > self.slowest:
+            self.slowest = seconds
+            self.slowest_statement = " ".join(statement.split())[:120]
+
+
+def install(engine: Engine) -> None:
+    # The start time lives on the execution context, so a statement that raises (and never
+    # reaches after_cursor_execute) leaves nothing behind on the pooled connection.
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_timer(conn, cursor, statement, parameters, context, executemany):
+        context._query_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def stop_timer(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._query_started
+        timings = getattr(_current, "timings", None)
+        if timings is not None:
+            timings.record(statement, elapsed)
+
+
+def timed_callback(function: Callable) -> Callable:
+    """Log wall time and SQL time of each call of a Dash callback."""
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        timings = _current.timings = QueryTimings()
+        started = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        except PreventUpdate:
+            timings = None
+            raise
+        finally:
+            _current.timings = None
+            if timings is not None:
+                logger.info(
+                    "callback=%s total_ms=%.1f queries=%d query_ms=%.1f slowest_ms=%.1f slowest=%r",
+                    function.__name__,
+                    (time.perf_counter() - started) * 1000,
+                    timings.count,
+                    timings.seconds * 1000,
+                    timings.slowest * 1000,
+                    timings.slowest_statement,
+                )
+
+    return wrapper
@@ -0,0 +1,131 @@
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from cursor import EventCursor
+from queries import TIME_WINDOWS, TOP_N, EventSummary, bucket_expression, since_param, summary_from_counts, window_start
+from sketches import HyperLogLog, SpaceSaving
+
+
+def floor_hour(value: datetime) -> datetime:
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def as_utc_hour(value) -> datetime:
+    return floor_hour(pd.Timestamp(value).to_pydatetime()).replace(tzinfo=timezone.utc)
+
+
+class HourSketch:
+    """Exact per-type counts plus mergeable sketches for one hour of events."""
+
+    def __init__(self):
+        self.by_type: Counter = Counter()
+        self.pages = HyperLogLog()
+        self.elements = HyperLogLog()
+        self.sessions = HyperLogLog()
+        self.top_elements = SpaceSaving()
+
+    def merge(self, other: "HourSketch") -> None:
+        self.by_type.update(other.by_type)
+        self.pages.merge(other.pages)
+        self.elements.merge(other.elements)
+        self.sessions.merge(other.sessions)
+        self.top_elements.merge(other.top_elements)
+
+
+class EventWindow:
+    """Hourly event sketches for the last ``span`` kept in process memory.
+
+    Distinct pages, elements and sessions are HyperLogLog estimates and the top elements come
+    from Space-Saving, so combining any number of hours takes constant memory.
+
+    Each refresh folds in only rows the ``EventCursor`` has not returned yet (grouped by hour
+    in the database) and drops hours that fell out of the span, so its cost follows new
+    traffic. Ids rather than timestamps mark progress because batched and spooled events can
+    carry timestamps older than rows that were already read; the cursor's gaps catch ids that
+    commit after higher ones.
+    """
+
+    def __init__(self, engine: Engine, span: timedelta):
+        self.engine = engine
+        self.span = span
+        self.cursor = EventCursor()
+        self.hours: dict[datetime, HourSketch] = {}
+        self._lock = threading.Lock()
+
+    def covers(self, window: str) -> bool:
+        return TIME_WINDOWS[window][1] <= self.span
+
+    def refresh(self, now: datetime | None = None) -> int:
+        now = now or datetime.now(timezone.utc)
+        oldest_hour = floor_hour(now - self.span)
+        dialect = self.engine.dialect.name
+        with self._lock:
+            for hour in [hour for hour in self.hours if hour < oldest_hour]:
+                del self.hours[hour]
+
+            with self.engine.connect() as conn:
+                if dialect == "postgresql":
+                    # One snapshot for both queries, so the ids describe exactly the rows counted.
+                    conn.execution_options(isolation_level="REPEATABLE READ")
+                with conn.begin():
+                    upto = conn.execute(text("SELECT MAX(id) FROM core_event")).scalar() or 0
+                    if upto <= self.cursor.high_water_id and not self.cursor.gaps:
+                        return 0
+                    condition, params = self.cursor.condition()
+                    params.update(upto=upto, recent=upto - self.cursor.rescan_ids)
+                    ids = conn.execute(
+                        text(f"SELECT id FROM core_event WHERE {condition} AND id > :recent AND id <= :upto"), params
+                    ).scalars().all()
+                    rows = conn.execute(
+                        text(
+                            f"""
+                            SELECT {bucket_expression(dialect, "hour")} AS hour, event_type, page, element, session_id, COUNT(*)
+                            FROM core_event
+                            WHERE {condition} AND id <= :upto AND timestamp >= :since
+                            GROUP BY 1, 2, 3, 4, 5
+                            """
+                        ),
+                        {**params, "since": since_param(dialect, oldest_hour), "tz": "UTC"},
+                    ).all()
+
+            grouped: dict[datetime, list] = {}
+            for row in rows:
+                grouped.setdefault(as_utc_hour(row[0]), []).append(row[1:])
+            for hour, hour_rows in grouped.items():
+                sketch = self.hours.setdefault(hour, HourSketch())
+                sketch.pages.add({page for _, page, _, _, _ in hour_rows})
+                sketch.elements.add({element for _, _, element, _, _ in hour_rows if element})
+                sketch.sessions.add({session_id for _, _, _, session_id, _ in hour_rows if session_id})
+                for event_type, _, element, _, count in hour_rows:
+                    sketch.by_type[event_type] += count
+                    if element:
+                        sketch.top_elements.add(element, count)
+            self.cursor.advance(ids, upto)
+            return sum(row[-1] for row in rows)
+
+    def summary(self, window: str, now: datetime | None = None) -> EventSummary:
+        start = floor_hour(window_start(window, now))
+        merged, by_hour = HourSketch(), {}
+        with self._lock:
+            last_event_id = self.cursor.high_water_id
+            for hour, sketch in self.hours.items():
+                if hour >= start:
+                    merged.merge(sketch)
+                    by_hour[hour] = sum(sketch.by_type.values())
+
+        return summary_from_counts(
+            window,
+            merged.by_type,
+            by_hour,
+            unique_pages=merged.pages.count(),
+            unique_elements=merged.elements.count(),
+            unique_sessions=merged.sessions.count(),
+            top_elements=merged.top_elements.top(TOP_N),
+            error_bounds={name: merged.pages.relative_error for name in ("unique_pages", "unique_elements", "unique_sessions")},
+            last_event_id=last_event_id,
+        )
@@ -14,3 +14,4 @@ docker compose -f docker-compose.prod.yml up -d db
 docker compose -f docker-compose.prod.yml run --rm web python manage.py migrate --noinput
 docker compose -f docker-compose.prod.yml run --rm web python manage.py collectstatic --noinput
 docker compose -f docker-compose.prod.yml up -d web dashboard nginx
+docker compose -f docker-compose.prod.yml exec -T web python manage.py export_static_site
@@ -6,7 +6,15 @@ if [ "${RUN_STARTUP_TASKS:-1}" = "1" ]; then
   python manage.py collectstatic --noinput
 fi
 
+if [ "${SERVER_MODE:-wsgi}" = "asgi" ]; then
+  exec gunicorn premiereaesthetics.asgi:application \
+    --worker-class uvicorn_worker.UvicornWorker \
+    --bind 0.0.0.0:8000 \
+    --workers "${WEB_WORKERS:-3}" \
+    --timeout 90
+fi
+
 gunicorn premiereaesthetics.wsgi:application \
   --bind 0.0.0.0:8000 \
-  --workers 3 \
+  --workers "${WEB_WORKERS:-3}" \
   --timeout 90
@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+
+class TestRunner(DiscoverRunner):
+    """Runs the suite against a per-process LocMem cache instead of the shared cache file.
+
+    Tests call ``cache.clear()`` and leave content versions behind, which must neither wipe a
+    developer's ``runserver`` cache nor carry over into the next run. ``SQLiteCache`` itself
+    is tested against temporary files.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        default = {**settings.CACHES["default"], "BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "tests", "OPTIONS": {}}
+        self._cache_settings = override_settings(CACHES={**settings.CACHES, "default": default})
+        self._cache_settings.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._cache_settings.disable()
+        super().teardown_test_environment(**kwargs)
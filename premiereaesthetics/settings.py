@@ -27,6 +27,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "core.middleware.CompressedResponseCacheMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -57,6 +58,8 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "premiereaesthetics.wsgi.application"
 ASGI_APPLICATION = "premiereaesthetics.asgi.application"
+SERVER_MODE = env("SERVER_MODE", default="wsgi")
+ASYNC_API_VIEWS = env.bool("ASYNC_API_VIEWS", default=SERVER_MODE == "asgi")
 
 if env("DATABASE_URL", default=""):
     DATABASES = {"default": env.db("DATABASE_URL")}
@@ -120,6 +123,112 @@ BUSINESS = {
     "maps_embed": env("GOOGLE_MAPS_EMBED", default="https://www.google.com/maps?q=Sat+Albota+DN65B+Nr.+465E+117030+Arges&output=embed"),
 }
 
+CACHES = {
+    "default": {
+        "BACKEND": "core.cache.SQLiteCache",
+        "LOCATION": env("CACHE_LOCATION", default=str(BASE_DIR / "var" / "cache.sqlite3")),
+        "TIMEOUT": 300,
+        "OPTIONS": {
+            "MAX_ENTRIES": env.int("CACHE_MAX_ENTRIES", default=20000),
+            "MAX_BYTES": env.int("CACHE_MAX_BYTES", default=64 * 1024 * 1024),
+        },
+    }
+}
+
+TEST_RUNNER = "premiereaesthetics.runner.TestRunner"
+
+CONTENT_CACHE = {
+    "timeout": env.int("CONTENT_CACHE_TIMEOUT", default=7 * 24 * 3600),
+}
+
+RESPONSE_CACHE = {
+    "enabled": env.bool("RESPONSE_CACHE_ENABLED", default=True),
+    "timeout": env.int("RESPONSE_CACHE_TIMEOUT", default=3600),
+}
+
+STATIC_EXPORT = {
+    "directory": Path(env("STATIC_EXPORT_DIR", default=str(BASE_DIR / "prerendered"))),
+}
+
+EVENT_INGEST = {
+    "batch_max_events": env.int("EVENT_BATCH_MAX_EVENTS", default=50),
+    "max_body_bytes": env.int("EVENT_MAX_BODY_BYTES", default=64 * 1024),
+    "max_additional_data_bytes": env.int("EVENT_MAX_ADDITIONAL_DATA_BYTES", default=2048),
+    "user_agent_cache_size": env.int("EVENT_USER_AGENT_CACHE_SIZE", default=2048),
+}
+
+EVENT_ROLLUP = {
+    "late_seconds": env.int("EVENT_ROLLUP_LATE_SECONDS", default=900),
+}
+
+EVENT_RETENTION = {
+    "raw_days": env.int("EVENT_RETENTION_DAYS", default=0),
+    "delete_batch_size": env.int("EVENT_RETENTION_DELETE_BATCH_SIZE", default=5000),
+}
+
+EVENT_PARTITIONING = {
+    "months_ahead": env.int("EVENT_PARTITION_MONTHS_AHEAD", default=3),
+    "retention_months": env.int("EVENT_PARTITION_RETENTION_MONTHS", default=0),
+    "drop_expired": env.bool("EVENT_PARTITION_DROP_EXPIRED", default=False),
+}
+
+BOT_FILTER = {
+    "enabled": env.bool("BOT_FILTER_ENABLED", default=True),
+    "signatures": env.list(
+        "BOT_SIGNATURES",
+        # "bot" only as the end of a product token (Googlebot/2.1, Slackbot-LinkExpanding,
+        # "SemrushBot;"), so device names such as Cubot phones are not dropped.
+        default=[
+            "bot/",
+            "bot-",
+            "bot;",
+            "crawl",
+            "spider",
+            "slurp",
+            "headless",
+            "lighthouse",
+            "pagespeed",
+            "pingdom",
+            "uptime",
+            "facebookexternalhit",
+            "python-requests",
+            "curl/",
+            "wget/",
+            "phantomjs",
+            "selenium",
+            "puppeteer",
+            "playwright",
+        ],
+    ),
+}
+
+RATE_LIMIT = {
+    "enabled": env.bool("RATE_LIMIT_ENABLED", default=True),
+    "max_keys": env.int("RATE_LIMIT_MAX_KEYS", default=20000),
+    "scopes": {
+        "track": {
+            "rate": env.float("RATE_LIMIT_TRACK_PER_SECOND", default=2.0),
+            "burst": env.int("RATE_LIMIT_TRACK_BURST", default=120),
+        },
+        "contact": {
+            "rate": env.float("RATE_LIMIT_CONTACT_PER_SECOND", default=0.05),
+            "burst": env.int("RATE_LIMIT_CONTACT_BURST", default=5),
+        },
+    },
+}
+
+METRICS = {
+    "flush_seconds": env.int("METRICS_FLUSH_SECONDS", default=30),
+}
+
+EVENT_SPOOL = {
+    "enabled": env.bool("EVENT_SPOOL_ENABLED", default=False),
+    "directory": Path(env("EVENT_SPOOL_DIR", default=str(BASE_DIR / "var/event_spool"))),
+    "rotate_seconds": env.int("EVENT_SPOOL_ROTATE_SECONDS", default=60),
+    "max_segment_bytes": env.int("EVENT_SPOOL_MAX_SEGMENT_BYTES", default=8 * 1024 * 1024),
+    "grace_seconds": env.int("EVENT_SPOOL_GRACE_SECONDS", default=5),
+}
+
 SECURE_SSL_REDIRECT = env.bool("DJANGO_SECURE_SSL", default=False)
 SESSION_COOKIE_SECURE = env.bool("DJANGO_SECURE_SSL", default=False)
 CSRF_COOKIE_SECURE = env.bool("DJANGO_SECURE_SSL", default=False)
@@ -132,4 +241,5 @@ SECURE_HSTS_PRELOAD = env.bool("DJANGO_SECURE_SSL", default=False)
 REST_FRAMEWORK = {
     "DEFAULT_RENDERER_CLASSES": ["rest_framework.renderers.JSONRenderer"],
     "DEFAULT_PARSER_CLASSES": ["rest_framework.parsers.JSONParser"],
+    "NUM_PROXIES": env.int("NUM_PROXIES", default=0),
 }
@@ -1,5 +1,9 @@
 (function () {
-  const endpoint = "/api/track/";
+  const endpoint = "/api/track/batch/";
+  const maxBatchSize = 20;
+  const flushIntervalMs = 5000;
+  const queue = [];
+  let flushTimer = null;
 
   const getSessionId = () => {
     const key = "pa_session_id";
@@ -11,24 +15,40 @@
     return sid;
   };
 
-  const sendEvent = (eventType, element = "", additionalData = {}) => {
-    const payload = {
-      event_type: eventType,
-      element,
-      page: window.location.pathname,
-      session_id: getSessionId(),
-      additional_data: additionalData,
-    };
+  const flush = () => {
+    if (flushTimer) {
+      clearTimeout(flushTimer);
+      flushTimer = null;
+    }
+    if (!queue.length) return;
 
-    const blob = new Blob([JSON.stringify(payload)], { type: "application/json" });
+    const body = JSON.stringify({ events: queue.splice(0, maxBatchSize) });
+    const blob = new Blob([body], { type: "application/json" });
     if (!navigator.sendBeacon || !navigator.sendBeacon(endpoint, blob)) {
       fetch(endpoint, {
         method: "POST",
         headers: { "Content-Type": "application/json" },
-        body: JSON.stringify(payload),
+        body,
         keepalive: true,
       }).catch(() => null);
     }
+    if (queue.length) flush();
+  };
+
+  const sendEvent = (eventType, element = "", additionalData = {}) => {
+    queue.push({
+      event_type: eventType,
+      element,
+      page: window.location.pathname,
+      session_id: getSessionId(),
+      additional_data: additionalData,
+    });
+
+    if (queue.length >= maxBatchSize) {
+      flush();
+    } else if (!flushTimer) {
+      flushTimer = setTimeout(flush, flushIntervalMs);
+    }
   };
 
   if (document.body?.dataset.trackPage === "true") {
@@ -42,6 +62,7 @@
   });
 
   let maxScrollDepth = 0;
+  let reportedScrollDepth = -1;
   window.addEventListener(
     "scroll",
     () => {
@@ -54,7 +75,14 @@
     { passive: true },
   );
 
-  window.addEventListener("beforeunload", () => {
-    sendEvent("scroll_depth", "window", { depth: maxScrollDepth });
+  document.addEventListener("visibilitychange", () => {
+    if (document.visibilityState !== "hidden") return;
+    if (maxScrollDepth !== reportedScrollDepth) {
+      reportedScrollDepth = maxScrollDepth;
+      sendEvent("scroll_depth", "window", { depth: maxScrollDepth });
+    }
+    flush();
   });
+
+  window.addEventListener("pagehide", flush);
 })();